@@ -15,20 +15,46 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Framework for *craft applications."""
 
-from craft_application.application import (
-    Application,
-    AppMetadata,
-)
-from craft_application import models
-from craft_application.services import (
-    AppService,
-    ProjectService,
-    LifecycleService,
-    PackageService,
-    ProviderService,
-    ServiceFactory,
-)
-from craft_application._config import ConfigModel
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING
+
+from craft_application import _import_profile
+
+_import_profile.install_from_environment()
+
+if TYPE_CHECKING:
+    from craft_application.application import (
+        Application,
+        AppMetadata,
+    )
+    from craft_application import models
+    from craft_application.services import (
+        AppService,
+        ProjectService,
+        LifecycleService,
+        PackageService,
+        ProviderService,
+        ServiceFactory,
+    )
+    from craft_application._config import ConfigModel
+
+# The public API is imported on first access so that using a lightweight part
+# of the package (such as ``craft_application.util``) doesn't require
+# importing the whole application framework.
+_LAZY_ATTRIBUTES = {
+    "Application": "craft_application.application",
+    "AppMetadata": "craft_application.application",
+    "AppService": "craft_application.services",
+    "ConfigModel": "craft_application._config",
+    "LifecycleService": "craft_application.services",
+    "PackageService": "craft_application.services",
+    "ProjectService": "craft_application.services",
+    "ProviderService": "craft_application.services",
+    "ServiceFactory": "craft_application.services",
+}
 
 try:
     from ._version import __version__
@@ -53,3 +79,19 @@ __all__ = [
     "ProviderService",
     "ServiceFactory",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}"):
+        # Subpackages such as ``models`` and ``util``.
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -38,3 +38,9 @@ class ConfigModel(pydantic.BaseModel):
     launchpad_instance: str = "production"
 
     idle_mins: pydantic.NonNegativeInt | None = None
+    max_parallel_instances: pydantic.PositiveInt = 1
+    parallel_parts: bool = False
+    step_cache: bool = False
+    step_cache_max_mib: pydantic.PositiveInt = 10240
+    instance_pool_size: pydantic.NonNegativeInt = 0
+    instance_pool_max_age_hours: pydantic.PositiveInt = 24
@@ -0,0 +1,174 @@
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Import-time profiling for craft applications.
+
+Setting ``CRAFT_IMPORT_PROFILE`` to a true value makes craft-application time
+every module imported after it and print a report to stderr when the process
+exits. This module must only depend on the standard library, as it is loaded
+before anything else in the package.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+ENVIRONMENT_VARIABLE = "CRAFT_IMPORT_PROFILE"
+_TRUE_VALUES = frozenset({"1", "t", "true", "y", "yes", "on"})
+
+
+class ImportRecord(NamedTuple):
+    """The time taken to import a single module, in nanoseconds."""
+
+    name: str
+    cumulative: int
+    """The time taken to execute the module, including any imports it made."""
+    self_time: int
+    """The time taken to execute the module, excluding any imports it made."""
+
+
+class _Loader(importlib.abc.Loader):
+    """A loader that times the execution of the module loaded by another loader."""
+
+    def __init__(self, profiler: ImportProfiler, loader: importlib.abc.Loader) -> None:
+        self._profiler = profiler
+        self._loader = loader
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Put the real loader back so the module doesn't keep a reference to us.
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler.measure(module.__name__):
+            self._loader.exec_module(module)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Record the cumulative and self time of each module import.
+
+    The profiler is a meta path finder that defers to the other finders on
+    ``sys.meta_path`` to find modules, then wraps their loaders to time the
+    execution of each module.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[ImportRecord] = []
+        self._local = threading.local()
+
+    @property
+    def records(self) -> Sequence[ImportRecord]:
+        """The import records, in the order the imports completed."""
+        return tuple(self._records)
+
+    def install(self) -> None:
+        """Start profiling imports."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop profiling imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        """Find a module using the other finders and wrap its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _Loader(self, spec.loader)
+            return spec
+        return None
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Record the time taken by the import of a module."""
+        stack = self._stack()
+        stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            cumulative = time.perf_counter_ns() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += cumulative
+            self._records.append(ImportRecord(name, cumulative, cumulative - children))
+
+    def report(self, file: TextIO, *, limit: int | None = None) -> None:
+        """Write the slowest imports to a file, sorted by cumulative time.
+
+        :param file: The file to which to write the report.
+        :param limit: The maximum number of modules to include.
+        """
+        records = sorted(self._records, key=lambda r: r.cumulative, reverse=True)
+        total = sum(record.self_time for record in records)
+        print(
+            f"Imported {len(records)} modules in {total / 1e6:.1f} ms",
+            file=file,
+        )
+        print(f"{'cumulative (ms)':>15} | {'self (ms)':>9} | module", file=file)
+        for record in records[:limit]:
+            print(
+                f"{record.cumulative / 1e6:>15.1f} | {record.self_time / 1e6:>9.1f} | "
+                f"{record.name}",
+                file=file,
+            )
+
+    def _stack(self) -> list[int]:
+        """Get the child import times for each import in progress on this thread."""
+        stack: list[int] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+
+def _report_at_exit(profiler: ImportProfiler) -> None:
+    profiler.uninstall()
+    profiler.report(sys.stderr)
+
+
+def install_from_environment() -> ImportProfiler | None:
+    """Start profiling imports if requested by the environment.
+
+    :returns: The running profiler, or None if profiling is disabled.
+    """
+    if os.environ.get(ENVIRONMENT_VARIABLE, "").lower() not in _TRUE_VALUES:
+        return None
+    profiler = ImportProfiler()
+    profiler.install()
+    atexit.register(_report_at_exit, profiler)
+    return profiler
@@ -32,7 +32,6 @@ from typing import TYPE_CHECKING, Annotated, Any, Literal, cast, final
 
 import annotated_types
 import craft_cli
-import craft_providers
 from platformdirs import user_cache_path
 
 from craft_application import _config, commands, errors, models, util
@@ -43,6 +42,7 @@ if TYPE_CHECKING:
     import argparse
     from collections.abc import Iterable, Sequence
 
+    import craft_platforms
     from craft_parts.infos import ProjectInfo
     from craft_parts.plugins.plugins import PluginType
 
@@ -421,41 +421,62 @@ class Application:
         if self._enable_fetch_service:
             self.services.get("fetch").set_policy(self._fetch_service_policy)
 
-        extra_args: dict[str, Any] = {}
-        for build_info in plan:
-            env = {
-                "CRAFT_PLATFORM": build_info.platform,
-                "CRAFT_VERBOSITY_LEVEL": craft_cli.emit.get_mode().name,
-            }
+        util.run_build_plan(
+            plan,
+            self._run_managed_instance,
+            max_parallel=self.services.get("config").get("max_parallel_instances"),
+            app_name=self.app.name,
+        )
 
-            extra_args["env"] = env
+        if self._enable_fetch_service:
+            self.services.fetch.shutdown(force=True)
 
-            craft_cli.emit.debug(
-                f"Running {self.app.name}:{build_info.platform} in {build_info.build_for} instance..."
-            )
-            instance_path = pathlib.PosixPath("/root/project")
-            active_fetch_service = self.services.get("fetch").is_active(
-                enable_command_line=self._enable_fetch_service
-            )
+    def _run_managed_instance(
+        self, build_info: craft_platforms.BuildInfo, output_prefix: str | None = None
+    ) -> None:
+        """Run the application in a single managed instance.
 
-            with self.services.provider.instance(
-                build_info,
-                work_dir=self._work_dir,
-                clean_existing=self._enable_fetch_service,
-                use_base_instance=not active_fetch_service,
-            ) as instance:
-                if self._enable_fetch_service:
-                    fetch_env = self.services.fetch.create_session(instance)
-                    env.update(fetch_env)
+        :param build_info: The build to run in the instance.
+        :param output_prefix: A prefix for each line of the instance's output, used
+            when other instances are running at the same time.
+        """
+        env = {
+            "CRAFT_PLATFORM": build_info.platform,
+            "CRAFT_VERBOSITY_LEVEL": craft_cli.emit.get_mode().name,
+        }
+        extra_args: dict[str, Any] = {"env": env}
+
+        craft_cli.emit.debug(
+            f"Running {self.app.name}:{build_info.platform} in {build_info.build_for} instance..."
+        )
+        instance_path = pathlib.PosixPath("/root/project")
+        active_fetch_service = self.services.get("fetch").is_active(
+            enable_command_line=self._enable_fetch_service
+        )
 
-                session_env = self.services.get("proxy").configure_instance(instance)
-                env.update(session_env)
+        with self.services.provider.instance(
+            build_info,
+            work_dir=self._work_dir,
+            clean_existing=self._enable_fetch_service,
+            use_base_instance=not active_fetch_service,
+        ) as instance:
+            if self._enable_fetch_service:
+                fetch_env = self.services.fetch.create_session(instance)
+                env.update(fetch_env)
 
-                cmd = [self.app.name, *sys.argv[1:]]
-                craft_cli.emit.debug(
-                    f"Executing {cmd} in instance location {instance_path} with {extra_args}."
-                )
-                try:
+            session_env = self.services.get("proxy").configure_instance(instance)
+            env.update(session_env)
+
+            cmd = [self.app.name, *sys.argv[1:]]
+            craft_cli.emit.debug(
+                f"Executing {cmd} in instance location {instance_path} with {extra_args}."
+            )
+            try:
+                if output_prefix is not None:
+                    util.execute_prefixed(
+                        instance, cmd, prefix=output_prefix, cwd=instance_path, env=env
+                    )
+                else:
                     with craft_cli.emit.pause():
                         # Pyright doesn't fully understand craft_providers's CompletedProcess.
                         instance.execute_run(  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
@@ -464,16 +485,15 @@ class Application:
                             check=True,
                             **extra_args,
                         )
-                except subprocess.CalledProcessError as exc:
-                    raise craft_providers.ProviderError(
-                        f"Failed to execute {self.app.name} in instance."
-                    ) from exc
-                finally:
-                    if self._enable_fetch_service:
-                        self.services.fetch.teardown_session()
+            except subprocess.CalledProcessError as exc:
+                import craft_providers  # Slow to import.  # noqa: PLC0415
 
-        if self._enable_fetch_service:
-            self.services.fetch.shutdown(force=True)
+                raise craft_providers.ProviderError(
+                    f"Failed to execute {self.app.name} in instance."
+                ) from exc
+            finally:
+                if self._enable_fetch_service:
+                    self.services.fetch.teardown_session()
 
     def configure(self, global_args: dict[str, Any]) -> None:
         """Configure the application using any global arguments."""
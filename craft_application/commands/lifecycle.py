@@ -19,18 +19,22 @@ import argparse
 import os
 import pathlib
 import subprocess
+import sys
 import textwrap
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from craft_cli import CommandGroup, CraftError, emit
-from craft_parts.features import Features
 from typing_extensions import override
 
 from craft_application import errors, models, util
 from craft_application.commands import base
 from craft_application.util.logging import handle_runtime_error
 
+if TYPE_CHECKING:
+    import craft_platforms
+
 _PACKED_FILE_LIST_PATH = ".craft/packed-files"
+_PRIME_MANIFEST_DIR = ".craft/prime-manifests"
 
 
 def get_lifecycle_command_group() -> CommandGroup:
@@ -44,7 +48,10 @@ def get_lifecycle_command_group() -> CommandGroup:
         PrimeCommand,
         PackCommand,
     ]
-    if not Features().enable_overlay:
+    # craft-parts is slow to import, and features can only have been enabled if
+    # it was already imported.
+    features = sys.modules.get("craft_parts.features")
+    if features is None or not features.Features().enable_overlay:
         commands.remove(OverlayCommand)
 
     return CommandGroup(
@@ -93,8 +100,14 @@ class _BaseLifecycleCommand(base.ExtensibleCommand):
     def _run_manager_for_build_plan(self, fetch_service_policy: str | None) -> None:
         """Run this command in managed mode, iterating over the generated build plan."""
         provider = self._services.get("provider")
-        for build in self._services.get("build_plan").plan():
-            provider.run_managed(build, bool(fetch_service_policy))
+        util.run_build_plan(
+            self._services.get("build_plan").plan(),
+            lambda build, **kwargs: provider.run_managed(
+                build, bool(fetch_service_policy), **kwargs
+            ),
+            max_parallel=self._services.get("config").get("max_parallel_instances"),
+            app_name=self._app.name,
+        )
 
     def _use_provider(self, parsed_args: argparse.Namespace) -> bool:
         """Determine whether to build in a managed provider."""
@@ -442,7 +455,10 @@ class PackCommand(LifecycleCommand):
             _launch_shell()
             return
 
-        if self._is_already_packed():
+        pack_inputs = (
+            None if self._app.always_repack else self._get_pack_inputs(parsed_args)
+        )
+        if self._is_already_packed(pack_inputs):
             emit.progress("Skipping pack (already ran)")
             artifact, resources = self._load_packed_file_list()
             self._services.package.write_state(artifact=artifact, resources=resources)
@@ -482,14 +498,42 @@ class PackCommand(LifecycleCommand):
             emit.progress(f"Packed: {package_names}", permanent=True)
             artifact, resources = packages[0], self._services.package.resource_map
 
-        self._save_packed_file_list(artifact=artifact, resources=resources)
+        self._save_packed_file_list(
+            artifact=artifact, resources=resources, inputs=pack_inputs
+        )
         self._services.package.write_state(artifact=artifact, resources=resources)
 
         if shell_after:
             _launch_shell()
 
-    def _is_already_packed(self) -> bool:
-        """Verify whether the artifacts are already packed and up-to-date."""
+    def _get_pack_inputs(self, parsed_args: argparse.Namespace) -> dict[str, str]:
+        """Get the digests of the inputs that determine the packed artifacts.
+
+        The inputs are the contents of the prime directory of each partition, the
+        output directory and the platforms being packed. Applications whose
+        artifacts depend on other inputs should extend this.
+        """
+        project_info = self.services.get("lifecycle").project_info
+        manifest_dir = project_info.work_dir / _PRIME_MANIFEST_DIR
+        inputs: dict[str, str] = {}
+        for partition, prime_dir in project_info.dirs.prime_dirs.items():
+            manifest = util.TreeManifest(
+                prime_dir, manifest_dir / f"{partition or 'default'}.json"
+            )
+            key = "prime" if partition is None else f"prime:{partition}"
+            inputs[key] = manifest.update()
+        platforms = [info.platform for info in self.services.get("build_plan").plan()]
+        inputs["output"] = str(
+            pathlib.Path(getattr(parsed_args, "output", ".")).resolve()
+        )
+        inputs["platforms"] = ",".join(platforms)
+        return inputs
+
+    def _is_already_packed(self, pack_inputs: dict[str, str] | None = None) -> bool:
+        """Verify whether the artifacts are already packed and up-to-date.
+
+        :param pack_inputs: The digests of the current pack inputs, if known.
+        """
         # Gate the skip-repack feature.
         if self._app.always_repack:
             return False
@@ -497,20 +541,33 @@ class PackCommand(LifecycleCommand):
         # 1. A file containing the list of packed artifacts is created after
         #    packing. Before packing, check if the list file exists. If not, we
         #    never packed before and packing is necessary.
-        # 2. Check the most recent prime state timestamp. These are generated
-        #    when parts are primed. If this information can't be retrieved, we
-        #    repack.
-        # 3. If any part was primed after the artifacts were generated, we need
-        #    to pack again. Note that if there's any change in parts, the part
-        #    will be reprimed before the pack step and artifacts will be repacked.
-        # 4. If any previously packed file is missing, we repack everything.
-        # 5. Otherwise, the existing files are up-to-date and no repacking is
+        # 2. If any previously packed file is missing, we repack everything.
+        # 3. If the digests of the inputs were recorded when packing, we repack
+        #    only if they changed. Repriming a part without changing the prime
+        #    directory doesn't require repacking.
+        # 4. Otherwise, check the most recent prime state timestamp. These are
+        #    generated when parts are primed. If this information can't be
+        #    retrieved, we repack.
+        # 5. If any part was primed after the artifacts were generated, we need
+        #    to pack again.
+        # 6. Otherwise, the existing files are up-to-date and no repacking is
         #    required.
 
         pack_time = self._get_packed_file_list_timestamp()
         if pack_time is None:
             return False
 
+        artifact, resources = self._load_packed_file_list()
+        if self._is_missing_packed_files(artifact, resources):
+            return False
+
+        packed_inputs = self._load_packed_inputs()
+        if pack_inputs is not None and packed_inputs is not None:
+            unchanged = packed_inputs == pack_inputs
+            if not unchanged:
+                emit.debug("Pack inputs changed since the last pack.")
+            return unchanged
+
         prime_time = self.services.get("lifecycle").prime_state_timestamp
         if prime_time is None:
             # This should never happen under normal circumstances, but manual
@@ -518,11 +575,7 @@ class PackCommand(LifecycleCommand):
             emit.debug("Could not find prime state timestamps.")
             return False
 
-        if prime_time >= pack_time:
-            return False
-
-        artifact, resources = self._load_packed_file_list()
-        return not self._is_missing_packed_files(artifact, resources)
+        return prime_time < pack_time
 
     def _is_missing_packed_files(
         self, artifact: pathlib.Path | None, resources: dict[str, pathlib.Path] | None
@@ -551,14 +604,26 @@ class PackCommand(LifecycleCommand):
         data = models.PackState.from_yaml_file(file_list_path)
         return (data.artifact, data.resources)
 
+    def _load_packed_inputs(self) -> dict[str, str] | None:
+        """Load the digests of the inputs of the last pack, if recorded."""
+        work_dir = self.services.get("lifecycle").project_info.work_dir
+        file_list_path = work_dir / _PACKED_FILE_LIST_PATH
+        if not file_list_path.is_file():
+            return None
+
+        return models.PackState.from_yaml_file(file_list_path).inputs
+
     def _save_packed_file_list(
-        self, artifact: pathlib.Path | None, resources: dict[str, pathlib.Path] | None
+        self,
+        artifact: pathlib.Path | None,
+        resources: dict[str, pathlib.Path] | None,
+        inputs: dict[str, str] | None = None,
     ) -> None:
         """Save the list of the given artifact and resources."""
         work_dir = self.services.get("lifecycle").project_info.work_dir
         file_list_path = work_dir / _PACKED_FILE_LIST_PATH
         file_list_path.parent.mkdir(parents=True, exist_ok=True)
-        data = models.PackState(artifact=artifact, resources=resources)
+        data = models.PackState(artifact=artifact, resources=resources, inputs=inputs)
         data.to_yaml_file(file_list_path)
 
     def _get_packed_file_list_timestamp(self) -> int | None:
@@ -675,6 +740,7 @@ class TestCommand(PackCommand):
         build_planner = self._services.get("build_plan")
         if parsed_args.platform:
             os.environ["CRAFT_PLATFORM"] = parsed_args.platform
+            self._services.get("config").refresh()
             build_planner.set_platforms(parsed_args.platform)
 
         testing_service = self._services.get("testing")
@@ -695,13 +761,22 @@ class TestCommand(PackCommand):
         shell, shell_after = parsed_args.shell, parsed_args.shell_after
         parsed_args.shell, parsed_args.shell_after = (False, False)
 
-        # This loop allows us to (pack, test) for each platform.
-        for build_info in build_planner.plan():
+        def _pack(build_info: craft_platforms.BuildInfo, **kwargs: str) -> None:
             emit.progress(f"Packing platform '{build_info.platform}'")
-            parsed_args.platform = build_info.platform
             provider.run_managed(
-                build_info, enable_fetch_service=bool(fetch_service_policy)
+                build_info, enable_fetch_service=bool(fetch_service_policy), **kwargs
             )
+
+        # Pack every platform, in parallel if enabled, then test each of them.
+        plan = build_planner.plan()
+        util.run_build_plan(
+            plan,
+            _pack,
+            max_parallel=self._services.get("config").get("max_parallel_instances"),
+            app_name=self._app.name,
+        )
+        for build_info in plan:
+            parsed_args.platform = build_info.platform
             pack_state = package.read_state(build_info.platform)
             if pack_state.artifact is None:
                 raise CraftError(
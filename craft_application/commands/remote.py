@@ -13,20 +13,24 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Build a project remotely on Launchpad."""
 
-import argparse
+from __future__ import annotations
+
 import os
 import pathlib
 import time
-from collections.abc import Collection
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from craft_cli import emit
 from overrides import override  # pyright: ignore[reportUnknownVariableType]
 
 from craft_application import errors
 from craft_application.commands import ExtensibleCommand
-from craft_application.launchpad.models import Build, BuildState
-from craft_application.remote.utils import get_build_id
+
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Collection
+
+    from craft_application.launchpad.models import Build
 
 OVERVIEW = """
 Command remote-build sends the current project to be built
@@ -151,7 +155,7 @@ class RemoteBuild(ExtensibleCommand):
             emit.debug(f"Setting timeout to {parsed_args.launchpad_timeout} seconds")
             builder.set_timeout(parsed_args.launchpad_timeout)
 
-        build_id = get_build_id(self._app.name, self._project.name, project_dir)
+        build_id = builder.snapshot_project(project_dir).build_id
         if parsed_args.recover:
             emit.progress(f"Recovering build {build_id}")
             builds = builder.resume_builds(build_id)
@@ -188,9 +192,13 @@ class RemoteBuild(ExtensibleCommand):
         :returns: The expected exit code of the application.
         :raises: TimeoutError if a build timeout was reached.
         """
+        from craft_application.launchpad.models import BuildState  # noqa: PLC0415
+
         builder = self._services.remote_build
         emit.progress("Monitoring build")
-        for states in builder.monitor_builds():
+        # Each build's files are downloaded as soon as it stops, while the
+        # others are still building.
+        for states in builder.monitor_builds(download_dir=pathlib.Path.cwd()):
             building: set[str] = set()
             succeeded: set[str] = set()
             uploading: set[str] = set()
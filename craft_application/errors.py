@@ -26,7 +26,6 @@ from typing import TYPE_CHECKING, Literal
 import craft_platforms
 import yaml
 from craft_cli import CraftError
-from craft_providers import bases
 
 from craft_application.util.error_formatting import format_pydantic_errors
 from craft_application.util.string import humanize_list
@@ -37,6 +36,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
     import craft_parts
     import pydantic
+    from craft_providers import bases
     from typing_extensions import Self
 
 
@@ -301,11 +301,11 @@ class IncompatibleBaseError(CraftError):
         *,
         artifact_type: str = "artifact",
     ) -> None:
-        if isinstance(host_base, bases.BaseName):
+        if not isinstance(host_base, craft_platforms.DistroBase):
             host_base = craft_platforms.DistroBase(
                 distribution=host_base.name, series=host_base.version
             )
-        if isinstance(build_base, bases.BaseName):
+        if not isinstance(build_base, craft_platforms.DistroBase):
             build_base = craft_platforms.DistroBase(
                 distribution=build_base.name, series=build_base.version
             )
@@ -372,6 +372,10 @@ class CancelFailedError(RemoteBuildError):
         )
 
 
+class DownloadError(CraftError):
+    """A downloaded file is incomplete or doesn't match its expected digest."""
+
+
 class FetchServiceError(CraftError):
     """Errors related to the fetch-service."""
 
@@ -386,3 +390,7 @@ class ArtifactCreationError(CraftError):
 
 class StateServiceError(CraftError):
     """Errors related to the state service."""
+
+
+class ProvisioningError(CraftError):
+    """Errors raised while provisioning a build instance."""
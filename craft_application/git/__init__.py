@@ -22,7 +22,7 @@ from ._consts import (
     GIT_FALLBACK_BINARY_NAME,
 )
 from ._errors import GitError
-from ._models import GitType, Commit, short_commit_sha
+from ._models import GitType, Commit, PushProgress, short_commit_sha
 
 from ._git_repo import (
     GitRepo,
@@ -31,6 +31,7 @@ from ._git_repo import (
     is_commit,
     is_short_commit,
     parse_describe,
+    parse_push_progress,
 )
 
 __all__ = [
@@ -38,9 +39,11 @@ __all__ = [
     "GitRepo",
     "GitType",
     "Commit",
+    "PushProgress",
     "get_git_repo_type",
     "is_repo",
     "parse_describe",
+    "parse_push_progress",
     "is_commit",
     "is_short_commit",
     "short_commit_sha",
@@ -21,7 +21,6 @@ import os
 import re
 import shutil
 import subprocess
-import time
 from functools import lru_cache
 from shlex import quote
 from typing import TYPE_CHECKING, Final, cast
@@ -52,15 +51,21 @@ except Exception:  # noqa: BLE001 (narrower types are provided by the import)
 
 from ._consts import CRAFTGIT_BINARY_NAME, GIT_FALLBACK_BINARY_NAME, NO_PUSH_URL
 from ._errors import GitError
-from ._models import Commit, GitType, short_commit_sha
+from ._models import Commit, GitType, PushProgress, short_commit_sha
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 COMMIT_REGEX: Final[re.Pattern[str]] = re.compile("[0-9a-f]{40}")
 SHORT_COMMIT_REGEX: Final[re.Pattern[str]] = re.compile("[0-9a-f]{7}")
+PUSH_PROGRESS_REGEX: Final[re.Pattern[str]] = re.compile(
+    r"^(?:remote: )?(?P<phase>[A-Z][A-Za-z ]*):\s+\d+% \((?P<current>\d+)/(?P<total>\d+)\)"
+    r"(?:, (?P<size>[\d.]+ \w+)(?: \| (?P<rate>[\d.]+ \w+)/s)?)?(?P<done>, done\.)?"
+)
+_SIZE_UNITS: Final = {"bytes": 1, "KiB": 2**10, "MiB": 2**20, "GiB": 2**30}
 
 
 def is_commit(ref: str) -> bool:
@@ -142,6 +147,56 @@ def parse_describe(describe_str: str) -> str:
     return f"{version}.post{distance}+git{commit[1:]}"
 
 
+def parse_push_progress(line: str) -> PushProgress | None:
+    """Parse a progress update from the output of ``git push --progress``.
+
+    Progress updates look like ``Writing objects:  40% (2/5), 1.20 MiB | 2.00 MiB/s``
+    or ``Counting objects: 100% (5/5), done.``.
+
+    :param line: a line of git's output
+    :returns: the progress, or None if the line isn't a progress update
+    """
+    match = PUSH_PROGRESS_REGEX.match(line)
+    if not match:
+        return None
+    return PushProgress(
+        phase=match["phase"],
+        current=int(match["current"]),
+        total=int(match["total"]),
+        bytes_sent=_parse_size(match["size"]),
+        rate=_parse_size(match["rate"]),
+        done=bool(match["done"]),
+    )
+
+
+def _parse_size(size: str | None) -> int | None:
+    """Convert a size as formatted by git, such as ``1.20 MiB``, to bytes."""
+    if size is None:
+        return None
+    value, _, unit = size.partition(" ")
+    if unit not in _SIZE_UNITS:
+        return None
+    return int(float(value) * _SIZE_UNITS[unit])
+
+
+def _log_push_output(
+    line: str, progress: Callable[[PushProgress], None] | None
+) -> None:
+    """Log a line of output from git push, or pass it to the progress callback."""
+    if not line:
+        return
+    update = parse_push_progress(line)
+    if update is None:
+        if line.startswith(("error:", "fatal:")):
+            logger.error(line)
+        else:
+            logger.info(line)
+    elif progress:
+        progress(update)
+    elif update.done:
+        logger.info(line)
+
+
 class GitRepo:
     """Git repository class."""
 
@@ -183,10 +238,12 @@ class GitRepo:
                 f"Could not add changes for the git repository in {str(self.path)!r}."
             ) from error
 
-    def commit(self, message: str = "auto commit") -> str:
+    def commit(self, message: str = "auto commit", *, orphan: bool = False) -> str:
         """Commit changes to the repo.
 
         :param message: the commit message
+        :param orphan: if true, create a commit with no parents and move the
+            current branch to it, discarding the branch's history
 
         :returns: object ID of the commit as str
 
@@ -209,6 +266,12 @@ class GitRepo:
         target = [] if self._repo.head_is_unborn else [self._repo.head.target]
 
         try:
+            if orphan and target:
+                commit = self._repo.create_commit(
+                    None, author, author, message, tree, []
+                )
+                self._repo.head.set_target(commit)
+                return str(commit)
             return str(
                 self._repo.create_commit("HEAD", author, author, message, tree, target)
             )
@@ -430,7 +493,7 @@ class GitRepo:
         """
         self.set_remote_push_url(remote_name, NO_PUSH_URL)
 
-    def push_url(  # noqa: PLR0912 (too-many-branches)
+    def push_url(
         self,
         remote_url: str,
         remote_branch: str,
@@ -438,6 +501,9 @@ class GitRepo:
         token: str | None = None,
         *,
         push_tags: bool = False,
+        progress: Callable[[PushProgress], None] | None = None,
+        compression_level: int | None = None,
+        threads: int | None = None,
     ) -> None:
         """Push a reference to a branch on a remote url.
 
@@ -446,6 +512,11 @@ class GitRepo:
         :param ref: name of shorthand ref to push (i.e. a branch, tag, or `HEAD`)
         :param token: token in the url to hide in logs and errors
         :param push_tags: if true, push all tags to URL (similar to `git push --tags`)
+        :param progress: a function to call with each progress update from git
+        :param compression_level: the zlib compression level (-1 to 9) for the
+            objects packed for the push, overriding ``pack.compression``
+        :param threads: the number of threads git uses to compress objects,
+            overriding ``pack.threads``. ``0`` uses one thread per CPU.
 
         :raises GitError: if the ref cannot be resolved or pushed
         """
@@ -465,58 +536,32 @@ class GitRepo:
         # Force push in case this repository already exists. The repository is always
         # going to exist solely for remote builds, so the only potential issue here is a
         # race condition with multiple remote builds on the same machine.
-        cmd: list[str] = [
-            self.get_git_command(),
-            "push",
-            "--force",
-            remote_url,
-            refspec,
-            "--progress",
-        ]
+        cmd: list[str] = [self.get_git_command()]
+        if compression_level is not None:
+            cmd.extend(["-c", f"pack.compression={compression_level}"])
+        if threads is not None:
+            cmd.extend(["-c", f"pack.threads={threads}"])
+        cmd.extend(["push", "--force", remote_url, refspec, "--progress"])
         if push_tags:
             cmd.append("--tags")
 
         git_proc: subprocess.Popen[str] | None = None
         try:
+            # git writes its progress to stderr. Both streams go through one pipe
+            # so that reading blocks until git has more output.
             with subprocess.Popen(
                 cmd,
                 cwd=str(self.path),
-                bufsize=1,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
+                stderr=subprocess.STDOUT,
+                text=True,
             ) as git_proc:
-                # do not block on reading from the pipes
-                # (has no effect on Windows until Python 3.12, so the readline() method is
-                # blocking on Windows but git will still proceed)
                 if git_proc.stdout:
-                    os.set_blocking(git_proc.stdout.fileno(), False)
-                if git_proc.stderr:
-                    os.set_blocking(git_proc.stderr.fileno(), False)
-
-                git_stdout: str
-                git_stderr: str
-
-                while git_proc.poll() is None:
-                    if git_proc.stdout:
-                        while git_stdout := git_proc.stdout.readline():
-                            logger.info(git_stdout.rstrip())
-                    if git_proc.stderr:
-                        while git_stderr := git_proc.stderr.readline():
-                            logger.error(git_stderr.rstrip())
-                    # avoid too much looping, but not too slow to display progress
-                    time.sleep(0.01)
-
+                    # Progress updates end with a carriage return, which universal
+                    # newlines mode treats as the end of a line.
+                    for line in git_proc.stdout:
+                        _log_push_output(line.rstrip(), progress)
         except subprocess.SubprocessError as error:
-            # logging the remaining output
-            if git_proc:
-                if git_proc.stdout:
-                    for git_stdout in git_proc.stdout.readlines():
-                        logger.info(git_stdout.rstrip())
-                if git_proc.stderr:
-                    for git_stderr in git_proc.stderr.readlines():
-                        logger.error(git_stderr.rstrip())  # noqa: TRY400
-
             raise GitError(
                 f"Could not push {ref!r} to {stripped_url!r} with refspec {refspec!r} "
                 f"for the git repository in {str(self.path)!r}: "
@@ -569,6 +614,61 @@ class GitRepo:
         except subprocess.CalledProcessError as error:
             raise GitError(f"cannot fetch remote: {remote!r}") from error
 
+    def fetch_head(self, source: Path) -> str:
+        """Fetch the HEAD commit and the tags of another local repository.
+
+        Only objects missing from this repository are copied. Tags that no longer
+        exist in the other repository are removed.
+
+        :param source: The path to the other repository.
+
+        :returns: object ID of the fetched commit as str
+
+        :raises GitError: if the repository could not be fetched
+        """
+        logger.debug("Fetching HEAD from %r.", str(source))
+        fetch_command = [
+            self.get_git_command(),
+            "fetch",
+            "--prune",
+            "--no-recurse-submodules",
+            str(source.absolute()),
+            "HEAD",
+            "+refs/tags/*:refs/tags/*",
+        ]
+        try:
+            subprocess.run(
+                fetch_command,
+                cwd=self.path,
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+        except FileNotFoundError as error:
+            raise GitError("git command not found in the system") from error
+        except subprocess.CalledProcessError as error:
+            raise GitError(
+                f"Could not fetch from {str(source)!r} for the git repository in "
+                f"{str(self.path)!r}.\nCommand output:\n{error.stderr}"
+            ) from error
+        return str(self._repo.revparse_single("FETCH_HEAD").id)
+
+    def reset_soft(self, commit: str) -> None:
+        """Move the current branch to a commit, keeping the index and working tree.
+
+        :param commit: the object ID of the commit
+
+        :raises GitError: if the branch could not be moved
+        """
+        logger.debug("Resetting to %r.", short_commit_sha(commit))
+        try:
+            self._repo.reset(pygit2.Oid(hex=commit), pygit2.GIT_RESET_SOFT)
+        except (pygit2.GitError, KeyError, ValueError) as error:
+            raise GitError(
+                f"Could not reset the git repository in {str(self.path)!r} to "
+                f"{short_commit_sha(commit)!r}."
+            ) from error
+
     def remote_contains(
         self,
         *,
@@ -44,3 +44,21 @@ class Commit:
     def short_sha(self) -> str:
         """Get short commit sha."""
         return short_commit_sha(self.sha)
+
+
+@dataclass(frozen=True)
+class PushProgress:
+    """Progress of a phase of a git push, as reported by git."""
+
+    phase: str
+    """The name of the phase, such as "Counting objects" or "Writing objects"."""
+    current: int
+    """The number of objects processed so far."""
+    total: int
+    """The total number of objects to process."""
+    bytes_sent: int | None = None
+    """The number of bytes sent so far, if reported."""
+    rate: int | None = None
+    """The transfer rate in bytes per second, if reported."""
+    done: bool = False
+    """Whether the phase is complete."""
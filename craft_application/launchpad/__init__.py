@@ -18,18 +18,38 @@
 This module is self-contained as it could be moved into its own package.
 """
 
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING
+
 from . import errors
 from .errors import LaunchpadError
-from .launchpad import Launchpad
-from .models import (
-    LaunchpadObject,
-    RecipeType,
-    Recipe,
-    SnapRecipe,
-    CharmRecipe,
-    RockRecipe,
-)
-from .util import Architecture
+
+if TYPE_CHECKING:
+    from .launchpad import Launchpad
+    from .models import (
+        LaunchpadObject,
+        RecipeType,
+        Recipe,
+        SnapRecipe,
+        CharmRecipe,
+        RockRecipe,
+    )
+    from .util import Architecture
+
+# Everything that needs launchpadlib is imported on first access.
+_LAZY_ATTRIBUTES = {
+    "Architecture": ".util",
+    "CharmRecipe": ".models",
+    "Launchpad": ".launchpad",
+    "LaunchpadObject": ".models",
+    "Recipe": ".models",
+    "RecipeType": ".models",
+    "RockRecipe": ".models",
+    "SnapRecipe": ".models",
+}
 
 __all__ = [
     "errors",
@@ -43,3 +63,18 @@ __all__ = [
     "Architecture",
     "RockRecipe",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif not name.startswith("_") and importlib.util.find_spec(f".{name}", __name__):
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
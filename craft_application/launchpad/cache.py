@@ -0,0 +1,100 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""On-disk cache for Launchpad responses."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import pathlib
+
+from lazr.restfulclient._browser import (  # type: ignore[import-untyped]
+    MultipleRepresentationCache,
+)
+
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+"""The default maximum size of the response cache, in bytes."""
+# The cache is pruned after writing 1/_PRUNE_FRACTION of its maximum size.
+_PRUNE_FRACTION = 8
+
+
+# launchpadlib only handles caching headers for instances of this private class,
+# so it's subclassed rather than wrapped. The supported versions of
+# lazr.restfulclient are pinned in the ``remote`` extra.
+class BoundedCache(MultipleRepresentationCache):  # type: ignore[misc]
+    """A Launchpad response cache that is limited in size.
+
+    launchpadlib stores each response in this cache along with its ETag, then
+    revalidates it with a conditional request the next time it's needed. If the
+    resource is unchanged, Launchpad replies with an empty ``304 Not Modified``
+    and the cached response is used.
+
+    When the cache grows beyond ``max_size`` bytes, the least recently used
+    responses are removed. Rather than scanning the cache on every write, it's
+    pruned each time an eighth of ``max_size`` has been written, so it may
+    briefly exceed its size. The cache may be shared by several processes.
+
+    :param cache: The directory in which to store responses.
+    :param max_size: The maximum total size of the stored responses, in bytes.
+    """
+
+    def __init__(
+        self, cache: str | os.PathLike[str], max_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        self._directory = os.fspath(cache)
+        super().__init__(self._directory)
+        self.max_size = max_size
+        self._written = 0
+
+    def get(self, key: str | bytes) -> bytes | None:
+        """Get a cached response, marking it as recently used."""
+        value: bytes | None = super().get(key)
+        if value is not None:
+            with contextlib.suppress(OSError):
+                os.utime(self._get_key_path(key))
+        return value
+
+    def set(self, key: str | bytes, value: bytes) -> None:
+        """Store a response, periodically removing old responses."""
+        super().set(key, value)
+        self._written += len(value)
+        if self._written >= self.max_size // _PRUNE_FRACTION:
+            self.prune()
+
+    def prune(self) -> None:
+        """Remove the least recently used responses until the cache fits."""
+        self._written = 0
+        entries: list[tuple[float, int, str]] = []
+        total = 0
+        with os.scandir(self._directory) as scanner:
+            for entry in scanner:
+                if entry.name.startswith(self.TEMPFILE_PREFIX):
+                    continue
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.max_size:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            # Another process may have removed the file already.
+            pathlib.Path(path).unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_size:
+                return
@@ -34,6 +34,7 @@ import platformdirs
 from typing_extensions import Self
 
 from . import models
+from .cache import BoundedCache
 
 if TYPE_CHECKING:
     import pathlib
@@ -41,6 +42,36 @@ if TYPE_CHECKING:
 DEFAULT_CACHE_PATH = platformdirs.user_cache_path("launchpad-client")
 
 
+class _Launchpadlib(launchpadlib.launchpad.Launchpad):  # type: ignore[misc]
+    """A launchpadlib client that keeps its response cache bounded in size.
+
+    launchpadlib passes the path of its cache directory to the constructor, so
+    this replaces the path with a :class:`BoundedCache` in that directory.
+    """
+
+    def __init__(
+        self,
+        credentials: Any,  # noqa: ANN401
+        authorization_engine: Any,  # noqa: ANN401
+        credential_store: Any,  # noqa: ANN401
+        service_root: str = launchpadlib.uris.STAGING_SERVICE_ROOT,
+        cache: Any = None,  # noqa: ANN401
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        if isinstance(cache, str):
+            cache = BoundedCache(cache)
+        super().__init__(
+            credentials,
+            authorization_engine,
+            credential_store,
+            service_root,
+            cache,
+            *args,
+            **kwargs,
+        )
+
+
 class Launchpad:
     """A client for Launchpad."""
 
@@ -69,7 +100,7 @@ class Launchpad:
             cache_dir.expanduser().resolve().mkdir(exist_ok=True, parents=True)
         return cls(
             app_name,
-            launchpadlib.launchpad.Launchpad.login_anonymously(
+            _Launchpadlib.login_anonymously(
                 consumer_name=app_name,
                 service_root=root,
                 launchpadlib_dir=cache_dir,
@@ -97,7 +128,7 @@ class Launchpad:
             credentials_file.parent.mkdir(mode=0o700, exist_ok=True, parents=True)
         return cls(
             app_name,
-            launchpadlib.launchpad.Launchpad.login_with(
+            _Launchpadlib.login_with(
                 application_name=app_name,
                 service_root=root,
                 launchpadlib_dir=cache_dir,
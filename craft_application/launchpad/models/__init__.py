@@ -3,7 +3,14 @@
 from .base import LaunchpadObject, InformationType
 
 from craft_application.launchpad.util import Architecture
-from .build import BuildTypes, BuildState, Build
+from .build import (
+    BuildTypes,
+    BuildState,
+    Build,
+    BuildRequestTypes,
+    BuildRequestState,
+    BuildRequest,
+)
 from .code import GitRepository
 from .distro import DistroSeries
 from .project import ProjectType, Project
@@ -23,6 +30,9 @@ __all__ = [
     "BuildTypes",
     "BuildState",
     "Build",
+    "BuildRequestTypes",
+    "BuildRequestState",
+    "BuildRequest",
     "GitRepository",
     "DistroSeries",
     "ProjectType",
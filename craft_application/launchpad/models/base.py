@@ -30,6 +30,8 @@
 from __future__ import annotations
 
 import enum
+import functools
+import types
 from typing import TYPE_CHECKING
 
 import lazr.restfulclient.errors  # type: ignore[import-untyped]
@@ -65,6 +67,15 @@ class Pocket(enum.Enum):
     BACKPORTS = "Backports"
 
 
+@functools.cache
+def _get_annotations(cls: type) -> Mapping[str, type]:
+    """Get the evaluated annotations of a Launchpad object class.
+
+    Evaluating annotations is slow, so this is only done once for each class.
+    """
+    return types.MappingProxyType(util.get_annotations(cls))
+
+
 class LaunchpadObject:
     """A generic Launchpad object."""
 
@@ -73,6 +84,7 @@ class LaunchpadObject:
     """Mapping of attributes for this object to their paths in Launchpad."""
 
     def __init__(self, lp: Launchpad, lp_obj: Entry) -> None:
+        self.__dict__["_snapshot"] = {}
         self._lp = lp
 
         if not isinstance(lp_obj, Entry):  # pyright: ignore[reportUnnecessaryIsInstance]
@@ -104,32 +116,55 @@ class LaunchpadObject:
         """The resource type of the Launchpad entry."""
         return util.get_resource_type(self._obj)
 
+    @functools.cached_property
+    def _lp_attributes(self) -> frozenset[str]:
+        """The names of the Launchpad entry's scalar attributes."""
+        return frozenset(self._obj.lp_attributes)
+
+    @functools.cached_property
+    def _lp_entries(self) -> frozenset[str]:
+        """The names of the entries to which the Launchpad entry links."""
+        return frozenset(self._obj.lp_entries)
+
+    @functools.cached_property
+    def _lp_collections(self) -> frozenset[str]:
+        """The names of the collections to which the Launchpad entry links."""
+        return frozenset(self._obj.lp_collections)
+
     def __dir__(self) -> list[str]:
         """Get the attributes of this object, including Launchpad attrs and entries."""
         return sorted(
             {
                 *super().__dir__(),
-                *util.get_annotations(self.__class__).keys(),
+                *_get_annotations(self.__class__).keys(),
                 *self._attr_map.keys(),
                 *self.__dict__.keys(),
-                *self._obj.lp_attributes,
+                *self._lp_attributes,
             }
         )
 
-    def __getattr__(self, item: str) -> Any:  # noqa: ANN401
-        annotations: dict[str, type] = util.get_annotations(self.__class__)
+    def _get_lp_value(self, item: str, annotations: Mapping[str, type]) -> Any:  # noqa: ANN401
+        """Get the raw launchpadlib value of an attribute from the entry."""
         if item in self._attr_map:
-            lp_obj = util.getattrs(self._obj, self._attr_map[item])
-        elif item in (*annotations, *self._obj.lp_attributes):
-            lp_obj = getattr(self._obj, item)
-        elif item in self._obj.lp_collections:
+            return util.getattrs(self._obj, self._attr_map[item])
+        if item in annotations or item in self._lp_attributes:
+            return getattr(self._obj, item)
+        if item in self._lp_collections:
             raise NotImplementedError("Cannot yet return collections")
-        elif item in self._obj.lp_entries and item not in annotations:
+        if item in self._lp_entries:
             raise NotImplementedError("Cannot get this item type.")
-        else:
+        raise AttributeError(f"{self.__class__.__name__!r} has no attribute {item!r}")
+
+    def __getattr__(self, item: str) -> Any:  # noqa: ANN401
+        if item.startswith("__") or item in ("_lp", "_obj", "_snapshot"):
             raise AttributeError(
                 f"{self.__class__.__name__!r} has no attribute {item!r}"
             )
+        annotations = _get_annotations(self.__class__)
+        if item in self._snapshot:
+            lp_obj = self._snapshot[item]
+        else:
+            lp_obj = self._snapshot[item] = self._get_lp_value(item, annotations)
 
         if item in annotations:
             cls = annotations[item]
@@ -142,19 +177,27 @@ class LaunchpadObject:
         return lp_obj
 
     def __setattr__(self, key: str, value: Any) -> None:  # noqa: ANN401
-        if key in ("_lp", "_obj"):
+        if key == "_lp":
             self.__dict__[key] = value
             return
-        annotations = util.get_annotations(self.__class__)
+        if key == "_obj":
+            self.__dict__[key] = value
+            for name in ("_lp_attributes", "_lp_entries", "_lp_collections"):
+                self.__dict__.pop(name, None)
+            self._snapshot.clear()
+            return
+        # Setting one attribute can change others that share a path.
+        self._snapshot.clear()
+        annotations = _get_annotations(self.__class__)
         if key in annotations:
             attr_path = self._attr_map.get(key, key)
             util.set_innermost_attr(self._obj, attr_path, value)
         elif key in self._attr_map:
             util.set_innermost_attr(self._obj, self._attr_map[key], value)
-        elif key in (
-            *self._obj.lp_attributes,
-            *self._obj.lp_entries,
-            *self._obj.lp_collections,
+        elif (
+            key in self._lp_attributes
+            or key in self._lp_entries
+            or key in self._lp_collections
         ):
             setattr(self._obj, key, value)
         else:
@@ -177,10 +220,33 @@ class LaunchpadObject:
         """
         if item is None:
             return self._obj
-        if item in self._obj.lp_entries:
+        if item in self._lp_entries:
             return getattr(self._obj, item)
         raise ValueError(f"Entry type {self.resource_type!r} has no entry {item!r}")
 
     def lp_refresh(self) -> None:
         """Refresh the underlying Launchpad object."""
         self._obj.lp_refresh()
+        self._snapshot.clear()
+
+    def prefetch(self, *items: str) -> None:
+        """Fetch this object's attributes from Launchpad in a single request.
+
+        The values are kept in a local snapshot, so reading these attributes again
+        doesn't go back to Launchpad until :meth:`lp_refresh` is called.
+
+        :param items: The names of the attributes to fetch. By default, this is
+            every annotated, mapped or Launchpad attribute that is stored directly on
+            this object's entry.
+        """
+        self.lp_refresh()
+        annotations = _get_annotations(self.__class__)
+        if not items:
+            fields = self._lp_attributes | self._lp_entries
+            items = tuple(
+                name
+                for name in {*annotations, *self._attr_map, *self._lp_attributes}
+                if not name.startswith("_") and self._attr_map.get(name, name) in fields
+            )
+        for item in items:
+            self._snapshot[item] = self._get_lp_value(item, annotations)
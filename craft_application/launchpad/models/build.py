@@ -28,6 +28,8 @@
 # pyright: reportOptionalSubscript=false
 # pyright: reportIndexIssue=false
 import enum
+import time
+from datetime import datetime
 
 import lazr.restfulclient.errors  # type: ignore[import-untyped]
 from typing_extensions import Self
@@ -49,6 +51,22 @@ class BuildTypes(enum.Enum):
     ROCK_BUILD = "rock_recipe_build"
 
 
+class BuildRequestTypes(enum.Enum):
+    """Types of build request in Launchpad."""
+
+    SNAP_BUILD_REQUEST = "snap_build_request"
+    CHARM_BUILD_REQUEST = "charm_recipe_build_request"
+    ROCK_BUILD_REQUEST = "rock_recipe_build_request"
+
+
+class BuildRequestState(enum.Enum):
+    """States of a build request."""
+
+    PENDING = "Pending"
+    FAILED = "Failed"
+    COMPLETED = "Completed"
+
+
 class BuildState(enum.Enum):
     """States of a build."""
 
@@ -124,6 +142,15 @@ class Build(LaunchpadObject):
         """Get the current state of this build."""
         return BuildState(self._obj.buildstate)
 
+    def get_estimated_finish(self) -> datetime | None:
+        """Get the time at which Launchpad estimates this build will finish.
+
+        :returns: The estimated finish time, or None if Launchpad has no estimate.
+        """
+        if not self._obj.estimate:
+            return None
+        return self._obj.date
+
     def cancel(self) -> None:
         """Cancel this build."""
         try:
@@ -144,3 +171,72 @@ class Build(LaunchpadObject):
     def get_artifact_urls(self) -> list[str]:
         """Get the URLs of build artifacts."""
         return list(self._obj.getFileUrls())
+
+
+class BuildRequest(LaunchpadObject):
+    """A request for the builds of a recipe.
+
+    Launchpad creates the builds for a recipe asynchronously. A build request is
+    a handle on that work: it can be polled with :meth:`poll` or waited on with
+    :meth:`wait`, so callers may do other work, or request builds for other
+    recipes, while Launchpad processes the request.
+    """
+
+    _resource_types = BuildRequestTypes
+
+    self_link: str
+    web_link: str
+
+    @classmethod
+    def new(cls) -> Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Do not create a build request without a recipe."""
+        raise NotImplementedError("Use a recipe's `request_builds` method instead.")
+
+    @classmethod
+    def get(cls) -> Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Do not try to get build requests without a recipe."""
+        raise NotImplementedError("Use a recipe's `request_builds` method instead.")
+
+    def get_state(self) -> BuildRequestState:
+        """Get the state of this build request, as of the last refresh."""
+        return BuildRequestState(self._obj.status)
+
+    def poll(self) -> bool:
+        """Refresh this build request.
+
+        :returns: Whether Launchpad has finished processing the request.
+        """
+        self.lp_refresh()
+        return self.get_state() != BuildRequestState.PENDING
+
+    def get_builds(self) -> list[Build]:
+        """Get the builds created by this request.
+
+        :raises: RuntimeError if Launchpad hasn't finished processing the request.
+        :raises: BuildError if Launchpad failed to create the builds.
+        """
+        state = self.get_state()
+        if state == BuildRequestState.PENDING:
+            raise RuntimeError("Build request has not finished.")
+        if state != BuildRequestState.COMPLETED:
+            raise errors.BuildError("Build request failed")
+        return [Build(self._lp, obj) for obj in self._obj.builds]
+
+    def wait(self, deadline: int | None = None) -> list[Build]:
+        """Wait for Launchpad to finish this request and get its builds.
+
+        :param deadline: The time (on Python's `monotonic_ns` clock) after which we
+            time out.
+        :returns: The builds created by this request.
+        :raises: TimeoutError if the request is still pending at the deadline.
+        :raises: BuildError if Launchpad failed to create the builds.
+        """
+        sleep_time = 0.5
+        while self.get_state() == BuildRequestState.PENDING:
+            # Check to see if we've run out of time.
+            if deadline is not None and time.monotonic_ns() >= deadline:
+                raise TimeoutError
+            time.sleep(sleep_time)
+            sleep_time *= 1.1
+            self.lp_refresh()
+        return self.get_builds()
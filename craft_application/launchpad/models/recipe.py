@@ -29,14 +29,13 @@
 from __future__ import annotations
 
 import enum
-import time
 from abc import abstractmethod
 from typing import TYPE_CHECKING, ClassVar, Literal
 
 import lazr.restfulclient.errors  # type: ignore[import-untyped]
 from typing_extensions import Any, Self, TypedDict, override
 
-from craft_application.launchpad import errors, models, util
+from craft_application.launchpad import models, util
 from craft_application.util import retry
 
 from . import build
@@ -127,6 +126,26 @@ class BaseRecipe(LaunchpadObject):
             for b in self._obj.builds  # pyright: ignore[reportGeneralTypeIssues]
         ]
 
+    def get_pending_builds(self) -> Collection[build.Build]:
+        """Get the builds for a Recipe that have not yet finished.
+
+        This fetches the state of every unfinished build in a single request.
+        """
+        return [
+            build.Build(self._lp, b)
+            for b in self._obj.pending_builds  # pyright: ignore[reportGeneralTypeIssues]
+        ]
+
+    def _request_builds(self, kwargs: dict[str, Any]) -> build.BuildRequest:
+        """Request builds for this recipe without waiting for them to be created.
+
+        :param kwargs: A dictionary of keyword arguments to pass to the requestBuilds
+            method of this recipe. Keyword arguments vary by recipe type.
+
+        See: https://api.launchpad.net/devel.html
+        """
+        return build.BuildRequest(self._lp, self._obj.requestBuilds(**kwargs))
+
     def _build(self, deadline: int | None, kwargs: dict[str, Any]) -> list[build.Build]:
         """Get builds for this recipe.
 
@@ -136,20 +155,7 @@ class BaseRecipe(LaunchpadObject):
 
         See: https://api.launchpad.net/devel.html
         """
-        build_request = self._obj.requestBuilds(**kwargs)
-        sleep_time = 0.5
-        while build_request.status == "Pending":
-            # Check to see if we've run out of time.
-            if deadline is not None and time.monotonic_ns() >= deadline:
-                raise TimeoutError
-            time.sleep(sleep_time)
-            sleep_time *= 1.1
-            build_request.lp_refresh()
-
-        if build_request.status != "Completed":
-            raise errors.BuildError("Build request failed")
-
-        return [build.Build(self._lp, obj) for obj in build_request.builds]
+        return self._request_builds(kwargs).wait(deadline)
 
 
 class _StoreRecipe(BaseRecipe):
@@ -328,21 +334,30 @@ class SnapRecipe(_StoreRecipe):
         for recipe in lp_recipes:
             yield cls(lp, recipe)
 
-    def build(
+    def request_builds(
         self,
         archive: str = "/ubuntu/+archive/primary",
         pocket: Pocket = Pocket.UPDATES,
         channels: BuildChannels | None = None,
-        deadline: int | None = None,
-    ) -> Collection[build.Build]:
-        """Create a new set of builds for this recipe."""
+    ) -> build.BuildRequest:
+        """Request a new set of builds for this recipe, without waiting for them."""
         request_build_kwargs: dict[str, Any] = {
             "archive": archive,
             "pocket": pocket.value,
         }
         if channels:
             request_build_kwargs["channels"] = channels
-        return self._build(deadline, request_build_kwargs)
+        return self._request_builds(request_build_kwargs)
+
+    def build(
+        self,
+        archive: str = "/ubuntu/+archive/primary",
+        pocket: Pocket = Pocket.UPDATES,
+        channels: BuildChannels | None = None,
+        deadline: int | None = None,
+    ) -> Collection[build.Build]:
+        """Create a new set of builds for this recipe."""
+        return self.request_builds(archive, pocket, channels).wait(deadline)
 
 
 class _StandardRecipe(_StoreRecipe):
@@ -483,14 +498,20 @@ class _StandardRecipe(_StoreRecipe):
                 continue
             yield cls(lp, recipe)
 
+    def request_builds(
+        self, channels: BuildChannels | None = None
+    ) -> build.BuildRequest:
+        """Request a new set of builds for this recipe, without waiting for them."""
+        kwargs = {"channels": channels} if channels else {}
+        return self._request_builds(kwargs)
+
     def build(
         self,
         channels: BuildChannels | None = None,
         deadline: int | None = None,
     ) -> Collection[build.Build]:
         """Create a new set of builds for this recipe."""
-        kwargs = {"channels": channels} if channels else {}
-        return self._build(deadline, kwargs)
+        return self.request_builds(channels).wait(deadline)
 
 
 class CharmRecipe(_StandardRecipe):
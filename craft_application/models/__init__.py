@@ -15,6 +15,11 @@
 # with this program.  If not, see <http://www.gnu.org/licenses/>.
 """General-purpose models for *craft applications."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from craft_application.models.base import CraftBaseModel
 from craft_application.models.constraints import (
     ProjectName,
@@ -34,11 +39,6 @@ from craft_application.models.platforms import (
     Platform,
     PlatformsDict,
 )
-from craft_application.models.project import (
-    DEVEL_BASE_INFOS,
-    DEVEL_BASE_WARNING,
-    Project,
-)
 from craft_application.models.spread import (
     CraftSpreadYaml,
     SpreadBackend,
@@ -46,6 +46,20 @@ from craft_application.models.spread import (
 )
 from craft_application.models.state import PackState
 
+if TYPE_CHECKING:
+    from craft_application.models.project import (
+        DEVEL_BASE_INFOS,
+        DEVEL_BASE_WARNING,
+        Project,
+    )
+
+# The project model depends on craft-parts and craft-providers, which are slow to
+# import, so it's imported on first access.
+_LAZY_ATTRIBUTES = {
+    "DEVEL_BASE_INFOS": "project",
+    "DEVEL_BASE_WARNING": "project",
+    "Project": "project",
+}
 
 __all__ = [
     "BaseMetadata",
@@ -69,3 +83,16 @@ __all__ = [
     "VersionStr",
     "get_validator_by_regex",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -17,16 +17,37 @@
 
 import hashlib
 import pathlib
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple
 
 import craft_platforms
 from pydantic import Field
 from typing_extensions import Self, override
 
-from craft_application import models
 from craft_application.models import CraftBaseModel
 
+if TYPE_CHECKING:
+    from craft_application import models
+
+_BLOCK_SIZE = 4 * 1024 * 1024
+
+
+class _FileKey(NamedTuple):
+    """The stat information used to decide whether recorded digests are current."""
+
+    path: pathlib.Path
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def from_path(cls, path: pathlib.Path) -> Self:
+        stat = path.stat()
+        return cls(path.resolve(), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
 
 class Hashes(CraftBaseModel):
     """Digests identifying an artifact/asset."""
@@ -34,17 +55,80 @@ class Hashes(CraftBaseModel):
     sha1: str
     sha256: str
 
+    _recorded: ClassVar[dict[_FileKey, "Hashes"]] = {}
+    _recorded_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @classmethod
     def from_path(cls, path: pathlib.Path) -> Self:
-        """Compute digests for a given path."""
-        read_bytes = path.read_bytes()
-
-        return cls(
-            sha1=hashlib.sha1(  # noqa: S324 (insecure hash function)
-                read_bytes
-            ).hexdigest(),
-            sha256=hashlib.sha256(read_bytes).hexdigest(),
-        )
+        """Compute digests for a given path.
+
+        The file is read once, in blocks, so memory use doesn't grow with its size.
+        If digests were recorded for the file and it hasn't changed since, they
+        are returned without reading it.
+        """
+        key = _FileKey.from_path(path)
+        with cls._recorded_lock:
+            recorded = cls._recorded.get(key)
+        if isinstance(recorded, cls):
+            return recorded
+
+        hasher = Hasher()
+        buffer = bytearray(_BLOCK_SIZE)
+        view = memoryview(buffer)
+        with path.open("rb") as file:
+            while read_size := file.readinto(buffer):
+                hasher.update(view[:read_size])
+        return cls(**hasher.hexdigests())
+
+    @classmethod
+    def from_paths(
+        cls, paths: Iterable[pathlib.Path], *, max_workers: int | None = None
+    ) -> Sequence[Self]:
+        """Compute digests for several paths in parallel.
+
+        :param paths: The files to hash.
+        :param max_workers: The maximum number of files to hash at once.
+        :returns: The digests of each file, in the same order as ``paths``.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(cls.from_path, paths))
+
+    def record(self, path: pathlib.Path) -> None:
+        """Record these digests as those of a file.
+
+        Later calls to :meth:`from_path` return these digests instead of reading
+        the file, as long as it's unchanged. This lets code that computed the
+        digests while writing an artifact avoid reading it again.
+
+        :param path: The file with these digests.
+        """
+        key = _FileKey.from_path(path)
+        with self._recorded_lock:
+            self._recorded[key] = self
+
+
+class Hasher:
+    """Compute every digest in :class:`Hashes` in a single pass over the data.
+
+    This can be fed the data of an artifact as it's written, so the artifact
+    doesn't need to be read again to create its manifest.
+    """
+
+    def __init__(self) -> None:
+        self._hashes = {name: hashlib.new(name) for name in Hashes.model_fields}
+
+    def update(self, data: bytes | bytearray | memoryview) -> None:
+        """Add data to every digest."""
+        for hash_obj in self._hashes.values():
+            hash_obj.update(data)
+
+    def hexdigests(self) -> dict[str, str]:
+        """Get the hex digests of the data so far, by algorithm."""
+        return {name: hash_obj.hexdigest() for name, hash_obj in self._hashes.items()}
+
+    def get_hashes(self) -> Hashes:
+        """Get the digests of the data so far."""
+        return Hashes(**self.hexdigests())
 
 
 class ComponentID(CraftBaseModel):
@@ -84,7 +168,7 @@ class ProjectManifest(BaseManifestModel):
     @classmethod
     def from_packed_artifact(
         cls,
-        project: models.Project,
+        project: "models.Project",
         build_info: craft_platforms.BuildInfo,
         artifact: pathlib.Path,
     ) -> Self:
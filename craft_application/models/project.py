@@ -21,13 +21,10 @@ This defines the structure of the input file (e.g. snapcraft.yaml)
 import dataclasses
 import textwrap
 from collections.abc import Iterable
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-import craft_parts
-import craft_providers.bases
 import pydantic
 from craft_cli import emit
-from craft_providers.errors import BaseConfigurationError
 from typing_extensions import Self
 
 from craft_application.models import base
@@ -43,25 +40,46 @@ from craft_application.models.platforms import (
     PlatformsDict,
 )
 
+if TYPE_CHECKING:
+    import craft_providers.bases
+
+# craft-parts and craft-providers are slow to import, so they're only imported
+# when a project is validated.
+
 
 @dataclasses.dataclass
 class DevelBaseInfo:
     """Devel base information for an OS."""
 
-    current_devel_base: craft_providers.bases.BaseAlias
+    current_devel_base: "craft_providers.bases.BaseAlias"
     """The base that the 'devel' alias currently points to."""
 
-    devel_base: craft_providers.bases.BaseAlias
+    devel_base: "craft_providers.bases.BaseAlias"
     """The devel base."""
 
 
-# A list of DevelBaseInfo objects that define an OS's current devel base and devel base.
-DEVEL_BASE_INFOS = [
-    DevelBaseInfo(
-        current_devel_base=craft_providers.bases.ubuntu.BuilddBaseAlias.RESOLUTE,
-        devel_base=craft_providers.bases.ubuntu.BuilddBaseAlias.DEVEL,
-    ),
-]
+def _get_devel_base_infos() -> list[DevelBaseInfo]:
+    """Get ``DEVEL_BASE_INFOS``, creating it on first use."""
+    if "DEVEL_BASE_INFOS" not in globals():
+        from craft_providers.bases import ubuntu  # noqa: PLC0415
+
+        # A list of DevelBaseInfo objects that define an OS's current devel base
+        # and devel base.
+        globals()["DEVEL_BASE_INFOS"] = [
+            DevelBaseInfo(
+                current_devel_base=ubuntu.BuilddBaseAlias.RESOLUTE,
+                devel_base=ubuntu.BuilddBaseAlias.DEVEL,
+            ),
+        ]
+    devel_base_infos: list[DevelBaseInfo] = globals()["DEVEL_BASE_INFOS"]
+    return devel_base_infos
+
+
+def __getattr__(name: str) -> object:
+    if name == "DEVEL_BASE_INFOS":
+        return _get_devel_base_infos()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 DEVEL_BASE_WARNING = (
     "The development build-base should only be used for testing purposes, "
@@ -106,6 +124,8 @@ def _validate_package_repository(repository: dict[str, Any]) -> dict[str, Any]:
 
 def _validate_part(part: dict[str, Any]) -> dict[str, Any]:
     """Verify each part (craft-parts will re-validate this)."""
+    import craft_parts  # noqa: PLC0415
+
     craft_parts.validate_part(part)
     return part
 
@@ -249,7 +269,7 @@ class Project(base.CraftBaseModel):
         raise RuntimeError("Could not determine effective base")
 
     @classmethod
-    def _providers_base(cls, base: str) -> craft_providers.bases.BaseAlias | None:
+    def _providers_base(cls, base: str) -> "craft_providers.bases.BaseAlias | None":
         """Get a BaseAlias from the Project base.
 
         The default naming convention for a base is ``name@channel``. This method
@@ -262,6 +282,9 @@ class Project(base.CraftBaseModel):
 
         :raises CraftValidationError: If the project's base cannot be determined.
         """
+        import craft_providers.bases  # noqa: PLC0415
+        from craft_providers.errors import BaseConfigurationError  # noqa: PLC0415
+
         try:
             name, channel = base.split("@")
             return craft_providers.bases.get_base_alias(
@@ -320,4 +343,4 @@ class Project(base.CraftBaseModel):
         Defaults to the bases in DEVEL_BASE_INFOS. Subclasses can override this to fine-
         tune which bases are considered 'development' for their application.
         """
-        return DEVEL_BASE_INFOS
+        return _get_devel_base_infos()
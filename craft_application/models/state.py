@@ -25,3 +25,5 @@ class PackState(CraftBaseModel):
 
     artifact: pathlib.Path | None
     resources: dict[str, pathlib.Path] | None
+    inputs: dict[str, str] | None = None
+    """The digests of the inputs from which the artifacts were packed, if known."""
@@ -25,12 +25,19 @@ from .errors import (
 from .git import (
     check_git_repo_for_remote_build,
 )
-from .utils import get_build_id, rmtree, validate_architectures
+from .utils import (
+    ProjectSnapshot,
+    get_build_id,
+    get_project_snapshot,
+    rmtree,
+    validate_architectures,
+)
 from .worktree import WorkTree
 
 __all__ = [
     "check_git_repo_for_remote_build",
     "get_build_id",
+    "get_project_snapshot",
     "get_git_repo_type",
     "is_repo",
     "rmtree",
@@ -38,6 +45,7 @@ __all__ = [
     "GitError",
     "GitRepo",
     "GitType",
+    "ProjectSnapshot",
     "RemoteBuildError",
     "RemoteBuildGitError",
     "RemoteBuildInvalidGitRepoError",
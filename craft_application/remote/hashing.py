@@ -0,0 +1,240 @@
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Parallel, cached content hashing for remote-build project directories."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IGNORED_PATHS = frozenset({".git", ".craft"})
+"""Paths, relative to the project directory, that are never hashed.
+
+These are the git metadata directory and the application's metadata directory.
+"""
+
+LIFECYCLE_PATHS = frozenset({"parts", "stage", "prime"})
+"""The lifecycle work directories that destructive-mode runs leave in a project."""
+
+_CACHE_VERSION = 1
+_BLOCK_SIZE = 1024 * 1024
+_MMAP_THRESHOLD = 64 * 1024 * 1024
+# Files modified this close to the start of a scan may be modified again within
+# the same mtime tick, so their digests are not persisted.
+_RACY_WINDOW_NS = 2 * 10**9
+
+
+class FileKey(NamedTuple):
+    """The stat information used to decide whether a cached digest is current."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+
+class ProjectHasher:
+    """Compute a content hash of a project directory.
+
+    Files are read in parallel on a thread pool, in large blocks or through
+    ``mmap`` for very large files. If ``cache_file`` is given, per-file digests
+    are persisted there keyed on the file's path, size, mtime and inode, so
+    subsequent runs only read files that changed.
+
+    :param directory: The directory to hash.
+    :param cache_file: An optional path to a file for persisting file digests.
+    :param ignored_paths: Paths relative to ``directory`` to skip entirely.
+        Defaults to the paths from :func:`get_ignored_paths`.
+    :param max_workers: The maximum number of threads used to read files.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        cache_file: Path | None = None,
+        ignored_paths: Collection[str] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._directory = directory
+        self._cache_file = cache_file
+        if ignored_paths is None:
+            ignored_paths = get_ignored_paths(directory)
+        self._ignored_paths = frozenset(ignored_paths)
+        self._max_workers = max_workers
+        self._cache: dict[str, tuple[FileKey, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def iter_files(self) -> Iterator[str]:
+        """Iterate over the relative paths of all files to hash, in hashing order.
+
+        Symbolic links to directories are not followed. Symbolic links to files
+        are hashed by their target's contents.
+        """
+        files: list[tuple[str, ...]] = []
+        pending: list[tuple[str, ...]] = [()]
+        while pending:
+            parent = pending.pop()
+            with os.scandir(self._directory.joinpath(*parent)) as entries:
+                for entry in entries:
+                    parts = (*parent, entry.name)
+                    if "/".join(parts) in self._ignored_paths:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(parts)
+                    elif entry.is_file():
+                        files.append(parts)
+        for parts in sorted(files):
+            yield "/".join(parts)
+
+    def compute(self) -> str:
+        """Compute the md5 hash of the directory contents.
+
+        :returns: A string containing the md5 hash.
+        """
+        self._load_cache()
+        scan_start = time.time_ns()
+        new_cache: dict[str, tuple[FileKey, str]] = {}
+
+        def _hash(relative_path: str) -> tuple[str, bool]:
+            key = _get_file_key(self._directory / relative_path)
+            cached = self._cache.get(relative_path)
+            if cached and cached[0] == key:
+                digest, hit = cached[1], True
+            else:
+                digest = hash_file(self._directory / relative_path, size=key.size)
+                hit = False
+            if key.mtime_ns < scan_start - _RACY_WINDOW_NS:
+                new_cache[relative_path] = (key, digest)
+            return digest, hit
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(executor.map(_hash, self.iter_files()))
+
+        hashes = [digest for digest, _ in results]
+        self.hits = sum(hit for _, hit in results)
+        self.misses = len(results) - self.hits
+
+        logger.debug(
+            "Hashed %d files in %s (%d cached, %d read)",
+            len(hashes),
+            self._directory,
+            self.hits,
+            self.misses,
+        )
+        self._cache = new_cache
+        self._save_cache()
+
+        all_hashes = "".join(hashes).encode()
+        return md5(all_hashes).hexdigest()  # noqa: S324 (insecure-hash-function)
+
+    def _load_cache(self) -> None:
+        """Load file digests from the cache file, ignoring unusable caches."""
+        if not self._cache_file:
+            return
+        try:
+            data = json.loads(self._cache_file.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+        with contextlib.suppress(TypeError, ValueError):
+            self._cache = {
+                path: (FileKey(size, mtime_ns, inode), digest)
+                for path, (size, mtime_ns, inode, digest) in data["files"].items()
+            }
+
+    def _save_cache(self) -> None:
+        """Atomically write file digests to the cache file."""
+        if not self._cache_file:
+            return
+        data = {
+            "version": _CACHE_VERSION,
+            "files": {
+                path: [*key, digest] for path, (key, digest) in self._cache.items()
+            },
+        }
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._cache_file.parent, delete=False
+            ) as temp_file:
+                json.dump(data, temp_file)
+            Path(temp_file.name).replace(self._cache_file)
+        except OSError as exc:
+            logger.debug("Could not write hash cache %s: %s", self._cache_file, exc)
+
+
+def get_ignored_paths(directory: Path) -> frozenset[str]:
+    """Get the paths in a project directory that aren't hashed.
+
+    The ``parts``, ``stage`` and ``prime`` directories are only ignored if they
+    are lifecycle work directories, which is when ``parts`` holds the lifecycle
+    state of a part. Otherwise they may be part of the project's sources.
+
+    :param directory: The project directory.
+    :returns: The ignored paths, relative to the project directory.
+    """
+    try:
+        with os.scandir(directory / "parts") as entries:
+            for entry in entries:
+                if entry.is_dir() and Path(entry.path, "state").is_dir():
+                    return DEFAULT_IGNORED_PATHS | LIFECYCLE_PATHS
+    except OSError:
+        pass
+    return DEFAULT_IGNORED_PATHS
+
+
+def _get_file_key(path: Path) -> FileKey:
+    stat = path.stat()
+    return FileKey(stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def hash_file(path: Path, *, size: int | None = None) -> str:
+    """Get the md5 hex digest of a file's contents.
+
+    Large files are memory-mapped. Others are read in large blocks.
+
+    :param path: The file to hash.
+    :param size: The file size, if already known.
+    :returns: The hex digest of the file contents.
+    """
+    if size is None:
+        size = path.stat().st_size
+    md5_hash = md5()  # noqa: S324 (insecure-hash-function)
+    with path.open("rb") as file:
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                md5_hash.update(mapped)
+        else:
+            buffer = bytearray(_BLOCK_SIZE)
+            view = memoryview(buffer)
+            while read_size := file.readinto(buffer):
+                md5_hash.update(view[:read_size])
+    return md5_hash.hexdigest()
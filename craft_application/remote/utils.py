@@ -16,14 +16,15 @@
 
 from __future__ import annotations
 
+import dataclasses
 import shutil
 import stat
-from functools import partial
 from hashlib import md5
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from .errors import UnsupportedArchitectureError
+from .hashing import ProjectHasher
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -46,7 +47,62 @@ def validate_architectures(architectures: list[str]) -> None:
         raise UnsupportedArchitectureError(architectures=unsupported_archs)
 
 
-def get_build_id(app_name: str, project_name: str, project_path: Path) -> str:
+@dataclasses.dataclass(frozen=True)
+class ProjectSnapshot:
+    """The build id of a project directory at the start of a remote build.
+
+    A snapshot is taken once per remote build so that the command and the
+    remote build service don't each hash the project.
+    """
+
+    project_dir: Path
+    """The resolved path to the project directory."""
+    build_id: str
+    """The build id for the project's contents."""
+
+
+def get_project_snapshot(
+    app_name: str,
+    project_name: str,
+    project_path: Path,
+    *,
+    cache_dir: Path | None = None,
+) -> ProjectSnapshot:
+    """Take a snapshot of a project directory, computing its build id.
+
+    The directory is walked and its files hashed in a single pass.
+
+    :param app_name: Name of the application.
+    :param project_name: Name of the project.
+    :param project_path: Path of the project.
+    :param cache_dir: An optional directory in which to persist file digests so
+        that unchanged files are not re-read on subsequent calls.
+
+    :returns: The project snapshot.
+
+    :raises FileNotFoundError: If the path is not a directory or does not exist.
+    """
+    project_dir = project_path.resolve()
+    cache_file = None
+    if cache_dir:
+        path_hash = md5(str(project_dir).encode()).hexdigest()  # noqa: S324 (insecure-hash-function)
+        cache_file = cache_dir / f"{path_hash}.json"
+    hasher = _get_hasher(project_path, cache_file=cache_file)
+    project_hash = hasher.compute()
+
+    return ProjectSnapshot(
+        project_dir=project_dir,
+        build_id=f"{app_name}-{project_name}-{project_hash}",
+    )
+
+
+def get_build_id(
+    app_name: str,
+    project_name: str,
+    project_path: Path,
+    *,
+    cache_dir: Path | None = None,
+) -> str:
     """Get the build id for a project.
 
     The build id is formatted as `<app_name>-<project-name>-<hash>`.
@@ -55,24 +111,30 @@ def get_build_id(app_name: str, project_name: str, project_path: Path) -> str:
     :param app_name: Name of the application.
     :param project_name: Name of the project.
     :param project_path: Path of the project.
+    :param cache_dir: An optional directory in which to persist file digests so
+        that unchanged files are not re-read on subsequent calls.
 
     :returns: The build id.
     """
-    project_hash = _compute_hash(project_path)
+    return get_project_snapshot(
+        app_name, project_name, project_path, cache_dir=cache_dir
+    ).build_id
 
-    return f"{app_name}-{project_name}-{project_hash}"
 
-
-def _compute_hash(directory: Path) -> str:
-    """Compute an md5 hash from the contents of the files in a directory.
+def _get_hasher(directory: Path, *, cache_file: Path | None = None) -> ProjectHasher:
+    """Get a hasher for the contents of the files in a directory.
 
     If a file or its contents within the directory are modified, then the hash
-    will be different.
+    will be different. Git metadata and lifecycle work directories are not
+    included in the hash.
 
     The hash may not be unique if the contents of one file are moved to another file
     or if files are reorganized.
 
-    :returns: A string containing the md5 hash.
+    :param directory: The directory to hash.
+    :param cache_file: An optional file in which to cache per-file digests.
+
+    :returns: A ProjectHasher for the directory.
 
     :raises FileNotFoundError: If the path is not a directory or does not exist.
     """
@@ -87,19 +149,7 @@ def _compute_hash(directory: Path) -> str:
             "a directory."
         )
 
-    files = sorted(file for file in directory.glob("**/*") if file.is_file())
-    hashes: list[str] = []
-
-    for file_path in files:
-        md5_hash = md5()  # noqa: S324 (insecure-hash-function)
-        with file_path.open("rb") as file:
-            # read files in chunks in case they are large
-            for block in iter(partial(file.read, 4096), b""):
-                md5_hash.update(block)
-        hashes.append(md5_hash.hexdigest())
-
-    all_hashes = "".join(hashes).encode()
-    return md5(all_hashes).hexdigest()  # noqa: S324 (insecure-hash-function)
+    return ProjectHasher(directory, cache_file=cache_file)
 
 
 def rmtree(directory: Path) -> None:
@@ -14,17 +14,34 @@
 
 """Manages trees for remote builds."""
 
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import stat
+import sys
 from pathlib import Path
 from shutil import copytree
 from typing import cast
 
 from xdg import BaseDirectory  # type: ignore[import-untyped]
 
-from craft_application.git import GitError, GitRepo
+from craft_application.git import GitError, GitRepo, is_repo
 
 from .errors import RemoteBuildGitError
 from .utils import rmtree
 
+if sys.platform == "linux":
+    import fcntl
+
+    _FICLONE = 0x40049409
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_FILE = "project"
+"""The file in a work tree's base directory that records its project directory."""
+
 
 class WorkTree:
     """Class to manage trees for remote builds.
@@ -47,21 +64,122 @@ class WorkTree:
         return self._repo_dir
 
     def init_repo(self) -> None:
-        """Initialize a clean repo."""
+        """Initialize the repo from the project directory.
+
+        If this build has no repo yet, the repo of the most recent remote build
+        of the same project is reused. An existing repo keeps its own ``.git``
+        directory: its working tree is synchronized with the project directory,
+        copying only the files that changed, and the project's new commits and
+        tags are fetched into it. Git then only needs to hash the changed files
+        again, and the new commit is made on top of the project's HEAD.
+        """
+        if not self._repo_dir.exists():
+            self._adopt_previous_repo()
+
         if self._repo_dir.exists():
-            rmtree(self._repo_dir)
+            self._sync_repo()
+            # Without a project commit to build on, the previous build's commit
+            # would only add unrelated history to the push.
+            orphan = not self._fetch_project_head()
+        else:
+            copytree(self._project_dir, self._repo_dir, copy_function=_copy_file)
+            orphan = False
+
+        (self._base_dir / _PROJECT_FILE).write_text(str(self._project_dir.resolve()))
+        self._gitify_repository(orphan=orphan)
+
+    def _adopt_previous_repo(self) -> None:
+        """Move the repo of the last remote build of this project into this tree."""
+        project = str(self._project_dir.resolve())
+        previous: list[tuple[int, Path]] = []
+        for base_dir in self._base_dir.parent.iterdir():
+            project_file = base_dir / _PROJECT_FILE
+            if base_dir == self._base_dir or not (base_dir / "repo").is_dir():
+                continue
+            try:
+                if project_file.read_text() == project:
+                    previous.append((project_file.stat().st_mtime_ns, base_dir))
+            except OSError:
+                continue
+        if not previous:
+            return
+
+        _, base_dir = max(previous)
+        logger.debug("Reusing remote build repository from %s", base_dir)
+        (base_dir / "repo").rename(self._repo_dir)
+        rmtree(base_dir)
+
+    def _sync_repo(self) -> None:
+        """Make the repo's working tree match the project directory.
+
+        Files are copied only if their size, modification time or mode differ.
+        The repo's ``.git`` directory is kept, and the project's is not copied.
+        """
+        copied = 0
+        for source_dir, dir_names, file_names in os.walk(
+            self._project_dir, followlinks=True
+        ):
+            relative_dir = Path(source_dir).relative_to(self._project_dir)
+            dest_dir = self._repo_dir / relative_dir
+            names = {*dir_names, *file_names}
+            if relative_dir == Path():
+                # The repo keeps its own git directory rather than the project's.
+                names.add(".git")
+                dir_names[:] = [name for name in dir_names if name != ".git"]
+                file_names[:] = [name for name in file_names if name != ".git"]
+            with os.scandir(dest_dir) as entries:
+                for entry in entries:
+                    if entry.name not in names:
+                        _remove(Path(entry.path))
+
+            for name in dir_names:
+                dest = dest_dir / name
+                if dest.is_symlink() or (dest.exists() and not dest.is_dir()):
+                    _remove(dest)
+                dest.mkdir(exist_ok=True)
+
+            for name in file_names:
+                source = Path(source_dir, name)
+                dest = dest_dir / name
+                if _is_unchanged(source, dest):
+                    continue
+                if dest.exists() or dest.is_symlink():
+                    _remove(dest)
+                _copy_file(source, dest)
+                copied += 1
+
+        logger.debug("Synchronized %d changed files to %s", copied, self._repo_dir)
 
-        copytree(self._project_dir, self._repo_dir)
+    def _fetch_project_head(self) -> bool:
+        """Move the repo's branch to the project's HEAD, keeping the repo's index.
 
-        self._gitify_repository()
+        :returns: Whether the project has a commit to build on.
+        """
+        try:
+            if not is_repo(self._project_dir):
+                return False
+            try:
+                GitRepo(self._project_dir).get_last_commit()
+            except GitError:
+                return False  # The project has no commits yet.
+            repo = GitRepo(self._repo_dir)
+            repo.reset_soft(repo.fetch_head(self._project_dir))
+            # The index still has the previous build's tree, which would make
+            # the repo look dirty even if the project has no local changes.
+            repo.add_all()
+        except GitError as git_error:
+            raise RemoteBuildGitError(
+                cast(str, git_error.details),
+            ) from git_error
+        return True
 
-    def _gitify_repository(self) -> None:
+    def _gitify_repository(self, *, orphan: bool = False) -> None:
         """Git-ify source repository tree."""
         try:
             repo = GitRepo(self._repo_dir)
             if not repo.is_clean():
                 repo.add_all()
-                repo.commit()
+                repo.commit(orphan=orphan)
         except GitError as git_error:
             raise RemoteBuildGitError(
                 cast(str, git_error.details),
@@ -71,3 +189,43 @@ class WorkTree:
         """Clean the cache."""
         if self._base_dir.exists():
             rmtree(self._base_dir)
+
+
+def _is_unchanged(source: Path, dest: Path) -> bool:
+    """Determine whether a copied file still matches its source."""
+    try:
+        dest_stat = dest.lstat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    return stat.S_ISREG(dest_stat.st_mode) and (
+        source_stat.st_size,
+        source_stat.st_mtime_ns,
+        source_stat.st_mode,
+    ) == (dest_stat.st_size, dest_stat.st_mtime_ns, dest_stat.st_mode)
+
+
+def _remove(path: Path) -> None:
+    """Remove a file, symbolic link or directory tree."""
+    if path.is_dir() and not path.is_symlink():
+        rmtree(path)
+    else:
+        path.unlink()
+
+
+def _copy_file(source: str | Path, dest: str | Path) -> None:
+    """Copy a file and its metadata.
+
+    On Linux, the file's data is cloned if the filesystem supports it.
+    """
+    source, dest = Path(source), Path(dest)
+    if sys.platform == "linux":
+        try:
+            with source.open("rb") as source_file, dest.open("wb") as dest_file:
+                fcntl.ioctl(dest_file.fileno(), _FICLONE, source_file.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(source, dest)
+            return
+    shutil.copy2(source, dest)
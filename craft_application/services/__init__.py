@@ -15,22 +15,46 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Service classes for the business logic of various categories of command."""
 
-from craft_application.services.base import AppService
-from craft_application.services.config import ConfigService
-from craft_application.services.fetch import FetchService
-from craft_application.services.lifecycle import LifecycleService
-from craft_application.services.init import InitService
-from craft_application.services.testing import TestingService
-from craft_application.services.package import PackageService
-from craft_application.services.project import ProjectService
-from craft_application.services.provider import ProviderService
-from craft_application.services.proxy import ProxyService
-from craft_application.services.remotebuild import RemoteBuildService
-from craft_application.services.request import RequestService
-from craft_application.services.state import StateService
-
-# ServiceFactory must be imported after the actual services
-from craft_application.services.service_factory import ServiceFactory
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from craft_application.services.base import AppService
+    from craft_application.services.config import ConfigService
+    from craft_application.services.fetch import FetchService
+    from craft_application.services.lifecycle import LifecycleService
+    from craft_application.services.init import InitService
+    from craft_application.services.testing import TestingService
+    from craft_application.services.package import PackageService
+    from craft_application.services.project import ProjectService
+    from craft_application.services.provider import ProviderService
+    from craft_application.services.proxy import ProxyService
+    from craft_application.services.remotebuild import RemoteBuildService
+    from craft_application.services.request import RequestService
+    from craft_application.services.state import StateService
+    from craft_application.services.service_factory import ServiceFactory
+
+# Services are imported on first access so that importing one service (or the
+# ServiceFactory) doesn't pull in the dependencies of all the others.
+_LAZY_ATTRIBUTES = {
+    "AppService": "base",
+    "ConfigService": "config",
+    "FetchService": "fetch",
+    "InitService": "init",
+    "LifecycleService": "lifecycle",
+    "PackageService": "package",
+    "ProjectService": "project",
+    "ProviderService": "provider",
+    "ProxyService": "proxy",
+    "RemoteBuildService": "remotebuild",
+    "RequestService": "request",
+    "ServiceFactory": "service_factory",
+    "StateService": "state",
+    "TestingService": "testing",
+}
 
 __all__ = [
     "AppService",
@@ -48,3 +72,19 @@ __all__ = [
     "StateService",
     "TestingService",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}")
+        value = getattr(module, name)
+    elif not name.startswith("_") and importlib.util.find_spec(f"{__name__}.{name}"):
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -20,7 +20,10 @@ from __future__ import annotations
 import abc
 import contextlib
 import enum
+import functools
+import json
 import os
+import types
 from typing import TYPE_CHECKING, Any, TypeVar, cast, final
 
 import pydantic
@@ -31,15 +34,25 @@ from typing_extensions import override
 
 from craft_application import _config, application, util
 from craft_application.services import base
+from craft_application.util import platforms
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Collection, Iterable, Mapping
 
     from craft_application.services.service_factory import ServiceFactory
 
 
 T = TypeVar("T")
 
+_UNSET = object()
+_MISSING = object()
+
+
+@functools.cache
+def _get_type_adapter(field_type: Any) -> pydantic.TypeAdapter[Any]:  # noqa: ANN401
+    """Get a (cached) type adapter for a configuration field's type."""
+    return pydantic.TypeAdapter(field_type)
+
 
 class ConfigHandler(abc.ABC):
     """An abstract class for configuration handlers."""
@@ -145,6 +158,28 @@ class DefaultConfigHandler(ConfigHandler):
         raise KeyError(f"config item {item!r} has no default value.")
 
 
+@final
+class ResolvedConfigHandler(ConfigHandler):
+    """Configuration handler for values resolved by the host of a managed instance.
+
+    The values are read from the ``CRAFT_RESOLVED_CONFIG`` environment variable.
+    """
+
+    def __init__(self, app: application.AppMetadata) -> None:
+        super().__init__(app)
+        try:
+            values = json.loads(os.environ[platforms.ENVIRONMENT_CRAFT_RESOLVED_CONFIG])
+        except (KeyError, ValueError) as exc:
+            raise OSError("No resolved configuration in the environment.") from exc
+        if not isinstance(values, dict):
+            raise OSError("Invalid resolved configuration in the environment.")
+        self._values = cast(dict[str, Any], values)
+
+    @override
+    def get_raw(self, item: str) -> Any:
+        return self._values[item]
+
+
 class ConfigService(base.AppService):
     """Application-wide configuration access."""
 
@@ -167,8 +202,21 @@ class ConfigService(base.AppService):
         self._handlers = [
             AppEnvironmentHandler(self._app),
             CraftEnvironmentHandler(self._app),
-            *(handler(self._app) for handler in self._extra_handlers),
         ]
+        self.refresh()
+
+        if util.is_managed_mode():
+            try:
+                resolved_handler = ResolvedConfigHandler(self._app)
+            except OSError:
+                pass
+            else:
+                # The host already consulted the other handlers.
+                emit.debug("Using configuration resolved by the host.")
+                self._handlers.append(resolved_handler)
+                return
+
+        self._handlers.extend(handler(self._app) for handler in self._extra_handlers)
         try:
             snap_handler = SnapConfigHandler(self._app)
         except OSError:
@@ -178,10 +226,38 @@ class ConfigService(base.AppService):
         else:
             self._handlers.append(snap_handler)
 
+    def refresh(self) -> None:
+        """Discard the resolved configuration.
+
+        Items are resolved again the next time they're requested. Call this after
+        changing the environment variables or other sources of configuration.
+        """
+        self._resolved: dict[str, Any] = {}
+        self._snapshot: Mapping[str, Any] | None = None
+
     def get(self, item: str) -> Any:  # noqa: ANN401
-        """Get the given configuration item."""
+        """Get the given configuration item.
+
+        Each item is resolved once and reused until :meth:`refresh` is called.
+        """
         if item not in self._app.ConfigModel.model_fields:
             raise KeyError(f"unknown config item: {item!r}")
+
+        # refresh() replaces the dictionary, so keep a reference to this one.
+        resolved = self._resolved
+        value = resolved.get(item, _UNSET)
+        if value is _UNSET:
+            try:
+                value = self._resolve(item)
+            except KeyError:
+                value = _MISSING
+            value = resolved.setdefault(item, value)
+        if value is _MISSING:
+            raise KeyError(f"config item {item!r} has no default value.")
+        return value
+
+    def _resolve(self, item: str) -> Any:  # noqa: ANN401
+        """Resolve a configuration item from the handlers."""
         field_info = self._app.ConfigModel.model_fields[item]
 
         for handler in self._handlers:
@@ -194,6 +270,9 @@ class ConfigService(base.AppService):
         else:
             return self._default_handler.get_raw(item)
 
+        if isinstance(handler, ResolvedConfigHandler):
+            # Resolved values are already in their JSON form rather than strings.
+            return _get_type_adapter(field_info.annotation).validate_python(value)
         return self._convert_type(value, field_info.annotation)  # type: ignore[arg-type,return-value]
 
     def _convert_type(self, value: str, field_type: type[T]) -> T:
@@ -208,8 +287,42 @@ class ConfigService(base.AppService):
                     return field_type[value]
                 with contextlib.suppress(KeyError):
                     return field_type[value.upper()]
-        field_adapter = pydantic.TypeAdapter(field_type)
-        return field_adapter.validate_strings(value)
+        return _get_type_adapter(field_type).validate_strings(value)
+
+    def get_snapshot(self) -> Mapping[str, Any]:
+        """Get an immutable mapping of every configuration item that has a value.
+
+        The snapshot is resolved once and reused until :meth:`refresh` is called.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            values: dict[str, Any] = {}
+            for field in self._app.ConfigModel.model_fields:
+                with contextlib.suppress(KeyError):
+                    values[field] = self.get(field)
+            snapshot = self._snapshot = types.MappingProxyType(values)
+        return snapshot
+
+    def dump_snapshot(self, exclude: Collection[str] = ()) -> str:
+        """Serialize the configuration for the ``CRAFT_RESOLVED_CONFIG`` variable.
+
+        A managed instance with this variable set uses these values instead of
+        resolving configuration from snap configuration or extra handlers.
+
+        :param exclude: Configuration items not to include.
+        :returns: The configuration as a JSON object.
+        """
+        fields = self._app.ConfigModel.model_fields
+        return json.dumps(
+            {
+                item: _get_type_adapter(fields[item].annotation).dump_python(
+                    value, mode="json"
+                )
+                for item, value in self.get_snapshot().items()
+                if item not in exclude and value is not None
+            },
+            sort_keys=True,
+        )
 
     def get_all(self) -> dict[str, Any]:
         """Get a dictionary of the complete configuration per the ConfigModel.
@@ -218,11 +331,7 @@ class ConfigService(base.AppService):
         in the resulting mapping.
         """
         config: dict[str, Any] = {}
-        for field in self._app.ConfigModel.model_fields:
-            try:
-                config_value = self.get(field)
-            except KeyError:
-                continue
+        for field, config_value in self.get_snapshot().items():
             with contextlib.suppress(AttributeError):
                 default_value = getattr(self._app.ConfigModel, field).default
                 if config_value == default_value:
@@ -21,6 +21,7 @@ import atexit
 import json
 import os
 import pathlib
+import threading
 import typing
 from functools import partial
 
@@ -72,11 +73,12 @@ class FetchService(base.AppService):
         instance;
       - Teardown/close the session with teardown_session();
     - Stop the fetch-service via shutdown().
+
+    Each thread has its own session, so instances can be run in parallel, each
+    with its own session.
     """
 
     _fetch_process: subprocess.Popen[str] | None
-    _session_data: fetch.SessionData | None
-    _instance: craft_providers.Executor | None
     _proxy_cert: pathlib.Path | None
 
     def __init__(
@@ -91,12 +93,29 @@ class FetchService(base.AppService):
         """
         super().__init__(app, services)
         self._fetch_process = None
-        self._session_data = None
         self._session_policy: str = "strict"  # Default to strict policy.
-        self._instance = None
+        self._thread_session = threading.local()
         self._proxy_cert = None
         self._external_session = False
 
+    @property
+    def _session_data(self) -> fetch.SessionData | None:
+        """The data of the current thread's session."""
+        return getattr(self._thread_session, "data", None)
+
+    @_session_data.setter
+    def _session_data(self, value: fetch.SessionData | None) -> None:
+        self._thread_session.data = value
+
+    @property
+    def _instance(self) -> craft_providers.Executor | None:
+        """The instance using the current thread's session."""
+        return getattr(self._thread_session, "instance", None)
+
+    @_instance.setter
+    def _instance(self, value: craft_providers.Executor | None) -> None:
+        self._thread_session.instance = value
+
     @override
     def setup(self) -> None:
         """Start the fetch-service process with proper arguments."""
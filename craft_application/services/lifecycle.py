@@ -17,11 +17,16 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import contextlib
+import os
+import sys
+import threading
 import types
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import craft_parts
 import craft_platforms
 import distro
 from craft_cli import CraftError, emit
@@ -41,9 +46,13 @@ from typing_extensions import override
 
 from craft_application import errors, util
 from craft_application.services import base
-from craft_application.util import repositories
+from craft_application.util import repositories, step_cache
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from craft_parts.executor import ExecutionContext
+
     from craft_application.application import AppMetadata
     from craft_application.services import ServiceFactory
 
@@ -101,6 +110,105 @@ def _get_parts_action_message(action: Action) -> str:
     return message
 
 
+_OVERLAY_KEYS = frozenset({"overlay", "overlay-packages", "overlay-script"})
+
+
+def _get_plugin_info(plugin_name: str | None) -> dict[str, str | None] | None:
+    """Get the identity of a plugin for use in a step cache key.
+
+    Applications register their own plugins, which can change with the
+    application rather than with craft-parts, so the key identifies the plugin's
+    class and any version reported by the class or its package.
+
+    :param plugin_name: The name of the plugin.
+    :returns: The plugin's identity, or None if it isn't a registered plugin.
+    """
+    if not plugin_name:
+        return None
+    try:
+        plugin_class = craft_parts.plugins.get_plugin_class(plugin_name)
+    except ValueError:
+        return None
+    package = sys.modules.get(plugin_class.__module__.partition(".")[0])
+    version = getattr(plugin_class, "__version__", None) or getattr(
+        package, "__version__", None
+    )
+    return {
+        "module": plugin_class.__module__,
+        "class": plugin_class.__qualname__,
+        "version": None if version is None else str(version),
+    }
+
+
+"""Part keys that make the build of parts depend on the overlay."""
+
+PARALLEL_STEPS = frozenset({Step.PULL, Step.BUILD})
+"""Steps that may run at the same time as the actions of other parts.
+
+Other steps write to directories shared by all parts, so they run on their own,
+once every earlier action has finished and before any later action starts.
+"""
+
+_SHARED_CACHE_KEYS = frozenset({"stage-packages", "stage-snaps"})
+"""Part keys that make pulling the part use caches shared by all parts."""
+
+
+def _get_action_dependencies(
+    actions: Sequence[Action], parts: Mapping[str, Any]
+) -> list[frozenset[int]]:
+    """Get the indices of the actions that each planned action must wait for.
+
+    An action waits for the previous action of the same part and of each part it
+    comes ``after``. Actions on steps not in ``PARALLEL_STEPS`` also wait for
+    every earlier action, and every later action waits for them.
+
+    :param actions: The planned actions, in order.
+    :param parts: The project's parts.
+    :returns: A set of action indices for each action.
+    """
+    last_action: dict[str, int] = {}
+    last_serial: int | None = None
+    since_serial: set[int] = set()
+    dependencies: list[frozenset[int]] = []
+    for index, action in enumerate(actions):
+        after = parts.get(action.part_name, {}).get("after", [])
+        waits = {
+            last_action[name]
+            for name in (action.part_name, *after)
+            if name in last_action
+        }
+        if last_serial is not None:
+            waits.add(last_serial)
+        if action.step in PARALLEL_STEPS:
+            since_serial.add(index)
+        else:
+            waits.update(since_serial)
+            last_serial = index
+            since_serial = set()
+        last_action[action.part_name] = index
+        dependencies.append(frozenset(waits))
+    return dependencies
+
+
+@contextlib.contextmanager
+def _prefixed_stream(prefix: str) -> Iterator[int]:
+    """Get a pipe whose output is emitted line by line with a prefix."""
+    read_fd, write_fd = os.pipe()
+
+    def _relay() -> None:
+        with os.fdopen(read_fd, encoding="utf-8", errors="replace") as reader:
+            for line in reader:
+                emit.progress(f"[{prefix}] {line.rstrip()}", permanent=True)
+
+    relay = threading.Thread(target=_relay, daemon=True)
+    relay.start()
+    try:
+        yield write_fd
+    finally:
+        os.close(write_fd)
+        relay.join()
+
+
 def _get_step(step_name: str) -> Step:
     """Get a lifecycle step by name."""
     if step_name.lower() == "overlay" and not Features().enable_overlay:
@@ -139,6 +247,10 @@ class LifecycleService(base.AppService):
         self._cache_dir = cache_dir
         self._manager_kwargs = lifecycle_kwargs
         self._lcm: LifecycleManager = None  # type: ignore[assignment]
+        self._timer = util.Timer()
+        self._step_cache: step_cache.StepCache | None = None
+        self._build_cache_keys: dict[str, str | None] = {}
+        self._build_cache_keys_lock = threading.RLock()
 
     @override
     def setup(self) -> None:
@@ -253,6 +365,17 @@ class LifecycleService(base.AppService):
         """The lifecycle's ProjectInfo."""
         return self._lcm.project_info
 
+    @property
+    def timings(self) -> util.Timer:
+        """The timings of the lifecycle operations in this process.
+
+        Each run records the time taken to install package repositories, to plan
+        the lifecycle and to execute each action. The records of the most recent
+        run are also written to the parts directory, as ``timings.json`` and
+        as ``timings.trace.json`` in the Chrome trace event format.
+        """
+        return self._timer
+
     def get_pull_assets(self, *, part_name: str) -> dict[str, Any] | None:
         """Obtain the part's pull state assets.
 
@@ -283,22 +406,31 @@ class LifecycleService(base.AppService):
         target_step = _get_step(step_name) if step_name else None
 
         self._validate_build_plan()
+        self._timer.clear()
+        self._build_cache_keys.clear()
+        self._step_cache = None
+        if self._services.get("config").get("step_cache"):
+            self._step_cache = step_cache.StepCache(self._get_step_cache_dir())
 
         try:
             if self._project.package_repositories:
                 emit.trace("Installing package repositories")
-                repositories.install_package_repositories(
-                    self._project.package_repositories,
-                    self._lcm,
-                    local_keys_path=self._get_local_keys_path(),
-                )
+                with self._timer.measure(
+                    "Install package repositories", "repositories"
+                ):
+                    repositories.install_package_repositories(
+                        self._project.package_repositories,
+                        self._lcm,
+                        local_keys_path=self._get_local_keys_path(),
+                    )
                 with contextlib.suppress(CallbackRegistrationError):
                     callbacks.register_configure_overlay(
                         repositories.install_overlay_repositories
                     )
             if target_step:
                 emit.trace(f"Planning {step_name} for {part_names or 'all parts'}")
-                actions = self._lcm.plan(target_step, part_names=part_names)
+                with self._timer.measure(f"Plan {target_step.name.lower()}", "plan"):
+                    actions = self._lcm.plan(target_step, part_names=part_names)
             else:
                 actions = []
 
@@ -316,18 +448,227 @@ class LifecycleService(base.AppService):
             raise errors.PartsLifecycleError.from_os_error(err) from err
         except Exception as err:
             raise errors.PartsLifecycleError(f"Unknown error: {str(err)}") from err
+        finally:
+            self._write_timings()
+            self._prune_step_cache()
+
+    def _get_step_cache_dir(self) -> Path:
+        """Get the directory of the step cache.
+
+        In managed mode, this is the host's step cache, mounted into the instance
+        by the provider service.
+        """
+        if util.is_managed_mode():
+            return Path(step_cache.MANAGED_CACHE_DIR)
+        return Path(self._cache_dir, "steps")
+
+    def _prune_step_cache(self) -> None:
+        """Prune the least recently used builds from the step cache, if enabled."""
+        if self._step_cache is None:
+            return
+        max_mib = self._services.get("config").get("step_cache_max_mib")
+        try:
+            self._step_cache.prune(max_mib * 1024 * 1024)
+        except OSError as exc:
+            emit.debug(f"Could not prune step cache: {exc}")
+
+    def _write_timings(self) -> None:
+        """Write the timing reports of the last run to the parts directory."""
+        if not self._timer.records:
+            return
+        parts_dir = self._lcm.project_info.dirs.parts_dir
+        try:
+            parts_dir.mkdir(parents=True, exist_ok=True)
+            self._timer.write_json(parts_dir / "timings.json")
+            self._timer.write_chrome_trace(parts_dir / "timings.trace.json")
+        except OSError as exc:
+            emit.debug(f"Could not write lifecycle timings: {exc}")
 
     def _exec(self, actions: list[Action]) -> None:
         """Execute actions of the lifecycle.
 
         Applications must override this method to handle errors before craft-application.
         """
+        if len(actions) > 1 and self._services.get("config").get("parallel_parts"):
+            self._exec_parallel(actions)
+            return
         with self._lcm.action_executor() as aex:
             for action in actions:
-                message = _get_parts_action_message(action)
-                emit.progress(message)
-                with emit.open_stream() as stream:
-                    aex.execute(action, stdout=stream, stderr=stream)
+                self._exec_action(aex, action)
+
+    def _exec_parallel(self, actions: list[Action]) -> None:
+        """Execute actions of the lifecycle, running independent parts at once.
+
+        Each action starts once the actions it depends on have finished, using up
+        to the parallel build count of workers. The output of each action is
+        prefixed with its part name. Actions that use state shared by the whole
+        process run one at a time. If an action fails, no further actions are
+        started and the error is raised once the running actions have finished.
+        """
+        dependencies = _get_action_dependencies(actions, self._project.parts)
+        max_workers = util.get_parallel_build_count(self._app.name)
+        emit.debug(f"Executing {len(actions)} actions with up to {max_workers} workers")
+        pending = list(range(len(actions)))
+        finished: set[int] = set()
+        error: BaseException | None = None
+        exclusive_lock = threading.Lock()
+
+        def _run(aex: ExecutionContext, action: Action) -> None:
+            exclusive = self._is_exclusive_action(action)
+            with exclusive_lock if exclusive else contextlib.nullcontext():
+                self._exec_action(aex, action, prefix=True)
+
+        with (
+            self._lcm.action_executor() as aex,
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool,
+        ):
+            running: dict[concurrent.futures.Future[None], int] = {}
+            while pending or running:
+                if error is None:
+                    # Start ready actions in plan order to keep serial steps stable.
+                    ready = [i for i in pending if dependencies[i] <= finished]
+                    for index in ready:
+                        pending.remove(index)
+                        future = pool.submit(_run, aex, actions[index])
+                        running[future] = index
+                if not running:
+                    break
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    index = running.pop(future)
+                    if exc := future.exception():
+                        error = error or exc
+                    else:
+                        finished.add(index)
+        if error is not None:
+            raise error
+
+    def _is_exclusive_action(self, action: Action) -> bool:
+        """Whether an action must not run at the same time as other such actions.
+
+        Fetching stage packages and snaps uses caches shared by all parts, and
+        craft-parts changes the working directory of the whole process while
+        preparing a build with a build environment from the application.
+        """
+        if action.step == Step.PULL:
+            part = self._project.parts.get(action.part_name, {})
+            return bool(_SHARED_CACHE_KEYS.intersection(part))
+        if action.step == Step.BUILD:
+            return bool(self._manager_kwargs.get("build_environment"))
+        return False
+
+    def _exec_action(
+        self, aex: ExecutionContext, action: Action, *, prefix: bool = False
+    ) -> None:
+        """Execute a single lifecycle action.
+
+        If the step cache is enabled, a fresh build is restored from the cache
+        when possible, and the outputs of other builds are stored in it.
+
+        :param aex: The execution context in which to run the action.
+        :param action: The action to run.
+        :param prefix: Whether to prefix the action's output with its part name.
+        """
+        message = _get_parts_action_message(action)
+        timing = self._timer.measure(
+            message,
+            "action",
+            part=action.part_name,
+            step=action.step.name.lower(),
+        )
+        cache_key = None
+        if (
+            self._step_cache is not None
+            and action.step == Step.BUILD
+            and action.action_type in (ActionType.RUN, ActionType.RERUN)
+        ):
+            cache_key = self._get_build_cache_key(action.part_name)
+        part_dir = self._lcm.project_info.dirs.parts_dir / action.part_name
+        install_dir = part_dir / "install"
+        state_file = part_dir / "state" / "build"
+
+        with timing:
+            if (
+                cache_key
+                and action.action_type == ActionType.RUN
+                and self._step_cache.restore(  # type: ignore[union-attr]
+                    cache_key, install_dir=install_dir, state_file=state_file
+                )
+            ):
+                emit.progress(f"{message} (restored from cache)")
+                return
+            emit.progress(message)
+            stream = (
+                _prefixed_stream(action.part_name) if prefix else emit.open_stream()
+            )
+            with stream as output:
+                aex.execute(action, stdout=output, stderr=output)
+
+        export_dir = part_dir / "export"
+        if cache_key and not (export_dir.is_dir() and any(export_dir.iterdir())):
+            try:
+                self._step_cache.store(  # type: ignore[union-attr]
+                    cache_key, install_dir=install_dir, state_file=state_file
+                )
+            except OSError as exc:
+                emit.debug(f"Could not store {action.part_name} in step cache: {exc}")
+
+    def _get_build_cache_key(self, part_name: str) -> str | None:
+        """Get the step cache key for building a part.
+
+        The key covers the rendered part, its pulled sources and pull state, the
+        build base and target, the versions of the application and craft-parts,
+        the plugin that builds the part and the keys of the parts it comes after.
+
+        :param part_name: The name of the part.
+        :returns: The cache key, or None if the part's build can't be cached.
+        """
+        # Parts may be built in parallel, and keys depend on each other.
+        with self._build_cache_keys_lock:
+            if part_name not in self._build_cache_keys:
+                self._build_cache_keys[part_name] = self._compute_build_cache_key(
+                    part_name
+                )
+            return self._build_cache_keys[part_name]
+
+    def _compute_build_cache_key(self, part_name: str) -> str | None:
+        key = None
+        parts = self._project.parts
+        part = parts.get(part_name)
+        part_dir = self._lcm.project_info.dirs.parts_dir / part_name
+        pull_state = part_dir / "state" / "pull"
+        source_dir = part_dir / "src"
+        if (
+            part is not None
+            # The part sets project variables, which a restored build wouldn't.
+            and part_name != self._project.adopt_info
+            and not self._services.get("project").partitions
+            and not any(_OVERLAY_KEYS.intersection(p) for p in parts.values())
+            and pull_state.is_file()
+            and source_dir.is_dir()
+            and (plugin := _get_plugin_info(part.get("plugin"))) is not None
+        ):
+            after = {
+                name: self._get_build_cache_key(name) for name in part.get("after", [])
+            }
+            if None not in after.values():
+                key = step_cache.get_key(
+                    {
+                        "app": self._app.name,
+                        "app-version": self._app.version,
+                        "part": part,
+                        "plugin": plugin,
+                        "pull-state": pull_state.read_text(),
+                        "source": step_cache.get_tree_digest(source_dir),
+                        "build-base": str(self._build_info.build_base),
+                        "build-for": self._get_build_for(),
+                        "craft-parts": craft_parts.__version__,
+                        "after": after,
+                    }
+                )
+        return key
 
     def post_prime(self, step_info: StepInfo) -> bool:
         """Perform any necessary post-lifecycle modifications to the prime directory.
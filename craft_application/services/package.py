@@ -18,18 +18,188 @@
 from __future__ import annotations
 
 import abc
+import contextlib
+import enum
+import lzma
+import os
 import pathlib
-from typing import TYPE_CHECKING, cast
+import shutil
+import subprocess
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, TYPE_CHECKING, cast
 
 from craft_cli import emit
 
 from craft_application import errors, models, util
+from craft_application.models.manifest import Hasher
 from craft_application.services import base
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator, Mapping
+
     from craft_application.application import AppMetadata
     from craft_application.services import ServiceFactory
 
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ArchiveCompression(str, enum.Enum):
+    """The compression formats supported by :class:`ArchiveWriter`."""
+
+    NONE = "none"
+    XZ = "xz"
+    ZSTD = "zstd"
+
+
+_DEFAULT_LEVELS = {ArchiveCompression.XZ: 6, ArchiveCompression.ZSTD: 3}
+
+
+class _HashingWriter:
+    """A write-only file wrapper that hashes the data written through it."""
+
+    def __init__(self, file: IO[bytes], hasher: Hasher) -> None:
+        self._file = file
+        self._hasher = hasher
+
+    def write(self, data: bytes) -> int:
+        self._hasher.update(data)
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+
+class ArchiveWriter:
+    """Write reproducible, compressed tar archives of directories.
+
+    Entries are added in sorted order, with the same modification time and root
+    ownership, so the same directory contents always give the same tar stream.
+    The compressed output is reproducible for a given compressor and level.
+
+    xz compression uses the ``xz`` executable, which compresses on several
+    threads, if it is available. Otherwise it falls back to the single-threaded
+    :mod:`lzma` module. zstd compression requires the ``zstandard`` package.
+
+    The digests of each archive are computed while it's written and recorded
+    with :meth:`~craft_application.models.manifest.Hashes.record`, so creating
+    its manifest doesn't read it again.
+
+    :param compression: The compression format.
+    :param level: The compression level, or None for the format's default.
+    :param threads: The number of compression threads, or None to use one per
+        CPU.
+    :param mtime: The modification time of every entry, in seconds since the
+        epoch. If None, the ``SOURCE_DATE_EPOCH`` environment variable is used if
+        set, otherwise 0.
+    """
+
+    def __init__(
+        self,
+        compression: ArchiveCompression | str = ArchiveCompression.XZ,
+        *,
+        level: int | None = None,
+        threads: int | None = None,
+        mtime: int | None = None,
+    ) -> None:
+        self.compression = ArchiveCompression(compression)
+        self.level = (
+            level if level is not None else _DEFAULT_LEVELS.get(self.compression)
+        )
+        self.threads = threads or os.cpu_count() or 1
+        if mtime is None:
+            mtime = int(os.environ.get("SOURCE_DATE_EPOCH", "0"))
+        self.mtime = mtime
+
+    def write(self, source_dir: pathlib.Path, dest: pathlib.Path) -> pathlib.Path:
+        """Write an archive of a directory.
+
+        :param source_dir: The directory to archive. Its contents are stored
+            relative to ``.`` in the archive.
+        :param dest: The path of the archive to write.
+        :returns: The path of the archive.
+        """
+        return self._write(source_dir, dest, threads=self.threads)
+
+    def write_many(
+        self, archives: Mapping[pathlib.Path, pathlib.Path]
+    ) -> list[pathlib.Path]:
+        """Write several archives at the same time.
+
+        The compression threads are shared between the archives.
+
+        :param archives: A mapping of each archive to write to the directory to
+            archive in it.
+        :returns: The paths of the archives, in the same order as ``archives``.
+        """
+        if len(archives) <= 1:
+            return [self.write(source, dest) for dest, source in archives.items()]
+        threads = max(1, self.threads // len(archives))
+        with ThreadPoolExecutor(max_workers=len(archives)) as executor:
+            futures = [
+                executor.submit(self._write, source, dest, threads=threads)
+                for dest, source in archives.items()
+            ]
+            return [future.result() for future in futures]
+
+    def _write(
+        self, source_dir: pathlib.Path, dest: pathlib.Path, *, threads: int
+    ) -> pathlib.Path:
+        emit.debug(f"Writing {self.compression.value} archive {dest} of {source_dir}")
+        hasher = Hasher()
+        with dest.open("wb") as file:
+            output = _HashingWriter(file, hasher)
+            with (
+                self._compress(output, threads=threads) as stream,
+                tarfile.open(
+                    fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT
+                ) as tar,
+            ):
+                self._add_tree(tar, source_dir)
+        hasher.get_hashes().record(dest)
+        return dest
+
+    def _add_tree(self, tar: tarfile.TarFile, root: pathlib.Path) -> None:
+        """Add a directory tree to an archive in a reproducible order."""
+        for path in _iter_tree(root):
+            relative = path.relative_to(root).as_posix()
+            arcname = "." if relative == "." else f"./{relative}"
+            info = tar.gettarinfo(path, arcname)
+            if info is None:  # Sockets and other unsupported files.
+                continue
+            info.mtime = self.mtime
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            if info.isreg():
+                with path.open("rb") as file:
+                    tar.addfile(info, file)
+            else:
+                tar.addfile(info)
+
+    @contextlib.contextmanager
+    def _compress(self, output: _HashingWriter, *, threads: int) -> Iterator[IO[bytes]]:
+        """Get a stream that compresses the data written to it into ``output``."""
+        if self.compression == ArchiveCompression.NONE:
+            yield cast(IO[bytes], output)
+        elif self.compression == ArchiveCompression.ZSTD:
+            try:
+                import zstandard  # noqa: PLC0415 (optional dependency)
+            except ImportError:
+                raise errors.ArtifactCreationError(
+                    "zstd compression requires the 'zstandard' package."
+                ) from None
+            compressor = zstandard.ZstdCompressor(level=self.level, threads=threads)
+            with compressor.stream_writer(output, closefd=False) as writer:
+                yield cast(IO[bytes], writer)
+        elif xz := shutil.which("xz"):
+            with _xz_process(xz, output, level=self.level, threads=threads) as stdin:
+                yield stdin
+        else:
+            emit.debug("xz executable not found, compressing on a single thread.")
+            with lzma.LZMAFile(output, "wb", preset=self.level) as writer:
+                yield cast(IO[bytes], writer)
+
 
 class PackageService(base.AppService):
     """Business logic for creating packages."""
@@ -136,3 +306,56 @@ class PackageService(base.AppService):
 
     def _extra_project_updates(self) -> None:
         """Perform domain-specific updates to the project before packing."""
+
+
+def _iter_tree(root: pathlib.Path) -> Iterator[pathlib.Path]:
+    """Iterate over a directory tree in sorted order, without following symlinks."""
+    yield root
+    for entry in sorted(os.scandir(root), key=lambda entry: entry.name):
+        path = pathlib.Path(entry.path)
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_tree(path)
+        else:
+            yield path
+
+
+@contextlib.contextmanager
+def _xz_process(
+    xz: str, output: _HashingWriter, *, level: int | None, threads: int
+) -> Iterator[IO[bytes]]:
+    """Compress the data written to the yielded stream with an xz process."""
+    # xz writes a different stream on a single thread, so always use at least two
+    # threads to give the same output regardless of the number of CPUs.
+    cmd = [xz, "--compress", "--stdout", f"--threads={max(threads, 2)}"]
+    if level is not None:
+        cmd.append(f"-{level}")
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    stdin = cast(IO[bytes], process.stdin)
+    stdout = cast(IO[bytes], process.stdout)
+
+    relay_errors: list[Exception] = []
+
+    def _relay() -> None:
+        try:
+            while chunk := stdout.read(_CHUNK_SIZE):
+                output.write(chunk)
+        except Exception as exc:  # noqa: BLE001
+            # Stop xz so the writer doesn't block on a full pipe.
+            relay_errors.append(exc)
+            process.kill()
+
+    relay = threading.Thread(target=_relay, daemon=True)
+    relay.start()
+    try:
+        yield stdin
+    finally:
+        with contextlib.suppress(BrokenPipeError):
+            stdin.close()
+        relay.join()
+        process.wait()
+        if relay_errors:
+            raise relay_errors[0]
+    if process.returncode:
+        raise errors.ArtifactCreationError(
+            f"xz compression failed with exit code {process.returncode}."
+        )
@@ -17,14 +17,19 @@ from __future__ import annotations
 
 import copy
 import datetime
+import hashlib
+import json
 import os
 import pathlib
+import pickle
+import tempfile
 import warnings
 from typing import TYPE_CHECKING, Any, Literal, cast, final
 
 import craft_parts
 import craft_platforms
 import distro_support
+import platformdirs
 import pydantic
 from craft_cli import emit
 from distro_support.errors import (
@@ -39,11 +44,15 @@ from craft_application.models.grammar import GrammarAwareProject
 from . import base
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from craft_application import models
     from craft_application.application import AppMetadata
 
     from .service_factory import ServiceFactory
 
+_RAW_PROJECT_CACHE_VERSION = 1
+
 
 class ProjectService(base.AppService):
     """A service for handling access to the project."""
@@ -68,6 +77,13 @@ class ProjectService(base.AppService):
         self._build_for: str | None = None
         self._platform: str | None = None
         self._project_vars: craft_parts.ProjectVarInfo | None = None
+        self.__raw_fingerprint: tuple[dict[str, Any], str] | None = None
+        self.__validated_raw: tuple[str, dict[str, Any]] | None = None
+        self.__project_info_cache: dict[tuple[Any, ...], craft_parts.ProjectInfo] = {}
+        self.__render_cache: dict[
+            tuple[Any, ...],
+            tuple[models.Project, craft_parts.ProjectVarInfo | None],
+        ] = {}
 
     @final
     def configure(self, *, platform: str | None, build_for: str | None) -> None:
@@ -176,6 +192,14 @@ class ProjectService(base.AppService):
         self.__project_file_path = path
         return path
 
+    @property
+    def raw_project_cache_dir(self) -> pathlib.Path | None:
+        """The directory in which parsed project files are cached.
+
+        Applications may override this to return ``None``, disabling the cache.
+        """
+        return platformdirs.user_cache_path(self._app.name) / "project"
+
     @final
     def _load_raw_project(self) -> dict[str, Any]:
         """Get the raw project data structure.
@@ -183,23 +207,102 @@ class ProjectService(base.AppService):
         This loads the project file from the given path, parses the YAML, and returns
         that raw data structure. This method should be used with care, as the project
         does not have any preprocessors applied.
+
+        The parsed data is cached on disk, keyed on the project file's path, size,
+        modification time and contents, so an unchanged project file is only parsed
+        once across runs.
         """
         if self.__raw_project:
             return self.__raw_project
         project_path = self.resolve_project_file_path()
-        with project_path.open() as project_file:
-            emit.debug(f"Loading project file '{project_path!s}")
-            raw_yaml = util.safe_yaml_load(project_file)
-        if not isinstance(raw_yaml, dict):
-            raise errors.ProjectFileInvalidError(raw_yaml)
+        cache_key = self._get_raw_project_cache_key(project_path)
+        raw_yaml = self._read_raw_project_cache(cache_key)
+        if raw_yaml is None:
+            with project_path.open() as project_file:
+                emit.debug(f"Loading project file '{project_path!s}")
+                raw_yaml = util.safe_yaml_load(project_file)
+            if not isinstance(raw_yaml, dict):
+                raise errors.ProjectFileInvalidError(raw_yaml)
+            self._write_raw_project_cache(cache_key, cast(dict[str, Any], raw_yaml))
+        else:
+            emit.debug(f"Loaded cached project file '{project_path!s}'")
         self.__raw_project = cast(dict[str, Any], raw_yaml)
         return self.__raw_project
 
+    @staticmethod
+    def _get_raw_project_cache_key(
+        project_path: pathlib.Path,
+    ) -> tuple[str, int, int, str]:
+        """Get the key identifying this version of the project file in the cache."""
+        stat = project_path.stat()
+        content_hash = hashlib.sha256(project_path.read_bytes()).hexdigest()
+        return (str(project_path), stat.st_size, stat.st_mtime_ns, content_hash)
+
+    def _get_raw_project_cache_file(self, project_path: str) -> pathlib.Path | None:
+        cache_dir = self.raw_project_cache_dir
+        if not cache_dir:
+            return None
+        path_hash = hashlib.sha256(project_path.encode()).hexdigest()
+        return cache_dir / f"{path_hash}.pickle"
+
+    def _read_raw_project_cache(
+        self, cache_key: tuple[str, int, int, str]
+    ) -> dict[str, Any] | None:
+        """Get the cached raw project for this key, if it exists."""
+        cache_file = self._get_raw_project_cache_file(cache_key[0])
+        if not cache_file or not cache_file.is_file():
+            return None
+        try:
+            with cache_file.open("rb") as file:
+                # The cache lives in the user's own cache directory and is only
+                # ever written by this method's counterpart.
+                version, key, raw_project = pickle.load(file)  # noqa: S301
+        except Exception as exc:  # noqa: BLE001 (a corrupt pickle can raise anything)
+            emit.debug(f"Ignoring unreadable project cache {cache_file}: {exc}")
+            return None
+        if version != _RAW_PROJECT_CACHE_VERSION or tuple(key) != cache_key:
+            return None
+        if not isinstance(raw_project, dict):
+            return None
+        return cast(dict[str, Any], raw_project)
+
+    def _write_raw_project_cache(
+        self, cache_key: tuple[str, int, int, str], raw_project: dict[str, Any]
+    ) -> None:
+        """Write the raw project to the cache, ignoring any failures."""
+        cache_file = self._get_raw_project_cache_file(cache_key[0])
+        if not cache_file:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=cache_file.parent, delete=False
+            ) as temp_file:
+                pickle.dump(
+                    (_RAW_PROJECT_CACHE_VERSION, cache_key, raw_project),
+                    temp_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            pathlib.Path(temp_file.name).replace(cache_file)
+        except (OSError, pickle.PicklingError) as exc:
+            emit.debug(f"Could not write project cache {cache_file}: {exc}")
+
     @final
     def get_raw(self) -> dict[str, Any]:
         """Get the raw project data structure."""
         return copy.deepcopy(self._load_raw_project())
 
+    @final
+    def _get_raw_fingerprint(self) -> str:
+        """Get a fingerprint of the raw project data for use in cache keys."""
+        raw_project = self._load_raw_project()
+        if not self.__raw_fingerprint or self.__raw_fingerprint[0] is not raw_project:
+            fingerprint = hashlib.sha256(
+                pickle.dumps(raw_project, protocol=pickle.HIGHEST_PROTOCOL)
+            ).hexdigest()
+            self.__raw_fingerprint = (raw_project, fingerprint)
+        return self.__raw_fingerprint[1]
+
     def _app_render_legacy_platforms(self) -> dict[str, craft_platforms.PlatformDict]:
         """Application-specific rendering function if no platforms are declared.
 
@@ -419,6 +522,19 @@ class ProjectService(base.AppService):
         - Processing grammar for keys other than parts
         """
 
+    def _app_render_cache_key(self) -> Hashable:
+        """Get any application state that rendering the project depends on.
+
+        Rendered projects, and the project info used to expand their environment,
+        are memoized on the raw project data and the render parameters. If an
+        application's ``_app_preprocess_project`` or ``update_project_environment``
+        depends on other state, this method must return a hashable value derived
+        from that state so that the project is rendered again when it changes.
+
+        :returns: A hashable value that is part of every render's cache key.
+        """
+        return None
+
     @final
     def _expand_environment(
         self,
@@ -458,19 +574,38 @@ class ProjectService(base.AppService):
             platform=platform, build_for=build_for, build_on=build_on
         )
         work_dir = util.get_work_dir(self._project_dir)
-        project_dirs = craft_parts.ProjectDirs(work_dir=work_dir, partitions=partitions)
-        info = craft_parts.ProjectInfo(
-            application_name=self._app.name,  # not used in environment expansion
-            cache_dir=pathlib.Path(),  # not used in environment expansion
-            arch=str(self._convert_build_for(build_for)),
-            parallel_build_count=util.get_parallel_build_count(self._app.name),
-            project_name=project_data.get("name", ""),
-            project_dirs=project_dirs,
-            project_vars=self.project_vars,
-            partitions=partitions,
+        parallel_build_count = util.get_parallel_build_count(self._app.name)
+        # Renders for different platforms usually share a build-for and project
+        # variables, and so can share the same project info.
+        info_key = (
+            build_for,
+            None if partitions is None else tuple(partitions),
+            project_data.get("name", ""),
+            json.dumps(self._project_vars.marshal(), sort_keys=True, default=str),
+            work_dir,
+            parallel_build_count,
+            self._app_render_cache_key(),
         )
+        info = self.__project_info_cache.get(info_key)
+        if info is None:
+            project_dirs = craft_parts.ProjectDirs(
+                work_dir=work_dir, partitions=partitions
+            )
+            info = craft_parts.ProjectInfo(
+                application_name=self._app.name,  # not used in environment expansion
+                cache_dir=pathlib.Path(),  # not used in environment expansion
+                arch=str(self._convert_build_for(build_for)),
+                parallel_build_count=parallel_build_count,
+                project_name=project_data.get("name", ""),
+                project_dirs=project_dirs,
+                # A copy, so later changes to the project vars can't leak into the
+                # cached project info.
+                project_vars=copy.deepcopy(self.project_vars),
+                partitions=partitions,
+            )
+            self.update_project_environment(info)
+            self.__project_info_cache[info_key] = info
 
-        self.update_project_environment(info)
         craft_parts.expand_environment(project_data, info=info)
 
     @final
@@ -494,8 +629,12 @@ class ProjectService(base.AppService):
         :param build_on: The host architecture the build happens on.
         :returns: A dict containing a pre-processed project.
         """
-        project = self.get_raw()
-        GrammarAwareProject.validate_grammar(project)
+        fingerprint = self._get_raw_fingerprint()
+        if not self.__validated_raw or self.__validated_raw[0] != fingerprint:
+            validated = self.get_raw()
+            GrammarAwareProject.validate_grammar(validated)
+            self.__validated_raw = (fingerprint, validated)
+        project = copy.deepcopy(self.__validated_raw[1])
         self._app_preprocess_project(
             project, build_on=build_on, build_for=build_for, platform=platform
         )
@@ -515,6 +654,10 @@ class ProjectService(base.AppService):
         given parameters or that the parameters even correspond to something a build
         plan would generate.
 
+        Rendered projects are memoized for the lifetime of the service, keyed on
+        the raw project data, the given parameters, the platform identifiers and
+        the application's ``_app_render_cache_key()``. Each call returns a copy.
+
         :param build_for: The target architecture of the build.
         :param platform: The name of the target platform.
         :param build_on: The host architecture the build happens on.
@@ -524,6 +667,26 @@ class ProjectService(base.AppService):
         if platform not in platforms:
             raise errors.InvalidPlatformError(platform, sorted(platforms.keys()))
 
+        # only provide platform ids when the 'for' variant is enabled
+        if self._app.enable_for_grammar:
+            platform_ids: set[str] = self.get_platform_identfiers(platform)
+        else:
+            platform_ids = set()
+
+        cache_key = (
+            self._get_raw_fingerprint(),
+            build_for,
+            build_on,
+            platform,
+            frozenset(platform_ids),
+            self._app_render_cache_key(),
+        )
+        if cached := self.__render_cache.get(cache_key):
+            emit.trace(f"Using cached render of platform {platform!r}")
+            cached_model, cached_vars = cached
+            self._project_vars = copy.deepcopy(cached_vars)
+            return cached_model.model_copy(deep=True)
+
         project = self._preprocess(
             build_for=build_for, build_on=build_on, platform=platform
         )
@@ -535,12 +698,6 @@ class ProjectService(base.AppService):
             platform=platform,
         )
 
-        # only provide platform ids when the 'for' variant is enabled
-        if self._app.enable_for_grammar:
-            platform_ids: set[str] = self.get_platform_identfiers(platform)
-        else:
-            platform_ids = set()
-
         # Process grammar.
         if "parts" in project:
             emit.debug(f"Processing grammar (on {build_on} for {build_for})")
@@ -565,6 +722,10 @@ class ProjectService(base.AppService):
                     f"'adopt-info' not set and required fields are missing: {missing}"
                 )
 
+        self.__render_cache[cache_key] = (
+            project_model.model_copy(deep=True),
+            copy.deepcopy(self._project_vars),
+        )
         return project_model
 
     def get_platform_identfiers(self, platform: str) -> set[str]:
@@ -18,32 +18,40 @@
 from __future__ import annotations
 
 import contextlib
+import dataclasses
 import enum
 import io
+import json
 import os
 import pathlib
 import pkgutil
+import secrets
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import urllib.request
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import craft_platforms
-import craft_providers
+import platformdirs
 from craft_cli import CraftError, emit
-from craft_providers import bases
-from craft_providers.actions.snap_installer import Snap
-from craft_providers.lxd import LXDProvider
-from craft_providers.multipass import MultipassProvider
 
 from craft_application import models, util
 from craft_application.services import base
-from craft_application.util import platforms, snap_config
+from craft_application.util import platforms, snap_config, step_cache
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable, Generator, Iterable, Sequence
 
+    import craft_providers
+    from craft_providers import bases
+    from craft_providers.actions.snap_installer import Snap
+    from craft_providers.lxd import LXDProvider
+    from craft_providers.multipass import MultipassProvider
+
     from craft_application.application import AppMetadata
     from craft_application.services import ServiceFactory
 
@@ -51,9 +59,183 @@ if TYPE_CHECKING:  # pragma: no cover
 DEFAULT_FORWARD_ENVIRONMENT_VARIABLES: Iterable[str] = ()
 IGNORE_CONFIG_ITEMS: Iterable[str] = ("build_for", "platform", "verbosity_level")
 
+# craft-providers is slow to import and isn't needed to check whether the
+# application is running in managed mode, so it's imported where it's used.
 _REQUESTED_SNAPS: dict[str, Snap] = {}
 """Additional snaps to be installed using provider."""
 
+_POOL_INDEX_VERSION = 1
+
+if sys.platform == "win32":  # pragma: no cover
+    _lock_file = None
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _process_exists(pid: int) -> bool:
+    """Check whether a process is running."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # The process exists, but belongs to another user.
+        return True
+    return True
+
+
+@dataclasses.dataclass
+class InstancePoolStats:
+    """Counters for an :class:`InstancePool` in the current process."""
+
+    hits: int = 0
+    """Instances handed out from the pool."""
+    misses: int = 0
+    """Requests for an instance that the pool couldn't fulfil."""
+    refills: int = 0
+    """Instances added to the pool."""
+    evictions: int = 0
+    """Instances removed from the pool because they exceeded its limits."""
+
+
+class InstancePool:
+    """An index of pre-launched, pre-provisioned instances.
+
+    Pooled instances are shared between runs of the application and are grouped by
+    a key, such as the provider, base and compatibility tag of the instance. The
+    index is a JSON file in ``directory``, guarded by a lock file so that several
+    processes can use the same pool. Creating and deleting the instances
+    themselves is left to the caller.
+
+    A reserved instance that a process didn't finish provisioning before it exited
+    is evicted by the next process to evict instances from the pool.
+
+    :param directory: The directory containing the pool's index.
+    :param size: The number of ready instances to keep for each key.
+    :param max_age: The number of seconds after which a pooled instance is evicted.
+    """
+
+    def __init__(self, directory: pathlib.Path, *, size: int, max_age: float) -> None:
+        self._directory = directory
+        self.size = size
+        self.max_age = max_age
+        self.stats = InstancePoolStats()
+
+    def claim(self, key: str) -> str | None:
+        """Take a ready instance out of the pool.
+
+        :param key: The key of the instance to claim.
+        :returns: The name of the instance, or None if none are ready.
+        """
+        with self._index() as instances:
+            ready = sorted(
+                (info["created"], name)
+                for name, info in instances.items()
+                if info["key"] == key and info["ready"]
+            )
+            if not ready:
+                self.stats.misses += 1
+                return None
+            _, name = ready[0]
+            del instances[name]
+        self.stats.hits += 1
+        return name
+
+    def reserve(self, key: str, prefix: str) -> str | None:
+        """Reserve a name for a new instance if the pool for a key isn't full.
+
+        Reserved instances count towards the pool's size until they are ready or
+        released, so that concurrent processes don't overfill the pool.
+
+        :param key: The key of the new instance.
+        :param prefix: A prefix for the instance's name.
+        :returns: The name of the new instance, or None if the pool is full.
+        """
+        with self._index() as instances:
+            if sum(info["key"] == key for info in instances.values()) >= self.size:
+                return None
+            name = f"{prefix}-{secrets.token_hex(4)}"
+            instances[name] = {
+                "key": key,
+                "created": time.time(),
+                "ready": False,
+                "pid": os.getpid(),
+            }
+        return name
+
+    def mark_ready(self, name: str) -> None:
+        """Mark a reserved instance as ready to be claimed."""
+        with self._index() as instances:
+            if name in instances:
+                instances[name]["ready"] = True
+                self.stats.refills += 1
+
+    def release(self, name: str) -> None:
+        """Remove an instance from the pool without claiming it."""
+        with self._index() as instances:
+            instances.pop(name, None)
+
+    def evict(self) -> list[str]:
+        """Remove instances that exceed the pool's limits.
+
+        Instances are evicted once they are older than the pool's maximum age, if
+        a key has more instances than the pool's size, or if they were reserved by
+        a process that exited before they were ready.
+
+        :returns: The names of the evicted instances, which should be deleted.
+        """
+        now = time.time()
+        evicted: list[str] = []
+        with self._index() as instances:
+            by_key: dict[str, list[tuple[float, str]]] = {}
+            for name, info in instances.items():
+                if now - info["created"] > self.max_age or self._is_abandoned(info):
+                    evicted.append(name)
+                else:
+                    by_key.setdefault(info["key"], []).append((info["created"], name))
+            for entries in by_key.values():
+                entries.sort(reverse=True)
+                evicted.extend(name for _, name in entries[self.size :])
+            for name in evicted:
+                del instances[name]
+        self.stats.evictions += len(evicted)
+        return evicted
+
+    @staticmethod
+    def _is_abandoned(info: dict[str, Any]) -> bool:
+        """Check whether a reserved instance's process exited before it was ready."""
+        pid = info.get("pid")
+        if info["ready"] or pid is None or pid == os.getpid():
+            return False
+        return not _process_exists(pid)
+
+    @contextlib.contextmanager
+    def _index(self) -> Generator[dict[str, dict[str, Any]], None, None]:
+        """Lock the pool's index and yield its instances for modification.
+
+        The index is saved when the context exits without an exception.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        index_path = self._directory / "index.json"
+        with (self._directory / "index.lock").open("a") as lock:
+            if _lock_file:
+                _lock_file(lock.fileno())
+            try:
+                data = json.loads(index_path.read_text())
+            except (OSError, ValueError):
+                data = {}
+            if not isinstance(data, dict) or data.get("version") != _POOL_INDEX_VERSION:
+                data = {"version": _POOL_INDEX_VERSION, "instances": {}}
+            instances: dict[str, dict[str, Any]] = data["instances"]
+            yield instances
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self._directory, delete=False
+            ) as temp_file:
+                json.dump(data, temp_file)
+            pathlib.Path(temp_file.name).replace(index_path)
+
 
 class ProviderService(base.AppService):
     """Manager for craft_providers in an application.
@@ -87,6 +269,11 @@ class ProviderService(base.AppService):
         self._pack_state: models.PackState = models.PackState(
             artifact=None, resources=None
         )
+        self._instance_pool: InstancePool | None = None
+        self._pool_threads: list[threading.Thread] = []
+        """Background threads that change the instance pool."""
+        # Guards the provider and instance pool when instances launch in parallel.
+        self._lock = threading.RLock()
 
     @property
     def compatibility_tag(self) -> str:
@@ -106,11 +293,17 @@ class ProviderService(base.AppService):
                 self.environment[name] = os.getenv(name)
 
         app_upper = self._app.name.upper()
-        for config_item, value in self._services.get("config").get_all().items():
+        config = self._services.get("config")
+        for config_item, value in config.get_all().items():
             if config_item in IGNORE_CONFIG_ITEMS or value is None:
                 continue
             value_out = value.name if isinstance(value, enum.Enum) else str(value)
             self.environment[f"{app_upper}_{config_item.upper()}"] = value_out
+        # Pass the fully resolved configuration so the managed instance doesn't
+        # need to resolve it again.
+        self.environment[platforms.ENVIRONMENT_CRAFT_RESOLVED_CONFIG] = (
+            config.dump_snapshot(exclude=IGNORE_CONFIG_ITEMS)
+        )
 
         for scheme, value in urllib.request.getproxies().items():
             self.environment[f"{scheme.lower()}_proxy"] = value
@@ -138,6 +331,8 @@ class ProviderService(base.AppService):
                     "as a snap."
                 )
 
+            from craft_providers.actions.snap_installer import Snap  # noqa: PLC0415
+
             self.snaps.append(Snap(name=name, channel=channel, classic=True))
 
     @contextlib.contextmanager
@@ -168,43 +363,208 @@ class ProviderService(base.AppService):
             project_name = self._project.name
         instance_name = self._get_instance_name(work_dir, build_info, project_name)
         emit.debug(f"Preparing managed instance {instance_name!r}")
+        from craft_providers import bases  # noqa: PLC0415
+
         base_name = bases.BaseName(
             name=build_info.build_base.distribution,
             version=build_info.build_base.series,
         )
         base = self.get_base(base_name, instance_name=instance_name, **kwargs)
-        provider = self.get_provider(name=self.__provider_name)
-
-        provider.ensure_provider_is_available()
+        with self._lock:
+            provider = self.get_provider(name=self.__provider_name)
+            provider.ensure_provider_is_available()
         shutdown_delay = self._services.get("config").get("idle_mins")
 
         if clean_existing:
             self._clean_instance(provider, work_dir, build_info, project_name)
 
+        # Pooled instances are generic, so they can't be used for clean instances,
+        # instances that don't come from a base instance or customized bases.
+        pool = None
+        if use_base_instance and not clean_existing and not kwargs:
+            pool = self.get_instance_pool()
+        pooled_name = None
+        if pool:
+            pool_key = f"{provider.name}:{base.alias.value}:{base.compatibility_tag}"
+            pooled_name = pool.claim(pool_key)
+            if pooled_name:
+                emit.debug(f"Using instance {pooled_name!r} from the instance pool")
+                instance_name = pooled_name
+            self._refill_instance_pool(
+                pool,
+                pool_key,
+                provider,
+                base_name,
+                work_dir=work_dir,
+                project_name=project_name,
+                allow_unstable=allow_unstable,
+            )
+
         emit.progress(f"Launching managed {base_name[0]} {base_name[1]} instance...")
-        with provider.launched_environment(
-            project_name=project_name,
-            project_path=work_dir,
-            instance_name=instance_name,
-            base_configuration=base,
-            allow_unstable=allow_unstable,
-            use_base_instance=use_base_instance,
-            prepare_instance=prepare_instance,
-            shutdown_delay_mins=shutdown_delay,
-        ) as instance:
-            instance.mount(
-                host_source=work_dir,
-                # Ignore argument type until craft-providers accepts PurePosixPaths
-                # https://github.com/canonical/craft-providers/issues/315
-                target=self._app.managed_instance_project_path,  # type: ignore[arg-type]
+        try:
+            with provider.launched_environment(
+                project_name=project_name,
+                project_path=work_dir,
+                instance_name=instance_name,
+                base_configuration=base,
+                allow_unstable=allow_unstable,
+                use_base_instance=use_base_instance,
+                prepare_instance=None if pooled_name else prepare_instance,
+                shutdown_delay_mins=shutdown_delay,
+            ) as instance:
+                if pooled_name and prepare_instance:
+                    # The pooled instance was set up before it was requested.
+                    prepare_instance(instance)
+                instance.mount(
+                    host_source=work_dir,
+                    # Ignore argument type until craft-providers accepts PurePosixPaths
+                    # https://github.com/canonical/craft-providers/issues/315
+                    target=self._app.managed_instance_project_path,  # type: ignore[arg-type]
+                )
+                self._services.get("state").configure_instance(instance)
+                if self._services.get("config").get("step_cache"):
+                    self._mount_step_cache(instance)
+                emit.debug("Instance launched and working directory mounted")
+                self._setup_instance_bashrc(instance)
+                try:
+                    yield instance
+                finally:
+                    self._capture_logs_from_instance(instance)
+        finally:
+            if pooled_name:
+                # Instances from the pool are single-use.
+                self._delete_instance(provider, pooled_name)
+            if pool:
+                emit.debug(f"Instance pool statistics: {pool.stats}")
+
+    @property
+    def step_cache_dir(self) -> pathlib.Path:
+        """The directory of the host's step cache, shared with managed instances."""
+        return platformdirs.user_cache_path(self._app.name) / "steps"
+
+    def _mount_step_cache(self, instance: craft_providers.Executor) -> None:
+        """Mount the host's step cache into an instance.
+
+        This lets builds in different instances, which are otherwise discarded
+        with the instance, reuse each other's outputs.
+        """
+        self.step_cache_dir.mkdir(parents=True, exist_ok=True)
+        emit.debug(
+            f"Mounting step cache {str(self.step_cache_dir)!r} "
+            f"to {str(step_cache.MANAGED_CACHE_DIR)!r}"
+        )
+        instance.mount(
+            host_source=self.step_cache_dir,
+            target=step_cache.MANAGED_CACHE_DIR,  # type: ignore[arg-type]
+        )
+
+    @property
+    def instance_pool_dir(self) -> pathlib.Path:
+        """The directory containing the index of the warm instance pool."""
+        return platformdirs.user_cache_path(self._app.name) / "instance-pool"
+
+    def get_instance_pool(self) -> InstancePool | None:
+        """Get the warm instance pool.
+
+        The pool is opt-in, and is enabled by setting the ``instance_pool_size``
+        configuration item to the number of ready instances to keep for each base.
+
+        :returns: The instance pool, or None if it's disabled.
+        """
+        with self._lock:
+            if self._instance_pool is None:
+                config = self._services.get("config")
+                size = config.get("instance_pool_size")
+                if not size:
+                    return None
+                max_age_hours = config.get("instance_pool_max_age_hours")
+                self._instance_pool = InstancePool(
+                    self.instance_pool_dir, size=size, max_age=max_age_hours * 3600
+                )
+            return self._instance_pool
+
+    def _refill_instance_pool(
+        self,
+        pool: InstancePool,
+        pool_key: str,
+        provider: craft_providers.Provider,
+        base_name: bases.BaseName,
+        *,
+        work_dir: pathlib.Path,
+        project_name: str,
+        allow_unstable: bool,
+    ) -> None:
+        """Evict expired pooled instances and provision new ones in the background."""
+        for name in pool.evict():
+            emit.debug(f"Evicting instance {name!r} from the instance pool")
+            self._start_pool_thread(self._delete_instance, provider, name)
+        while name := pool.reserve(pool_key, prefix=f"{self._app.name}-pool"):
+            emit.debug(f"Provisioning instance {name!r} for the instance pool")
+            self._start_pool_thread(
+                self._provision_pooled_instance,
+                pool,
+                provider,
+                base_name,
+                name,
+                work_dir=work_dir,
+                project_name=project_name,
+                allow_unstable=allow_unstable,
+            )
+
+    def _start_pool_thread(
+        self, target: Callable[..., None], *args: Any, **kwargs: Any
+    ) -> None:
+        """Run a function on a background thread.
+
+        The thread doesn't keep the application running. Instances it doesn't
+        finish provisioning are evicted from the pool by the next run.
+        """
+        thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
+        self._pool_threads.append(thread)
+        thread.start()
+
+    def _provision_pooled_instance(
+        self,
+        pool: InstancePool,
+        provider: craft_providers.Provider,
+        base_name: bases.BaseName,
+        name: str,
+        *,
+        work_dir: pathlib.Path,
+        project_name: str,
+        allow_unstable: bool,
+    ) -> None:
+        """Launch and set up an instance, then make it available in the pool."""
+        try:
+            base = self.get_base(base_name, instance_name=name)
+            with provider.launched_environment(
+                project_name=project_name,
+                project_path=work_dir,
+                instance_name=name,
+                base_configuration=base,
+                allow_unstable=allow_unstable,
+                use_base_instance=True,
+            ):
+                pass
+        except Exception as exc:  # noqa: BLE001 (a failed refill mustn't fail the build)
+            emit.debug(f"Could not provision pooled instance {name!r}: {exc}")
+            pool.release(name)
+            self._delete_instance(provider, name)
+        else:
+            pool.mark_ready(name)
+
+    @staticmethod
+    def _delete_instance(provider: craft_providers.Provider, name: str) -> None:
+        """Delete an instance, warning rather than failing if it can't be deleted."""
+        try:
+            provider.create_environment(instance_name=name).delete()
+        except Exception as exc:  # noqa: BLE001
+            emit.debug(f"Could not delete instance {name!r}: {exc}")
+            emit.progress(
+                f"Could not delete instance {name!r}. It may need to be deleted "
+                "manually.",
+                permanent=True,
             )
-            self._services.get("state").configure_instance(instance)
-            emit.debug("Instance launched and working directory mounted")
-            self._setup_instance_bashrc(instance)
-            try:
-                yield instance
-            finally:
-                self._capture_logs_from_instance(instance)
 
     def get_base(
         self,
@@ -222,6 +582,8 @@ class ProviderService(base.AppService):
         This method should be overridden by a specific application if it intends to
         use base names that don't align to a "distro:version" naming convention.
         """
+        from craft_providers import bases  # noqa: PLC0415
+
         alias = bases.get_base_alias(base_name)
         base_class = bases.get_base_from_alias(alias)
         if base_class is bases.BuilddBase:
@@ -259,9 +621,12 @@ class ProviderService(base.AppService):
 
         :raises CraftError: If already running in managed mode.
         """
-        if self._provider is not None:
+        with self._lock:
+            if self._provider is None:
+                self._provider = self._choose_provider(name)
             return self._provider
 
+    def _choose_provider(self, name: str | None) -> craft_providers.Provider:
         if self.is_managed():
             raise CraftError("Cannot nest managed environments.")
 
@@ -288,8 +653,7 @@ class ProviderService(base.AppService):
             emit.debug("Using default provider 'multipass' on non-linux system.")
             chosen_provider = "multipass"
 
-        self._provider = self._get_provider_by_name(chosen_provider)
-        return self._provider
+        return self._get_provider_by_name(chosen_provider)
 
     def _get_provider_from_snap_config(self) -> str | None:
         """Get the provider stored in the snap config.
@@ -354,11 +718,15 @@ class ProviderService(base.AppService):
 
     def _get_lxd_provider(self) -> LXDProvider:
         """Get the LXD provider for this manager."""
+        from craft_providers.lxd import LXDProvider  # noqa: PLC0415
+
         lxd_remote = self._services.config.get("lxd_remote")
         return LXDProvider(lxd_project=self._app.name, lxd_remote=lxd_remote)
 
     def _get_multipass_provider(self) -> MultipassProvider:
         """Get the Multipass provider for this manager."""
+        from craft_providers.multipass import MultipassProvider  # noqa: PLC0415
+
         return MultipassProvider()
 
     def _capture_logs_from_instance(self, instance: craft_providers.Executor) -> None:
@@ -423,12 +791,17 @@ class ProviderService(base.AppService):
         build_info: craft_platforms.BuildInfo,
         enable_fetch_service: bool,  # noqa: FBT001
         command: Sequence[str] = (),
+        *,
+        output_prefix: str | None = None,
     ) -> None:
         """Create a managed instance and run a command in it.
 
         :param build_info: The BuildInfo that defines what instance to use.
         :enable_fetch_service: Whether to enable the fetch service.
         :command: The command to run. Defaults to the current command.
+        :output_prefix: If set, the command's output is emitted line by line with
+          this prefix rather than pausing the emitter, so that the output of
+          instances running at the same time can be told apart.
         """
         if not command:
             command = [self._app.name, *sys.argv[1:]]
@@ -464,15 +837,26 @@ class ProviderService(base.AppService):
             emit.debug(f"Running in instance: {command}")
             self._services.get("proxy").finalize_instance_configuration(instance)
             try:
-                with emit.pause():
-                    # Pyright doesn't fully understand craft_providers's CompletedProcess.
-                    instance.execute_run(  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                        list(command),
+                if output_prefix is not None:
+                    util.execute_prefixed(
+                        instance,
+                        command,
+                        prefix=output_prefix,
                         cwd=self._app.managed_instance_project_path,
-                        check=True,
                         env=env,
                     )
+                else:
+                    with emit.pause():
+                        # Pyright doesn't fully understand craft_providers's CompletedProcess.
+                        instance.execute_run(  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+                            list(command),
+                            cwd=self._app.managed_instance_project_path,
+                            check=True,
+                            env=env,
+                        )
             except subprocess.CalledProcessError as exc:
+                import craft_providers  # noqa: PLC0415
+
                 raise craft_providers.ProviderError(
                     f"Failed to run {self._app.name} in instance"
                 ) from exc
@@ -15,35 +15,48 @@
 
 from __future__ import annotations
 
-import io
 import pathlib
-import subprocess
-from typing import TYPE_CHECKING, final
+import threading
+from typing import TYPE_CHECKING, NamedTuple, cast, final
 
 from craft_cli import emit
 
+from craft_application import util
+
 from . import base
 
 if TYPE_CHECKING:
     import craft_providers
 
+    from craft_application.application import AppMetadata
+    from craft_application.services import ServiceFactory
+
 # The path to the proxy certificate inside the build instance.
 _PROXY_CERT_INSTANCE_PATH = pathlib.Path(
     "/usr/local/share/ca-certificates/local-ca.crt"
 )
+_APT_STEP = "Configuring Apt"
 
 
-class ProxyService(base.AppService):
-    """A service for handling proxy configuration."""
-
-    __proxy_cert: pathlib.Path
+class _ProxyConfig(NamedTuple):
+    proxy_cert: pathlib.Path
     """Path to the CA certificate on the host."""
-
-    __http_proxy: str
+    http_proxy: str
     """The http proxy to use."""
 
-    __is_configured: bool = False
-    """True if the proxy service has been configured."""
+
+class ProxyService(base.AppService):
+    """A service for handling proxy configuration.
+
+    Instances may be prepared in parallel threads, each with its own proxy, so
+    the configuration set by a thread other than the main thread only applies to
+    that thread. Other threads use the main thread's configuration.
+    """
+
+    def __init__(self, app: AppMetadata, services: ServiceFactory) -> None:
+        super().__init__(app, services)
+        self.__config: _ProxyConfig | None = None
+        self.__thread_config = threading.local()
 
     @final
     def configure(self, proxy_cert: pathlib.Path, http_proxy: str) -> None:
@@ -52,9 +65,28 @@ class ProxyService(base.AppService):
         :param proxy_cert: The path to the proxy certificate to install in the instance.
         :param http_proxy: The proxy url to set in the instance.
         """
-        self.__proxy_cert = proxy_cert
-        self.__http_proxy = http_proxy
-        self.__is_configured = True
+        config = _ProxyConfig(proxy_cert, http_proxy)
+        if threading.current_thread() is threading.main_thread():
+            self.__config = config
+        else:
+            self.__thread_config.config = config
+
+    @property
+    def __current_config(self) -> _ProxyConfig | None:
+        return getattr(self.__thread_config, "config", None) or self.__config
+
+    @property
+    def __is_configured(self) -> bool:
+        """True if the proxy service has been configured."""
+        return self.__current_config is not None
+
+    @property
+    def __proxy_cert(self) -> pathlib.Path:
+        return cast(_ProxyConfig, self.__current_config).proxy_cert
+
+    @property
+    def __http_proxy(self) -> str:
+        return cast(_ProxyConfig, self.__current_config).http_proxy
 
     @final
     def configure_instance(self, instance: craft_providers.Executor) -> dict[str, str]:
@@ -72,9 +104,19 @@ class ProxyService(base.AppService):
 
         emit.progress("Configuring proxy in instance")
 
-        self._install_certificate(instance)
-        self._configure_apt(instance)
-        self._configure_pip(instance)
+        script = util.ProvisioningScript()
+        self._install_certificate(script)
+        self._configure_apt(script)
+        self._configure_pip(script)
+        results = script.run(instance)
+
+        if any(
+            result.name == _APT_STEP and result.status == "skipped"
+            for result in results
+        ):
+            emit.debug(
+                "Not configuring the proxy for apt because apt isn't available in the instance."
+            )
 
         return self._env
 
@@ -93,7 +135,9 @@ class ProxyService(base.AppService):
 
         emit.progress("Finalizing instance configuration")
 
-        self._configure_snapd(instance)
+        script = util.ProvisioningScript()
+        self._configure_snapd(script)
+        script.run(instance)
 
     @property
     def _env(self) -> dict[str, str]:
@@ -109,66 +153,38 @@ class ProxyService(base.AppService):
             "GOPROXY": "direct",
         }
 
-    def _configure_pip(self, instance: craft_providers.Executor) -> None:
-        emit.progress("Configuring pip")
-
-        self._execute_run(instance, ["mkdir", "-p", "/root/.pip"])
+    def _configure_pip(self, script: util.ProvisioningScript) -> None:
+        step = script.add_step("Configuring pip")
         pip_config = b"[global]\ncert=/usr/local/share/ca-certificates/local-ca.crt"
-        instance.push_file_io(
-            destination=pathlib.Path("/root/.pip/pip.conf"),
-            content=io.BytesIO(pip_config),
-            file_mode="0644",
-        )
+        step.push_file(pathlib.Path("/root/.pip/pip.conf"), pip_config, "0644")
 
-    def _configure_snapd(self, instance: craft_providers.Executor) -> None:
+    def _configure_snapd(self, script: util.ProvisioningScript) -> None:
         """Configure snapd to use the proxy and see our certificate.
 
         Note: This must be called after _install_certificate(), to ensure that
         when the snapd restart happens the new cert is there.
         """
-        emit.progress("Configuring snapd")
-        self._execute_run(instance, ["systemctl", "restart", "snapd"])
+        step = script.add_step("Configuring snapd")
+        step.run(["systemctl", "restart", "snapd"])
         for config in ("proxy.http", "proxy.https"):
-            self._execute_run(
-                instance, ["snap", "set", "system", f"{config}={self.__http_proxy}"]
-            )
+            step.run(["snap", "set", "system", f"{config}={self.__http_proxy}"])
 
-    def _configure_apt(self, instance: craft_providers.Executor) -> None:
+    def _configure_apt(self, script: util.ProvisioningScript) -> None:
         """Configure the proxy for apt.
 
-        This function is a no-op on systems without apt.
+        The step is skipped on systems without apt.
         """
-        try:
-            self._execute_run(instance, ["test", "-d", "/etc/apt"])
-        except subprocess.CalledProcessError:
-            emit.debug(
-                "Not configuring the proxy for apt because apt isn't available in the instance."
-            )
-            return
-
-        emit.progress("Configuring Apt")
+        step = script.add_step(_APT_STEP, condition=["test", "-d", "/etc/apt"])
         apt_config = f'Acquire::http::Proxy "{self.__http_proxy}";\n'
         apt_config += f'Acquire::https::Proxy "{self.__http_proxy}";\n'
 
-        instance.push_file_io(
-            destination=pathlib.Path("/etc/apt/apt.conf.d/99proxy"),
-            content=io.BytesIO(apt_config.encode("utf-8")),
-            file_mode="0644",
-        )
-        self._execute_run(instance, ["/bin/rm", "-Rf", "/var/lib/apt/lists"])
-
-        emit.progress("Refreshing Apt package listings")
-        self._execute_run(instance, ["apt", "update"])
-
-    def _execute_run(
-        self, instance: craft_providers.Executor, cmd: list[str]
-    ) -> subprocess.CompletedProcess[str]:
-        return instance.execute_run(
-            cmd, check=True, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        step.push_file(
+            pathlib.Path("/etc/apt/apt.conf.d/99proxy"), apt_config.encode("utf-8")
         )
+        step.run(["/bin/rm", "-Rf", "/var/lib/apt/lists"])
+        step.run(["apt", "update"])
 
-    def _install_certificate(self, instance: craft_providers.Executor) -> None:
-        emit.progress("Installing certificate")
+    def _install_certificate(self, script: util.ProvisioningScript) -> None:
         emit.debug(
             f"Installing certificate from {str(self.__proxy_cert)!r} to "
             f"{str(_PROXY_CERT_INSTANCE_PATH)!r} in the instance."
@@ -183,15 +199,7 @@ class ProxyService(base.AppService):
                 f"Proxy certificate {str(self.__proxy_cert)!r} isn't a file."
             )
 
-        self._execute_run(
-            instance,
-            ["mkdir", "-p", str(_PROXY_CERT_INSTANCE_PATH.parent)],
-        )
-        instance.push_file(
-            source=self.__proxy_cert,
-            destination=_PROXY_CERT_INSTANCE_PATH,
-        )
+        step = script.add_step("Installing certificate")
+        step.push_file(_PROXY_CERT_INSTANCE_PATH, self.__proxy_cert.read_bytes())
         # Update the certificates db
-        self._execute_run(
-            instance, ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"]
-        )
+        step.run(["/usr/sbin/update-ca-certificates"])
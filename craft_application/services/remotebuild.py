@@ -19,12 +19,12 @@ from __future__ import annotations
 
 import contextlib
 import datetime
-import itertools
 import os
 import pathlib
 import time
 import urllib.parse
-from typing import TYPE_CHECKING, Any, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from urllib import parse
 
 import craft_cli
@@ -45,8 +45,21 @@ if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Collection, Iterable, Mapping
 
     from craft_application import AppMetadata, ServiceFactory
+    from craft_application.git import PushProgress
 
 DEFAULT_POLL_INTERVAL = 30
+MIN_POLL_INTERVAL = 10
+"""The shortest time between polls, used when builds are about to finish."""
+MAX_POLL_INTERVAL = 300
+"""The longest time between polls, used when builds have been queued for a while."""
+_QUEUED_BACKOFF = 1.5
+
+
+class _BuildDownloads(NamedTuple):
+    """The files of a stopped build that are downloading in the background."""
+
+    log: Future[pathlib.Path] | None
+    artifacts: list[Future[pathlib.Path]]
 
 
 class RemoteBuildService(base.AppService):
@@ -56,6 +69,14 @@ class RemoteBuildService(base.AppService):
     lp: launchpad.Launchpad
     _deadline: int | None = None
     """The deadline for the builds. Raises a TimeoutError if we surpass this."""
+    pack_compression_level: int | None = None
+    """The zlib compression level git uses when packing objects to push.
+
+    Lower levels trade upload size for packing speed. If unset, git's default
+    is used.
+    """
+    pack_threads: int | None = None
+    """The number of threads git uses to pack objects, or None for git's default."""
 
     def __init__(self, app: AppMetadata, services: ServiceFactory) -> None:
         super().__init__(app=app, services=services)
@@ -69,6 +90,10 @@ class RemoteBuildService(base.AppService):
         self._recipe: launchpad.models.recipe.BaseRecipe = None  # type: ignore[assignment]
         self._builds: Collection[launchpad.models.Build] = []
         self._project_name: str | None = None
+        self._snapshot: utils.ProjectSnapshot | None = None
+        self._download_dir: pathlib.Path | None = None
+        self._download_executor: ThreadPoolExecutor | None = None
+        self._downloads: dict[str, _BuildDownloads] = {}
 
     def setup(self) -> None:
         """Set up the remote builder."""
@@ -79,6 +104,18 @@ class RemoteBuildService(base.AppService):
         """The filepath to the Launchpad credentials."""
         return platformdirs.user_data_path(self._app.name) / "launchpad-credentials"
 
+    @property
+    def hash_cache_dir(self) -> pathlib.Path:
+        """The directory in which project file digests are cached between runs."""
+        return platformdirs.user_cache_path(self._app.name) / "remote-build" / "hashes"
+
+    @property
+    def launchpad_cache_dir(self) -> pathlib.Path:
+        """The directory in which Launchpad responses are cached between runs."""
+        return (
+            platformdirs.user_cache_path(self._app.name) / "remote-build" / "launchpad"
+        )
+
     # region Public API
     # Commands will call a subset of these methods, generally in order.
     def set_project(self, name: str) -> None:
@@ -114,6 +151,20 @@ class RemoteBuildService(base.AppService):
         """Set the deadline to a certain number of seconds in the future."""
         self._deadline = time.monotonic_ns() + (seconds_in_future * 10**9)
 
+    def snapshot_project(self, project_dir: pathlib.Path) -> utils.ProjectSnapshot:
+        """Take a snapshot of the project directory, computing its build id.
+
+        The snapshot is kept and reused by :meth:`start_builds` for the same
+        directory, so the project only needs to be hashed once per remote build.
+
+        This method requires a project to be loaded.
+        """
+        project = self._services.get("project").get()
+        self._snapshot = utils.get_project_snapshot(
+            self._app.name, project.name, project_dir, cache_dir=self.hash_cache_dir
+        )
+        return self._snapshot
+
     def start_builds(
         self, project_dir: pathlib.Path, architectures: Collection[str] | None = None
     ) -> Collection[launchpad.models.Build]:
@@ -124,11 +175,12 @@ class RemoteBuildService(base.AppService):
         if self._builds:
             raise ValueError("Cannot start builds if already running builds")
 
-        project = self._services.get("project").get()
-
         check_git_repo_for_remote_build(project_dir)
 
-        self._name = utils.get_build_id(self._app.name, project.name, project_dir)
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.project_dir != project_dir.resolve():
+            snapshot = self.snapshot_project(project_dir)
+        self._name = snapshot.build_id
         self._lp_project = self._ensure_project()
         _, self._repository = self._ensure_repository(project_dir)
         self._recipe = self._ensure_recipe(
@@ -150,22 +202,53 @@ class RemoteBuildService(base.AppService):
         return self._builds
 
     def monitor_builds(
-        self, poll_interval: float = DEFAULT_POLL_INTERVAL
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        *,
+        download_dir: pathlib.Path | None = None,
     ) -> Iterable[Mapping[str, launchpad.models.BuildState]]:
         """Monitor builds.
 
-        Exits once all builds have stopped. A return does not mean success.
+        Yields the states of all builds once, then again each time any build
+        changes state. Exits once all builds have stopped. A return does not mean
+        success.
+
+        The time between polls adapts to the builds. It backs off while all
+        unfinished builds are queued and shortens as running builds approach
+        their estimated finish time. Otherwise, ``poll_interval`` is used.
+
+        :param poll_interval: The default number of seconds between polls.
+        :param download_dir: If set, the log and artifacts of each build start
+            downloading into this directory in the background as soon as the build
+            stops. :meth:`fetch_logs` and :meth:`fetch_artifacts` for the same
+            directory then wait for these downloads rather than starting new ones.
         """
         if not self._is_setup:
             raise RuntimeError(
                 "RemoteBuildService must be set up using start_builds or resume_builds before monitoring builds."
             )
+        previous_states: Mapping[str, launchpad.models.BuildState] | None = None
+        queued_polls = 0
+        if download_dir is not None and download_dir != self._download_dir:
+            self._download_dir = download_dir
+            self._downloads = {}
         while self._deadline is None or time.monotonic_ns() < self._deadline:
             states = self._get_build_states()
-            yield states
+            if download_dir is not None:
+                self._start_downloads(states)
+            if states != previous_states:
+                yield states
+                previous_states = dict(states)
+                queued_polls = 0
             if all(status.is_stopping_or_stopped for status in states.values()):
                 return
-            time.sleep(poll_interval)
+            interval = self._get_poll_interval(states, poll_interval, queued_polls)
+            if _all_queued(states):
+                queued_polls += 1
+            if self._deadline is not None:
+                remaining = (self._deadline - time.monotonic_ns()) / 10**9
+                interval = max(0, min(interval, remaining))
+            time.sleep(interval)
 
         yield self._get_build_states()
         raise TimeoutError("Monitoring builds timed out.")
@@ -182,16 +265,25 @@ class RemoteBuildService(base.AppService):
             )
         logs: dict[str, pathlib.Path | None] = {}
         log_downloads: dict[str, pathlib.Path] = {}
-        fetch_time = datetime.datetime.now().isoformat(timespec="seconds")
+        started: dict[str, Future[pathlib.Path]] = {}
         for build in self._builds:
+            downloads = self._get_started_downloads(build, output_dir)
+            if downloads is not None:
+                if downloads.log is not None:
+                    started[build.arch_tag] = downloads.log
+                else:
+                    logs[build.arch_tag] = None
+                continue
             url = build.build_log_url
             if not url:
                 logs[build.arch_tag] = None
                 continue
-            filename = f"{self._name}_{build.arch_tag}_{fetch_time}.txt"
-            logs[build.arch_tag] = output_dir / filename
-            log_downloads[url] = output_dir / filename
+            log_path = output_dir / self._get_log_name(build)
+            logs[build.arch_tag] = log_path
+            log_downloads[url] = log_path
         self.request.download_files_with_progress(log_downloads)
+        for arch, future in started.items():
+            logs[arch] = future.result()
         return logs
 
     def fetch_artifacts(self, output_dir: pathlib.Path) -> Collection[pathlib.Path]:
@@ -201,10 +293,20 @@ class RemoteBuildService(base.AppService):
                 "RemoteBuildService must be set up using start_builds or resume_builds before fetching artifacts."
             )
         artifact_downloads: dict[str, pathlib.Path] = {}
-        for url in self._get_artifact_urls():
-            filename = pathlib.PurePosixPath(urllib.parse.urlparse(url).path).name
-            artifact_downloads[url] = output_dir / filename
-        return self.request.download_files_with_progress(artifact_downloads).values()
+        started: list[Future[pathlib.Path]] = []
+        for build in self._builds:
+            downloads = self._get_started_downloads(build, output_dir)
+            if downloads is not None:
+                started.extend(downloads.artifacts)
+                continue
+            for url in build.get_artifact_urls():
+                filename = pathlib.PurePosixPath(urllib.parse.urlparse(url).path).name
+                artifact_downloads[url] = output_dir / filename
+        artifacts = list(
+            self.request.download_files_with_progress(artifact_downloads).values()
+        )
+        artifacts.extend(future.result() for future in started)
+        return artifacts
 
     def cancel_builds(self) -> None:
         """Cancel all running builds for a recipe."""
@@ -219,11 +321,15 @@ class RemoteBuildService(base.AppService):
             # We have to try-except in a loop here.
             except launchpad.errors.BuildError as exc:  # noqa: PERF203
                 cancel_failed.append(exc.args[0])
+        if self._download_executor is not None:
+            self._download_executor.shutdown(wait=False, cancel_futures=True)
         if cancel_failed:
             raise errors.CancelFailedError(cancel_failed)
 
     def cleanup(self) -> None:
         """Clean up the recipe and repository."""
+        if self._download_executor is not None:
+            self._download_executor.shutdown()
         # Pyright complains about these comparisons because we're doing hacky things to
         # the type system.
         if self._recipe is not None:  # pyright: ignore[reportUnnecessaryComparison]
@@ -250,6 +356,7 @@ class RemoteBuildService(base.AppService):
             return launchpad.Launchpad.login(
                 f"{self._app.name}/{self._app.version}",
                 root=self._services.config.get("launchpad_instance"),
+                cache_dir=self.launchpad_cache_dir,
                 credentials_file=credentials_filepath,
             )
 
@@ -289,7 +396,7 @@ class RemoteBuildService(base.AppService):
 
         try:
             local_repository = GitRepo(work_tree.repo_dir)
-            local_repository.push_url(push_url.geturl(), "main", push_tags=True)
+            self._push(local_repository, push_url.geturl())
         except GitError as git_error:
             raise RemoteBuildGitError(
                 cast(str, git_error.details),
@@ -297,6 +404,38 @@ class RemoteBuildService(base.AppService):
         else:
             return work_tree, lp_repository
 
+    def _push(self, local_repository: GitRepo, url: str) -> None:
+        """Push the local repository, showing the upload progress."""
+        with contextlib.ExitStack() as stack:
+            progress_bar: Any = None
+            phase = ""
+            sent = 0
+
+            def _on_progress(progress: PushProgress) -> None:
+                nonlocal progress_bar, phase, sent
+                if progress.phase != "Writing objects":
+                    if progress.phase != phase:
+                        craft_cli.emit.progress(f"{progress.phase}...")
+                    phase = progress.phase
+                    return
+                if progress_bar is None:
+                    progress_bar = stack.enter_context(
+                        craft_cli.emit.progress_bar(
+                            "Uploading project", progress.total, delta=True
+                        )
+                    )
+                progress_bar.advance(progress.current - sent)
+                sent = progress.current
+
+            local_repository.push_url(
+                url,
+                "main",
+                push_tags=True,
+                progress=_on_progress,
+                compression_level=self.pack_compression_level,
+                threads=self.pack_threads,
+            )
+
     def _get_push_url(
         self, lp_repository: launchpad.models.GitRepository, token: str
     ) -> urllib.parse.ParseResult:
@@ -340,7 +479,8 @@ class RemoteBuildService(base.AppService):
         **kwargs: Any,
     ) -> launchpad.models.Recipe:
         """Create a new recipe for the given repository."""
-        repository.lp_refresh()  # Prevents a race condition on new repositories.
+        # Refreshing prevents a race condition on new repositories.
+        repository.prefetch()
 
         # public repos use https for backward compatibility
         url = repository.git_ssh_url if repository.private else repository.git_https_url
@@ -387,17 +527,97 @@ class RemoteBuildService(base.AppService):
         return {build.arch_tag: build.get_state() for build in self._builds}
 
     def _refresh_builds(self) -> None:
-        """Refresh the data for builds from Launchpad."""
+        """Refresh the data for builds from Launchpad.
+
+        Unfinished builds are refreshed together from the recipe's pending builds.
+        Builds that have left that collection are refreshed individually, once.
+        """
+        pending = {
+            build.self_link: build for build in self._recipe.get_pending_builds()
+        }
+        builds: list[launchpad.models.Build] = []
         for build in self._builds:
-            build.lp_refresh()
+            if build.self_link in pending:
+                builds.append(pending[build.self_link])
+                continue
+            if not build.get_state().is_stopped:
+                build.lp_refresh()
+            builds.append(build)
+        self._builds = builds
 
-    def _get_artifact_urls(self) -> Collection[str]:
-        """Get the locations of all build artifacts."""
-        return list(
-            itertools.chain.from_iterable(
-                build.get_artifact_urls() for build in self._builds
-            )
-        )
+    def _get_poll_interval(
+        self,
+        states: Mapping[str, launchpad.models.BuildState],
+        poll_interval: float,
+        queued_polls: int,
+    ) -> float:
+        """Get the number of seconds to wait before polling builds again.
+
+        :param states: The current states of the builds.
+        :param poll_interval: The default poll interval.
+        :param queued_polls: The number of consecutive polls in which every
+            unfinished build was queued.
+        """
+        if _all_queued(states):
+            max_interval = max(poll_interval, MAX_POLL_INTERVAL)
+            return min(poll_interval * _QUEUED_BACKOFF**queued_polls, max_interval)
+
+        estimates = [
+            estimate
+            for build in self._builds
+            if build.get_state().is_running
+            and isinstance(estimate := build.get_estimated_finish(), datetime.datetime)
+        ]
+        if not estimates:
+            return poll_interval
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        remaining = (min(estimates) - now).total_seconds()
+        return max(min(poll_interval, remaining), min(poll_interval, MIN_POLL_INTERVAL))
+
+    def _get_log_name(self, build: launchpad.models.Build) -> str:
+        """Get the file name for a build's log."""
+        fetch_time = datetime.datetime.now().isoformat(timespec="seconds")
+        return f"{self._name}_{build.arch_tag}_{fetch_time}.txt"
+
+    def _start_downloads(
+        self, states: Mapping[str, launchpad.models.BuildState]
+    ) -> None:
+        """Start downloading the log and artifacts of newly stopped builds.
+
+        The file URLs are fetched from Launchpad on this thread, as the Launchpad
+        client isn't thread-safe. Only the downloads run in the background.
+        """
+        if self._download_dir is None:
+            return
+        for build in self._builds:
+            arch = build.arch_tag
+            if arch in self._downloads or not states[arch].is_stopped:
+                continue
+            if self._download_executor is None:
+                self._download_executor = ThreadPoolExecutor(
+                    max_workers=self.request.max_download_workers,
+                    thread_name_prefix="remote-build-download",
+                )
+            submit = self._download_executor.submit
+            craft_cli.emit.debug(f"Downloading the files of the {arch} build.")
+            log_url = build.build_log_url
+            log = None
+            if log_url:
+                log_path = self._download_dir / self._get_log_name(build)
+                log = submit(self.request.download_file, log_url, log_path)
+            artifacts = [
+                submit(self.request.download_file, url, self._download_dir)
+                for url in build.get_artifact_urls()
+            ]
+            self._downloads[arch] = _BuildDownloads(log, artifacts)
+
+    def _get_started_downloads(
+        self, build: launchpad.models.Build, output_dir: pathlib.Path
+    ) -> _BuildDownloads | None:
+        """Get the background downloads of a build's files to a directory."""
+        if output_dir != self._download_dir:
+            return None
+        return self._downloads.get(build.arch_tag)
 
     # endregion
 
@@ -405,3 +625,10 @@ class RemoteBuildService(base.AppService):
         """Check if we've timed out."""
         if self._deadline is not None and time.monotonic_ns() >= self._deadline:
             raise TimeoutError
+
+
+def _all_queued(states: Mapping[str, launchpad.models.BuildState]) -> bool:
+    """Determine whether every unfinished build is queued."""
+    return all(
+        state.is_queued for state in states.values() if not state.is_stopping_or_stopped
+    )
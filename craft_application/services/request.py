@@ -17,12 +17,22 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import contextlib
+import hashlib
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from typing import TYPE_CHECKING
 
 import craft_cli
 import requests
+import requests.adapters
 
-from craft_application import util
+from craft_application import errors, util
 from craft_application.services import base
 
 if TYPE_CHECKING:
@@ -32,16 +42,32 @@ if TYPE_CHECKING:
     from craft_application.application import AppMetadata
     from craft_application.services import service_factory
 
+_DIGEST_HEADERS = ("Repr-Digest", "Digest")
+"""Headers in which a server may send the digest of the whole file."""
+_SHA256_DIGEST_REGEX = re.compile(r"sha-256=:?(?P<digest>[A-Za-z0-9+/=]+):?", re.I)
+_HASH_BLOCK_SIZE = 1024 * 1024
+
 
 class RequestService(base.AppService):
     """A service for handling network requests."""
 
+    max_download_workers: int = 8
+    """The maximum number of files to download at the same time."""
+
     def __init__(
         self, app: AppMetadata, services: service_factory.ServiceFactory
     ) -> None:
         super().__init__(app, services)
         self._session = requests.Session()
         self._session.headers["User-Agent"] = f"{self._app.name}/{self._app.version}"
+        # Keep enough connections per host for every concurrent download.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=max(
+                self.max_download_workers, requests.adapters.DEFAULT_POOLSIZE
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
         # Passthroughs for requests methods so other services can use the session.
         self.request = self._session.request
@@ -53,25 +79,134 @@ class RequestService(base.AppService):
         self.post = self._session.post
         self.put = self._session.put
 
-    def download_chunks(self, url: str, dest: pathlib.Path) -> Iterator[int]:
+    def download_chunks(
+        self, url: str, dest: pathlib.Path, *, sha256: str | None = None
+    ) -> Iterator[int]:
         """Download a file.
 
+        The file is downloaded to a ``.partial`` file next to the destination, which
+        is renamed into place once the download is complete. If a partial file from
+        an earlier, interrupted download exists, the download is resumed from its
+        end when the server supports range requests.
+
+        The download is verified as it is written. Its size must match the
+        ``Content-Length`` of the response and, if the file's SHA-256 digest is
+        known, the digest must match. The digest is either given as ``sha256`` or
+        sent by the server in a ``Repr-Digest`` or ``Digest`` header. If the
+        destination already exists with the expected digest, it is not downloaded
+        again.
+
         :param url: The source URL of the file.
         :param dest: The destination. Either a directory or a file.
+        :param sha256: The expected SHA-256 digest of the file as a hex string.
         :yields: First the length in bytes of the file (or -1 if unknown), then the
-            size of each downloaded chunk.
+            size of each downloaded chunk. If the file is already present, only 0 is
+            yielded.
+        :raises DownloadError: If the downloaded file is incomplete or corrupt.
         """
         if dest.is_dir():
             filename = util.get_filename_from_url_path(url)
             dest = dest / filename
+        partial = dest.with_name(f"{dest.name}.partial")
 
-        with self.get(url, stream=True) as download:
-            with dest.open("wb") as file:
-                yield int(download.headers.get("Content-Length", -1))
+        if sha256 and _get_file_sha256(dest) == sha256:
+            craft_cli.emit.debug(f"Not downloading {url}: {dest} is up to date.")
+            yield 0
+            return
+
+        with self._open_download(url, partial) as (download, offset):
+            expected_digest = sha256 or _get_response_sha256(download)
+            if expected_digest and _get_file_sha256(dest) == expected_digest:
+                craft_cli.emit.debug(f"Not downloading {url}: {dest} is up to date.")
+                partial.unlink(missing_ok=True)
+                yield 0
+                return
+
+            hasher = None
+            if expected_digest:
+                hasher = hashlib.sha256()
+                if offset:
+                    _update_hash(hasher, partial)
+            with partial.open("ab" if offset else "wb") as file:
+                size = _get_content_length(download)
+                yield size + offset if size is not None else -1
+                if offset:
+                    yield offset
+                written = 0
                 for chunk in download.iter_content(None):
                     file.write(chunk)
+                    if hasher:
+                        hasher.update(chunk)
+                    written += len(chunk)
                     yield len(chunk)
 
+        if size is not None and written != size:
+            raise errors.DownloadError(
+                f"Download of {url} is incomplete.",
+                details=f"Expected {size} bytes, but received {written}.",
+                resolution="Try again.",
+            )
+        if hasher and hasher.hexdigest() != expected_digest:
+            partial.unlink()
+            raise errors.DownloadError(
+                f"Downloaded file {dest.name} is corrupt.",
+                details=(
+                    f"Expected SHA-256 digest {expected_digest}, "
+                    f"but got {hasher.hexdigest()}."
+                ),
+                resolution="Try again.",
+            )
+        partial.replace(dest)
+
+    @contextlib.contextmanager
+    def _open_download(
+        self, url: str, partial: pathlib.Path
+    ) -> Iterator[tuple[requests.Response, int]]:
+        """Open a streaming download, resuming from a partial file if possible.
+
+        :param url: The source URL of the file.
+        :param partial: The partial file the download is written to.
+        :yields: The response and the offset in the file at which its body starts.
+        """
+        offset = partial.stat().st_size if partial.is_file() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        with self.get(url, stream=True, headers=headers) as download:
+            if download.status_code != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                download.raise_for_status()
+                if download.status_code == HTTPStatus.PARTIAL_CONTENT:
+                    craft_cli.emit.debug(f"Resuming download of {url} at {offset}")
+                    yield download, offset
+                else:
+                    yield download, 0
+                return
+
+        # The partial file can't be resumed, so start over.
+        craft_cli.emit.debug(f"Restarting download of {url}")
+        partial.unlink()
+        with self.get(url, stream=True) as download:
+            download.raise_for_status()
+            yield download, 0
+
+    def download_file(
+        self, url: str, dest: pathlib.Path, *, sha256: str | None = None
+    ) -> pathlib.Path:
+        """Download a single file without showing progress.
+
+        This is safe to call from a background thread. The download is verified as
+        described in :meth:`download_chunks`.
+
+        :param url: The source URL of the file.
+        :param dest: The destination. Either a directory or a file.
+        :param sha256: The expected SHA-256 digest of the file as a hex string.
+        :returns: The path of the downloaded file.
+        """
+        if dest.is_dir():
+            dest = dest / util.get_filename_from_url_path(url)
+        for _ in self.download_chunks(url, dest, sha256=sha256):
+            pass
+        return dest
+
     def download_with_progress(self, url: str, dest: pathlib.Path) -> pathlib.Path:
         """Download a single file with a progress bar."""
         return self.download_files_with_progress({url: dest})[url]
@@ -81,33 +216,114 @@ class RequestService(base.AppService):
     ) -> Mapping[str, pathlib.Path]:
         """Download a set of files to `dest_dir` from various URLs, with a progress bar.
 
+        Files are downloaded concurrently, up to :attr:`max_download_workers` at a
+        time, with a single progress bar for all of them.
+
         :param files: A mapping of urls to their destination files or directories
         :returns: The files mapping, updated with the actual file paths.
         """
         if not files:
             return {}
         files = dict(files)
-        downloads: set[Iterator[int]] = set()
+        downloads: list[Iterator[int]] = []
 
         for url, path in files.items():
             filename = util.get_filename_from_url_path(url)
             if path.is_dir():
                 path = files[url] = path / filename  # noqa: PLW2901
-            downloads.add(self.download_chunks(url, path))
+            downloads.append(self.download_chunks(url, path))
 
         if len(files) == 1:
             title = f"Downloading {next(iter(files))}"
         else:
             title = f"Downloading {len(files)} files"
 
-        sizes = [next(dl) for dl in downloads]
-        total_size = sum(size for size in sizes if size > 0)
+        max_workers = min(self.max_download_workers, len(downloads))
+        # Updates from the workers, as the amount by which to grow the progress
+        # bar's total and the amount by which to advance it.
+        updates: queue.SimpleQueue[tuple[int, int] | None] = queue.SimpleQueue()
+        stop = threading.Event()
+
+        def _drain(download: Iterator[int]) -> None:
+            # The download only opens its response when it's first advanced, so
+            # no more than max_workers responses are open at once.
+            try:
+                size = next(download)
+                updates.put((max(size, 0), 0))
+                for chunk_size in download:
+                    if stop.is_set():
+                        download.close()
+                        return
+                    # Downloads of unknown size grow the total as they go.
+                    updates.put((chunk_size if size < 0 else 0, chunk_size))
+            finally:
+                updates.put(None)
 
-        with craft_cli.emit.progress_bar(title, total_size) as progress:
-            while downloads:
-                for dl in downloads.copy():
-                    for chunk_size in dl:
-                        progress.advance(chunk_size)
-                    downloads.remove(dl)
+        with (
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+            craft_cli.emit.progress_bar(title, 0) as progress,
+        ):
+            futures = [executor.submit(_drain, dl) for dl in downloads]
+            total = 0
+            try:
+                remaining = len(futures)
+                while remaining:
+                    update = updates.get()
+                    if update is None:
+                        remaining -= 1
+                        continue
+                    grow, advance = update
+                    total += grow
+                    progress.total = total
+                    if advance:
+                        progress.advance(advance)
+            except BaseException:
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            for future in futures:
+                future.result()
 
         return files
+
+
+def _get_content_length(response: requests.Response) -> int | None:
+    """Get the length of a response's body as it will be written to a file.
+
+    :returns: The length in bytes, or None if it isn't known.
+    """
+    if response.headers.get("Content-Encoding", "identity") != "identity":
+        # requests decodes the body, so the written size won't match.
+        return None
+    length = response.headers.get("Content-Length")
+    return int(length) if length is not None else None
+
+
+def _get_response_sha256(response: requests.Response) -> str | None:
+    """Get the SHA-256 digest of the whole file from a response's headers.
+
+    :returns: The digest as a hex string, or None if the server didn't send one.
+    """
+    for header in _DIGEST_HEADERS:
+        match = _SHA256_DIGEST_REGEX.search(response.headers.get(header, ""))
+        if match:
+            try:
+                return base64.b64decode(match["digest"], validate=True).hex()
+            except binascii.Error:
+                return None
+    return None
+
+
+def _update_hash(hasher: hashlib._Hash, path: pathlib.Path) -> None:
+    with path.open("rb") as file:
+        while block := file.read(_HASH_BLOCK_SIZE):
+            hasher.update(block)
+
+
+def _get_file_sha256(path: pathlib.Path) -> str | None:
+    """Get the SHA-256 digest of a file, or None if it doesn't exist."""
+    if not path.is_file():
+        return None
+    hasher = hashlib.sha256()
+    _update_hash(hasher, path)
+    return hasher.hexdigest()
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import importlib
 import re
+import threading
 import warnings
 from typing import (
     TYPE_CHECKING,
@@ -58,6 +59,22 @@ T = TypeVar("T")
 _ClassName = Annotated[str, annotated_types.Predicate(lambda x: x.endswith("Class"))]
 
 
+class _ServiceClassAttribute:
+    """A descriptor that gets a registered service class on access.
+
+    This provides the ``<Name>Class`` attributes without importing every registered
+    service when it's registered.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(
+        self, instance: ServiceFactory | None, owner: type[ServiceFactory]
+    ) -> type[services.AppService]:
+        return owner.get_class(self._name)
+
+
 class ServiceFactory:
     """Factory class for lazy-loading service classes.
 
@@ -96,6 +113,8 @@ class ServiceFactory:
         self.app = app
         self._service_kwargs: dict[str, dict[str, Any]] = {}
         self._services: dict[str, services.AppService] = {}
+        # Reentrant, as setting up a service may get other services.
+        self._lock = threading.RLock()
 
         for cls_name, value in kwargs.items():
             if cls_name.endswith("Class"):
@@ -145,7 +164,7 @@ class ServiceFactory:
 
         # For backwards compatibility with class attribute service types.
         service_cls_name = "".join(word.title() for word in name.split("_")) + "Class"
-        setattr(cls, service_cls_name, cls.get_class(name))
+        setattr(cls, service_cls_name, _ServiceClassAttribute(name))
 
     @classmethod
     def reset(cls) -> None:
@@ -308,16 +327,20 @@ class ServiceFactory:
         :returns: An instantiated and set up service class.
 
         Also caches the service so as to provide a single service instance per
-        ServiceFactory.
+        ServiceFactory, even when services are first requested by several threads
+        at once.
         """
         if service in self._services:
             return self._services[service]
-        cls = self.get_class(service)
-        kwargs = self._service_kwargs.get(service, {})
-        instance = cls(app=self.app, services=self, **kwargs)
-        instance.setup()
-        self._services[service] = instance
-        return instance
+        with self._lock:
+            if service in self._services:
+                return self._services[service]
+            cls = self.get_class(service)
+            kwargs = self._service_kwargs.get(service, {})
+            instance = cls(app=self.app, services=self, **kwargs)
+            instance.setup()
+            self._services[service] = instance
+            return instance
 
     def __getattr__(self, name: str) -> services.AppService | type[services.AppService]:
         """Instantiate a service class.
@@ -16,27 +16,35 @@
 from __future__ import annotations
 
 import atexit
+import contextlib
+import copy
+import json
 import os
 import pathlib
 import re
 import shutil
 import stat
 import sys
+import tempfile
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, cast, final
+from typing import TYPE_CHECKING, Literal, NamedTuple, cast, final
 
 import craft_cli
 import craft_providers
 import craft_providers.lxd
 import platformdirs
-import yaml
 
 from craft_application import errors, util
 from craft_application._const import CRAFT_DEBUG_ENV, CRAFT_STATE_DIR_ENV
 
 from . import base
 
+if sys.platform != "win32":
+    import fcntl
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from craft_application.application import AppMetadata
     from craft_application.services import service_factory
 
@@ -44,6 +52,24 @@ ValueType = (
     str | int | float | bool | Sequence["ValueType"] | dict[str, "ValueType"] | None
 )
 
+_MAX_STATE_FILE_SIZE = 1024 * 1024
+
+
+class _CachedStateFile(NamedTuple):
+    """The parsed contents of a state file, with the text they were parsed from."""
+
+    raw_data: str | None
+    """The text of the file, or None if the data hasn't been written."""
+    data: dict[str, ValueType]
+
+
+class _StateChange(NamedTuple):
+    """A value set in a state file."""
+
+    keys: tuple[str, ...]
+    value: ValueType
+    overwrite: bool
+
 
 class StateService(base.AppService):
     """A service for handling global application state.
@@ -58,19 +84,39 @@ class StateService(base.AppService):
         state_service.set("artifacts", "platform-1", value="my-artifact.txt")
         state_service.get("artifacts", "platform-1")
 
+    State files are cached in memory and only parsed again when their contents
+    change. Setting a value holds a lock on the state directory while the state
+    file is read, modified and replaced, so that values set at the same time by
+    the manager and managed instances aren't lost. Use :meth:`batch` to set
+    several values while writing each state file once.
+
     :raises StateServiceError: If the state directory can't be determined.
     :raises StateServiceError: If the state directory can't be created.
     """
 
+    file_format: Literal["yaml", "json"] = "yaml"
+    """The format of state files. JSON is faster to read and write than YAML."""
+
     __state_dir: pathlib.Path
     """The path to the state directory."""
 
+    __cache: dict[str, _CachedStateFile]
+    """State file contents, keyed by file name."""
+
+    __pending: dict[str, list[_StateChange]]
+    """Changes that haven't been written yet, keyed by state file name."""
+
+    __batch_depth: int = 0
+    """The number of nested ``batch`` blocks currently open."""
+
     @final
     def __init__(
         self, app: AppMetadata, services: service_factory.ServiceFactory
     ) -> None:
         super().__init__(app, services)
         self.__state_dir = self._get_state_dir()
+        self.__cache = {}
+        self.__pending = {}
 
         # only the outer instance manages the state dir
         if util.is_managed_mode():
@@ -100,7 +146,7 @@ class StateService(base.AppService):
         data = self._load_state_file(keys[0])
 
         try:
-            value = self._get(*keys, data=data)
+            value = copy.deepcopy(self._get(*keys, data=data))
         except KeyError as err:
             raise KeyError(
                 f"Failed to get value for {StateService._format_keys(*keys)!r}: {err.args[0]}"
@@ -133,18 +179,65 @@ class StateService(base.AppService):
         self._validate_keys(*keys)
 
         file_name = keys[0]
-        data = self._load_state_file(file_name)
+        change = _StateChange(keys, copy.deepcopy(value), overwrite)
+
+        if self.__batch_depth:
+            # Check the change now, but write it when the batch ends.
+            data = dict(self._load_state_file(file_name))
+            self._apply_change(data, change)
+            craft_cli.emit.debug(f"Deferring write of state file {file_name!r}.")
+            self.__cache[file_name] = _CachedStateFile(None, data)
+            self.__pending.setdefault(file_name, []).append(change)
+        else:
+            self._write_changes(file_name, [change])
 
-        try:
-            self._set(*keys, data=data, value=value, overwrite=overwrite)
-        except (KeyError, ValueError) as err:
-            raise type(err)(
-                f"Failed to set {StateService._format_keys(*keys)!r} to {value!r}: {err.args[0]}"
-            ) from err
+        craft_cli.emit.debug(f"Set {StateService._format_keys(*keys)!r} to {value!r}.")
 
-        self._save_state_file(file_name, data)
+    @final
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writing state files until the end of a block.
+
+        Values set within the block can be read back immediately, but each changed
+        state file is only written once, when the block exits. The values are then
+        set again on the current contents of the file, so values set by another
+        process in the meantime are kept. Nested blocks are part of the outermost
+        block. If the outermost block raises an exception, the values set within it
+        are discarded.
+
+        Every changed state file is written even if writing another one fails.
+        The first error is then raised.
+
+        :raises KeyError: If a value can no longer be set in its state file.
+        :raises ValueError: If a value can no longer be set in its state file.
+        :raises ValueError: If a state file would be greater than 1 MiB.
+        :raises StateServiceError: If a state file can't be saved.
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self.__batch_depth -= 1
+            if not self.__batch_depth:
+                craft_cli.emit.debug("Discarding unsaved state changes.")
+                self._discard_pending()
+            raise
+        self.__batch_depth -= 1
+        if self.__batch_depth:
+            return
 
-        craft_cli.emit.debug(f"Set {StateService._format_keys(*keys)!r} to {value!r}.")
+        pending = self.__pending
+        self.__pending = {}
+        failures: list[Exception] = []
+        for file_name, changes in sorted(pending.items()):
+            try:
+                self._write_changes(file_name, changes)
+            except (KeyError, ValueError, errors.StateServiceError) as err:  # noqa: PERF203
+                craft_cli.emit.debug(f"Failed to write state file {file_name!r}: {err}")
+                self.__cache.pop(file_name, None)
+                failures.append(err)
+        if failures:
+            raise failures[0]
 
     @final
     def configure_instance(self, instance: craft_providers.Executor) -> None:
@@ -241,10 +334,13 @@ class StateService(base.AppService):
             data[key] = value
             return
 
-        data_at_key = data.setdefault(key, {})
+        data_at_key = data.get(key, {})
         if not isinstance(data_at_key, dict):
             raise KeyError(f"can't traverse into node at {key!r}.")
 
+        # Nested dictionaries may be shared with the cache, so they're copied
+        # rather than modified. Only the dictionaries along the path are copied.
+        data_at_key = data[key] = dict(data_at_key)
         self._set(*remaining, data=data_at_key, value=value, overwrite=overwrite)
 
     @final
@@ -333,10 +429,92 @@ class StateService(base.AppService):
                 "contain ASCII alphanumeric characters and _ (underscores)."
             )
 
+    @final
+    def _discard_pending(self) -> None:
+        """Drop state changes that haven't been written from the cache."""
+        for file_name in self.__pending:
+            self.__cache.pop(file_name, None)
+        self.__pending.clear()
+
+    @final
+    def _apply_change(self, data: dict[str, ValueType], change: _StateChange) -> None:
+        """Set a value in the data of a state file.
+
+        :raises KeyError: If an item in the path isn't a dictionary.
+        :raises ValueError: If the final item in the path already exists and
+            'overwrite' is false.
+        """
+        try:
+            self._set(
+                *change.keys,
+                data=data,
+                value=change.value,
+                overwrite=change.overwrite,
+            )
+        except (KeyError, ValueError) as err:
+            raise type(err)(
+                f"Failed to set {StateService._format_keys(*change.keys)!r} to "
+                f"{change.value!r}: {err.args[0]}"
+            ) from err
+
+    @final
+    def _write_changes(self, file_name: str, changes: Sequence[_StateChange]) -> None:
+        """Set values in a state file and save it, holding the state directory lock.
+
+        :param file_name: The name of the state file with no file extension.
+        :param changes: The values to set, in order.
+        """
+        with self._lock_state_dir():
+            data = dict(self._load_state_file(file_name))
+            for change in changes:
+                self._apply_change(data, change)
+            self._save_state_file(file_name, data)
+
+    @final
+    @contextlib.contextmanager
+    def _lock_state_dir(self) -> Iterator[None]:
+        """Hold an exclusive lock on the state directory.
+
+        The lock is shared with other processes using the same state directory,
+        including managed instances where the mount supports locks. If the
+        directory can't be locked, state files are updated without a lock.
+        """
+        if sys.platform == "win32":
+            yield
+            return
+        try:
+            fd = os.open(self._state_dir, os.O_RDONLY)
+        except OSError as err:
+            craft_cli.emit.debug(f"Not locking the state directory: {err}")
+            yield
+            return
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError as err:
+                craft_cli.emit.debug(f"Not locking the state directory: {err}")
+            yield
+        finally:
+            os.close(fd)  # Also releases the lock.
+
+    @final
+    def _get_state_file_path(self, file_name: str) -> pathlib.Path:
+        """Get the path to a state file.
+
+        :param file_name: The name of the state file with no file extension.
+        """
+        return self._state_dir / f"{file_name}.{self.file_format}"
+
     @final
     def _load_state_file(self, file_name: str) -> dict[str, ValueType]:
         """Load a state file.
 
+        The file is only parsed if its contents changed since it was last loaded
+        or saved. Comparing the contents rather than the file's stat information
+        means that a change is never missed, even if the new file has the same
+        inode, size and modification time. The returned dictionary is shared with
+        the cache, so callers must not modify it.
+
         :param file_name: The name of the state file to load in the state directory
             with no file extension.
 
@@ -344,12 +522,16 @@ class StateService(base.AppService):
 
         :raises StateServiceError: If the state file can't be loaded.
         """
-        file_path = self._state_dir / f"{file_name}.yaml"
+        if file_name in self.__pending:
+            return self.__cache[file_name].data
+
+        file_path = self._get_state_file_path(file_name)
         craft_cli.emit.debug(f"Loading state file {str(file_path)!r}.")
 
         try:
             if not file_path.exists():
                 craft_cli.emit.debug("State file doesn't exist.")
+                self.__cache.pop(file_name, None)
                 return {}
         except PermissionError as err:
             raise errors.StateServiceError(
@@ -362,21 +544,36 @@ class StateService(base.AppService):
             )
 
         try:
-            return cast(dict[str, ValueType], yaml.safe_load(file_path.read_text()))
+            raw_data = file_path.read_text()
         except OSError as err:
             raise errors.StateServiceError(
                 message=f"Can't load state file {str(file_path)!r}.",
             ) from err
-        except yaml.YAMLError as err:
+
+        cached = self.__cache.get(file_name)
+        if cached and cached.raw_data == raw_data:
+            craft_cli.emit.debug("Using cached state.")
+            return cached.data
+
+        try:
+            if self.file_format == "json":
+                data = cast(dict[str, ValueType], json.loads(raw_data))
+            else:
+                data = cast(dict[str, ValueType], util.safe_yaml_load(raw_data))
+        except (errors.YamlError, ValueError) as err:
             raise errors.StateServiceError(
                 message=f"Can't parse state file {str(file_path)!r}.",
             ) from err
 
+        self.__cache[file_name] = _CachedStateFile(raw_data, data)
+        return data
+
     @final
     def _save_state_file(self, file_name: str, data: dict[str, ValueType]) -> None:
-        """Save a state file as YAML.
+        """Save a state file.
 
-        Existing state files are overwritten.
+        Existing state files are atomically replaced, so a concurrent reader in the
+        manager or a managed instance never sees a partially written file.
 
         :param file_name: The name of the state file to save with no file extension.
         :param data: The data to save to the state file.
@@ -384,17 +581,30 @@ class StateService(base.AppService):
         :raises ValueError: If the state file would be greater than 1MiB in size.
         :raises StateServiceError: If the file can't be saved.
         """
-        file_path = self._state_dir / f"{file_name}.yaml"
+        file_path = self._get_state_file_path(file_name)
         craft_cli.emit.debug(f"Writing state to {str(file_path)!r}.")
-        raw_data = util.dump_yaml(data)
+        if self.file_format == "json":
+            raw_data = json.dumps(data, separators=(",", ":"))
+        else:
+            raw_data = util.dump_yaml(data, libyaml=True)
 
         # There isn't a hard limit on the size of a state file but we shouldn't be serializing
         # an unlimited amount of data, so 1 MiB is a reasonable maximum.
-        if len(raw_data) > 1024 * 1024:
+        if len(raw_data) > _MAX_STATE_FILE_SIZE:
             raise ValueError("Can't save state file over 1 MiB in size.")
 
+        temp_path: pathlib.Path | None = None
         try:
-            file_path.write_text(raw_data)
+            fd, temp_name = tempfile.mkstemp(
+                dir=self._state_dir, prefix=f".{file_path.name}.", suffix=".tmp"
+            )
+            os.close(fd)
+            temp_path = pathlib.Path(temp_name)
+            # mkstemp creates files only readable by the owner, but the state file
+            # must be readable from managed instances.
+            temp_path.chmod(0o644)
+            temp_path.write_text(raw_data)
+            temp_path.replace(file_path)
         # specific handling for permission errors as they are the most likely error to occur
         except PermissionError as err:
             raise errors.StateServiceError(
@@ -404,3 +614,8 @@ class StateService(base.AppService):
             raise errors.StateServiceError(
                 f"Can't save state file {str(file_path)!r}."
             ) from err
+        finally:
+            if temp_path:
+                temp_path.unlink(missing_ok=True)
+
+        self.__cache[file_name] = _CachedStateFile(raw_data, data)
@@ -17,6 +17,7 @@
 
 from craft_application.util.callbacks import get_unique_callbacks
 from craft_application.util.docs import render_doc_url
+from craft_application.util.instances import execute_prefixed, run_build_plan
 from craft_application.util.logging import setup_loggers
 from craft_application.util.paths import (
     get_filename_from_url_path,
@@ -33,6 +34,11 @@ from craft_application.util.platforms import (
     get_hostname,
     is_managed_mode,
 )
+from craft_application.util.provisioning import (
+    ProvisioningResult,
+    ProvisioningScript,
+    ProvisioningStep,
+)
 from craft_application.util.retry import retry
 from craft_application.util.snap_config import (
     SnapConfig,
@@ -41,12 +47,16 @@ from craft_application.util.snap_config import (
 )
 from craft_application.util.string import humanize_list, strtobool
 from craft_application.util.system import get_parallel_build_count
+from craft_application.util.timing import Timer, TimingRecord, TimingTotal
+from craft_application.util.tree_manifest import TreeEntry, TreeManifest
 from craft_application.util.yaml import dump_yaml, safe_yaml_load
 from craft_application.util.cli import format_timestamp
 
 __all__ = [
     "get_unique_callbacks",
     "render_doc_url",
+    "execute_prefixed",
+    "run_build_plan",
     "setup_loggers",
     "get_filename_from_url_path",
     "get_managed_logpath",
@@ -65,7 +75,15 @@ __all__ = [
     "dump_yaml",
     "safe_yaml_load",
     "retry",
+    "ProvisioningResult",
+    "ProvisioningScript",
+    "ProvisioningStep",
     "get_parallel_build_count",
+    "Timer",
+    "TimingRecord",
+    "TimingTotal",
+    "TreeEntry",
+    "TreeManifest",
     "get_hostname",
     "is_managed_mode",
     "format_timestamp",
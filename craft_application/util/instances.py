@@ -0,0 +1,119 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Running builds in several managed instances."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import subprocess
+from typing import TYPE_CHECKING, cast
+
+from craft_cli import emit
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Callable, Iterable, Sequence
+
+    import craft_platforms
+    import craft_providers
+
+
+def run_build_plan(
+    build_plan: Sequence[craft_platforms.BuildInfo],
+    run: Callable[..., None],
+    *,
+    max_parallel: int,
+    app_name: str,
+) -> None:
+    """Run a managed build for each build in a build plan.
+
+    Up to ``max_parallel`` builds run at once. When they run in parallel, ``run``
+    is also given the build's platform as an ``output_prefix`` keyword argument,
+    and each build runs to completion even if another fails, after which a single
+    error lists the platforms that failed. Otherwise, the builds run one at a
+    time and stop at the first failure.
+
+    :param build_plan: The builds to run.
+    :param run: A function that runs a single build, given its build info.
+    :param max_parallel: The maximum number of builds to run at once.
+    :param app_name: The name of the application, for error messages.
+    """
+    max_parallel = min(max_parallel or 1, len(build_plan))
+    if max_parallel <= 1:
+        for build_info in build_plan:
+            run(build_info)
+        return
+
+    emit.debug(
+        f"Running {len(build_plan)} managed instances, up to {max_parallel} at a time."
+    )
+    failures: dict[str, BaseException] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        futures = {
+            pool.submit(run, build_info, output_prefix=build_info.platform): build_info
+            for build_info in build_plan
+        }
+        for future in concurrent.futures.as_completed(futures):
+            platform = futures[future].platform
+            if exc := future.exception():
+                emit.debug(f"Build for {platform} failed: {exc}")
+                failures[platform] = exc
+
+    if not failures:
+        return
+    failed = [info.platform for info in build_plan if info.platform in failures]
+    if len(failed) == 1:
+        raise failures[failed[0]]
+    import craft_providers  # Slow to import.  # noqa: PLC0415
+
+    raise craft_providers.ProviderError(
+        f"Failed to execute {app_name} in {len(failed)} instances.",
+        details="Failed platforms: " + ", ".join(failed),
+    )
+
+
+def execute_prefixed(
+    instance: craft_providers.Executor,
+    command: Sequence[str],
+    *,
+    prefix: str,
+    cwd: pathlib.PurePath,
+    env: dict[str, str],
+) -> None:
+    """Run a command in an instance, emitting each line of its output with a prefix.
+
+    This lets the output of instances running at the same time be told apart.
+
+    :param instance: The instance in which to run the command.
+    :param command: The command to run.
+    :param prefix: The prefix for each line of output.
+    :param cwd: The directory in which to run the command.
+    :param env: Environment variables to set for the command.
+    :raises CalledProcessError: If the command fails.
+    """
+    process = instance.execute_popen(
+        list(command),
+        cwd=cwd,
+        env=cast("dict[str, str | None]", env),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    with process:
+        for line in cast("Iterable[str]", process.stdout):
+            emit.progress(f"[{prefix}] {line.rstrip()}", permanent=True)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, list(command))
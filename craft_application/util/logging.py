@@ -25,9 +25,7 @@ import sys
 from typing import TYPE_CHECKING
 
 import craft_cli
-import craft_parts
 import craft_platforms
-import craft_providers
 
 from craft_application import errors
 
@@ -56,6 +54,11 @@ def handle_runtime_error(
     The printing behavior can be customized by passing a different `print_error`, otherwise
     `Emitter.report_error` is used.
     """
+    # These are only needed to classify the error, so they're imported here to
+    # keep them out of the application's startup path.
+    import craft_parts  # noqa: PLC0415
+    import craft_providers  # noqa: PLC0415
+
     unrecognized_error = False
     match error:
         case craft_cli.ArgumentParsingError():
@@ -20,14 +20,15 @@ from __future__ import annotations
 import functools
 import os
 import platform
-from typing import Final
-
-from craft_parts.utils import os_utils
-from craft_providers import bases
+from typing import TYPE_CHECKING, Final
 
 from .string import strtobool
 
+if TYPE_CHECKING:
+    from craft_providers import bases
+
 ENVIRONMENT_CRAFT_MANAGED_MODE: Final[str] = "CRAFT_MANAGED_MODE"
+ENVIRONMENT_CRAFT_RESOLVED_CONFIG: Final[str] = "CRAFT_RESOLVED_CONFIG"
 
 
 @functools.lru_cache(maxsize=1)
@@ -54,6 +55,9 @@ def is_valid_architecture(arch: str) -> bool:
 @functools.lru_cache(maxsize=1)
 def get_host_base() -> bases.BaseName:
     """Get the craft-providers base for the running host."""
+    from craft_parts.utils import os_utils  # noqa: PLC0415
+    from craft_providers import bases  # noqa: PLC0415
+
     release = os_utils.OsRelease()
     os_id = release.id()
     version_id = release.version_id()
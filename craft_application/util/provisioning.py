@@ -0,0 +1,237 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Batched provisioning of build instances."""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import shlex
+import subprocess
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from craft_cli import emit
+
+from craft_application import errors
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Sequence
+
+    import craft_providers
+
+_MARKER = "@@craft-provision@@"
+_OUTPUT_MARKER = "@@craft-provision-output@@"
+_HEREDOC_DELIMITER = "__CRAFT_EOF__"  # Can't appear in base64 data.
+
+
+class ProvisioningResult(NamedTuple):
+    """The result of a provisioning step."""
+
+    name: str
+    status: Literal["ok", "failed", "skipped"]
+    returncode: int | None
+    """The exit code of the step, or None if it was skipped."""
+    duration: float | None
+    """The time the step took in the instance, in seconds, if known."""
+    output: str = ""
+    """The combined output of the step, if it failed."""
+
+
+@dataclasses.dataclass
+class ProvisioningStep:
+    """A named group of file pushes and commands, run in order.
+
+    The step stops at the first command that fails.
+    """
+
+    name: str
+    condition: Sequence[str] | None = None
+    """A command that must succeed for the step to run."""
+    check: bool = True
+    """Whether a failure of the step stops provisioning."""
+    _actions: list[str] = dataclasses.field(default_factory=list, repr=False)
+
+    def push_file(
+        self, destination: pathlib.PurePath, content: bytes, file_mode: str = "0644"
+    ) -> None:
+        """Write a file in the instance, creating its parent directory.
+
+        :param destination: The absolute path of the file in the instance.
+        :param content: The contents of the file.
+        :param file_mode: The octal permissions of the file.
+        """
+        path = shlex.quote(str(destination))
+        encoded = base64.encodebytes(content).decode("ascii")
+        self._actions.extend(
+            [
+                f"mkdir -p {shlex.quote(str(destination.parent))}",
+                (
+                    f"base64 -d > {path} <<'{_HEREDOC_DELIMITER}'\n"
+                    f"{encoded}{_HEREDOC_DELIMITER}"
+                ),
+                f"chmod {shlex.quote(file_mode)} {path}",
+            ]
+        )
+
+    def run(self, command: Sequence[str]) -> None:
+        """Run a command in the instance.
+
+        :param command: The command and its arguments.
+        """
+        self._actions.append(shlex.join(command))
+
+    def render(self, index: int) -> str:
+        """Render the step as part of a provisioning script."""
+        log = f'"$__craft_logs/{index}"'
+        # Not indented, as indenting would change the contents of here-documents.
+        body = "\n".join(["set -e", *self._actions])
+        run = f"(\n{body}\n) > {log} 2>&1\n__craft_rc=$?"
+        if self.condition is not None:
+            condition = shlex.join(self.condition)
+            run = (
+                f"if {condition} > /dev/null 2>&1; then\n"
+                f"{run}\nelse\n__craft_rc=skip\nfi"
+            )
+        lines = [
+            f"# {self.name}",
+            "__craft_start=$(__craft_now)",
+            run,
+            (
+                f'printf "{_MARKER} {index} %s %s %s\\n" '
+                '"$__craft_rc" "$__craft_start" "$(__craft_now)"'
+            ),
+            'if [ "$__craft_rc" != 0 ] && [ "$__craft_rc" != skip ]; then',
+            f'  sed "s/^/{_OUTPUT_MARKER} {index} /" {log}',
+        ]
+        if self.check:
+            lines.append('  rm -rf "$__craft_logs"; exit "$__craft_rc"')
+        lines.append("fi")
+        return "\n".join(lines)
+
+
+class ProvisioningScript:
+    """A batch of provisioning steps that runs in a single instance command.
+
+    Each instance command can take a noticeable time, so rather than pushing
+    each file and running each command separately, the steps are rendered into
+    one shell script that is sent to the instance and run at once. The script
+    reports the outcome and duration of each step.
+    """
+
+    def __init__(self) -> None:
+        self.steps: list[ProvisioningStep] = []
+
+    def add_step(
+        self, name: str, *, condition: Sequence[str] | None = None, check: bool = True
+    ) -> ProvisioningStep:
+        """Add a step to the script.
+
+        :param name: A human-readable description of the step.
+        :param condition: A command that must succeed for the step to run.
+        :param check: Whether a failure of the step stops provisioning.
+        :returns: The new step, to which file pushes and commands can be added.
+        """
+        step = ProvisioningStep(name, condition=condition, check=check)
+        self.steps.append(step)
+        return step
+
+    def render(self) -> str:
+        """Render the script."""
+        lines = [
+            "set -u",
+            "__craft_now() { date +%s%N 2>/dev/null || echo -; }",
+            "__craft_logs=$(mktemp -d)",
+            *(step.render(index) for index, step in enumerate(self.steps)),
+            'rm -rf "$__craft_logs"',
+        ]
+        return "\n".join(lines) + "\n"
+
+    def run(self, instance: craft_providers.Executor) -> list[ProvisioningResult]:
+        """Run the script in an instance.
+
+        :param instance: The instance to provision.
+        :returns: The results of the steps that ran or were skipped.
+        :raises ProvisioningError: If a checked step fails.
+        """
+        if not self.steps:
+            return []
+        # Pyright doesn't fully understand craft_providers's CompletedProcess.
+        process = instance.execute_run(  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+            ["/bin/sh", "-s"],
+            input=self.render(),
+            check=False,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        results = self._parse_results(process.stdout)  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+        for result in results:
+            duration = "" if result.duration is None else f" in {result.duration:.3f}s"
+            emit.debug(f"Provisioning step {result.name!r}: {result.status}{duration}")
+
+        failed = [
+            result
+            for result, step in zip(results, self.steps)
+            if result.status == "failed" and step.check
+        ]
+        if failed:
+            result = failed[0]
+            raise errors.ProvisioningError(
+                f"Failed to provision instance: {result.name} "
+                f"(exit code {result.returncode})",
+                details=result.output or None,
+            )
+        if process.returncode != 0 or len(results) != len(self.steps):  # pyright: ignore[reportUnknownMemberType]
+            raise errors.ProvisioningError(
+                "Failed to provision instance: the provisioning script "
+                f"exited with code {process.returncode}",  # pyright: ignore[reportUnknownMemberType]
+                details=process.stderr or None,  # pyright: ignore[reportUnknownMemberType]
+            )
+        return results
+
+    def _parse_results(self, stdout: str) -> list[ProvisioningResult]:
+        outputs: dict[int, list[str]] = {}
+        reports: list[tuple[int, str, str, str]] = []
+        for line in stdout.splitlines():
+            marker, _, rest = line.partition(" ")
+            if marker == _MARKER:
+                index, returncode, start, end = rest.split(" ")
+                reports.append((int(index), returncode, start, end))
+            elif marker == _OUTPUT_MARKER:
+                index, _, output = rest.partition(" ")
+                outputs.setdefault(int(index), []).append(output)
+
+        results: list[ProvisioningResult] = []
+        for index, returncode, start, end in reports:
+            duration = None
+            if start.isdigit() and end.isdigit():
+                duration = (int(end) - int(start)) / 1_000_000_000
+            name = self.steps[index].name
+            if returncode == "skip":
+                results.append(ProvisioningResult(name, "skipped", None, duration))
+                continue
+            code = int(returncode)
+            results.append(
+                ProvisioningResult(
+                    name,
+                    "ok" if code == 0 else "failed",
+                    code,
+                    duration,
+                    "\n".join(outputs.get(index, [])),
+                )
+            )
+        return results
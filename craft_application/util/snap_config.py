@@ -23,7 +23,7 @@ import pydantic
 from craft_cli import emit
 from snaphelpers import SnapConfigOptions, SnapCtlError
 
-from craft_application.errors import CraftValidationError
+from craft_application import errors
 
 
 def is_running_from_snap(app_name: str) -> bool:
@@ -74,7 +74,7 @@ class SnapConfig(pydantic.BaseModel, extra="forbid"):
         try:
             snap_config = cls(**data)
         except pydantic.ValidationError as err:
-            raise CraftValidationError.from_pydantic(
+            raise errors.CraftValidationError.from_pydantic(
                 err, file_name="snap config"
             ) from None
 
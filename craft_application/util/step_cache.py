@@ -0,0 +1,216 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Content-addressed cache of the outputs of lifecycle steps."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from craft_cli import emit
+
+_CACHE_FORMAT = 1
+"""The version of the cache layout. Changing it invalidates all cache entries."""
+
+_CHUNK_SIZE = 1024 * 1024
+_SIZE_FILE = "size"
+
+MANAGED_CACHE_DIR = PurePosixPath("/tmp/craft-step-cache")  # noqa: S108 (hardcoded-temp-file)
+"""The path in managed instances at which the host's step cache is mounted."""
+
+
+def get_key(components: dict[str, Any]) -> str:
+    """Get the cache key for a set of inputs.
+
+    :param components: The JSON-serializable inputs that determine the output.
+    :returns: A hex digest of the canonical form of the inputs.
+    """
+    canonical = json.dumps(
+        {"format": _CACHE_FORMAT, **components},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def get_tree_digest(path: Path) -> str:
+    """Get a digest of the contents of a directory tree.
+
+    The digest covers the relative path, type and permissions of each entry, the
+    contents of regular files and the targets of symbolic links. Timestamps and
+    ownership are not included.
+
+    :param path: The root of the tree.
+    :returns: A hex digest of the tree.
+    """
+    tree_hash = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        root_path = Path(root)
+        for name in [*dirs, *sorted(files)]:
+            entry = root_path / name
+            info = entry.lstat()
+            relative = entry.relative_to(path).as_posix()
+            tree_hash.update(f"{relative}\0{stat.S_IMODE(info.st_mode):o}\0".encode())
+            if stat.S_ISLNK(info.st_mode):
+                tree_hash.update(f"L{entry.readlink()}\0".encode())
+            elif stat.S_ISREG(info.st_mode):
+                tree_hash.update(f"F{_get_file_digest(entry)}\0".encode())
+            elif stat.S_ISDIR(info.st_mode):
+                tree_hash.update(b"D\0")
+            else:
+                tree_hash.update(f"?{stat.S_IFMT(info.st_mode)}\0".encode())
+    return tree_hash.hexdigest()
+
+
+def _get_tree_size(path: Path) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            size += Path(root, name).lstat().st_size
+    return size
+
+
+def _get_file_digest(path: Path) -> str:
+    file_hash = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class StepCache:
+    """A local cache of the outputs of lifecycle steps, keyed by their inputs.
+
+    Each entry holds a copy of a part's install directory and the state file
+    of the step that produced it. The modification time of an entry's directory
+    records when it was last stored or restored, so the least recently used
+    entries can be pruned.
+
+    :param path: The directory in which to store the cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_entry_path(key).is_dir()
+
+    def restore(self, key: str, *, install_dir: Path, state_file: Path) -> bool:
+        """Restore a step's outputs from the cache.
+
+        Any existing contents of the install directory are replaced.
+
+        :param key: The cache key of the step.
+        :param install_dir: The part's install directory.
+        :param state_file: The path of the step's state file.
+        :returns: Whether the outputs were in the cache.
+        """
+        entry = self._get_entry_path(key)
+        if not entry.is_dir():
+            return False
+        emit.debug(f"Restoring {install_dir} from step cache entry {key}")
+        if install_dir.exists():
+            shutil.rmtree(install_dir)
+        try:
+            shutil.copytree(entry / "install", install_dir, symlinks=True)
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            # Not copying the metadata gives the state file a current timestamp.
+            shutil.copyfile(entry / "state", state_file)
+            # Mark the entry as recently used.
+            os.utime(entry)
+        except OSError as exc:
+            # Another process may have pruned the entry while it was copied.
+            emit.debug(f"Could not restore step cache entry {key}: {exc}")
+            shutil.rmtree(install_dir, ignore_errors=True)
+            state_file.unlink(missing_ok=True)
+            return False
+        return True
+
+    def store(self, key: str, *, install_dir: Path, state_file: Path) -> None:
+        """Store a step's outputs in the cache.
+
+        The entry is written atomically, so processes sharing the cache never see
+        a partial entry.
+
+        :param key: The cache key of the step.
+        :param install_dir: The part's install directory.
+        :param state_file: The path of the step's state file.
+        """
+        entry = self._get_entry_path(key)
+        if entry.is_dir():
+            return
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        temp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+        try:
+            shutil.copytree(install_dir, temp_dir / "install", symlinks=True)
+            shutil.copyfile(state_file, temp_dir / "state")
+            (temp_dir / _SIZE_FILE).write_text(str(_get_tree_size(temp_dir)))
+            temp_dir.rename(entry)
+        except OSError:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if not entry.is_dir():
+                raise
+            # Another process stored the same entry first.
+        else:
+            emit.debug(f"Stored {install_dir} in step cache entry {key}")
+
+    def prune(self, max_size: int) -> None:
+        """Remove the least recently used entries until the cache fits a size.
+
+        :param max_size: The maximum total size of the entries, in bytes.
+        """
+        entries: list[tuple[int, int, Path]] = []
+        for entry in self.path.glob("*/*"):
+            if entry.name.startswith(".tmp-"):
+                continue
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+                size = int((entry / _SIZE_FILE).read_text())
+            except (OSError, ValueError):
+                # Removed by another process, or not a complete entry.
+                continue
+            entries.append((mtime_ns, size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in sorted(entries):
+            if total <= max_size:
+                break
+            # Move the entry out of the way first so it's never seen partially
+            # removed.
+            trash = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+            try:
+                entry.rename(trash / entry.name)
+            except OSError:
+                # Another process removed the entry first.
+                continue
+            finally:
+                shutil.rmtree(trash, ignore_errors=True)
+            total -= size
+            removed += 1
+        if removed:
+            emit.debug(f"Pruned {removed} entries from the step cache at {self.path}")
@@ -21,7 +21,7 @@ import os
 
 from craft_cli import emit
 
-from craft_application.errors import InvalidParameterError
+from craft_application import errors
 
 
 def _verify_parallel_build_count(env_name: str, parallel_build_count: int | str) -> int:
@@ -34,11 +34,11 @@ def _verify_parallel_build_count(env_name: str, parallel_build_count: int | str)
     try:
         parallel_build_count = int(parallel_build_count)
     except ValueError as err:
-        raise InvalidParameterError(env_name, str(os.environ[env_name])) from err
+        raise errors.InvalidParameterError(env_name, str(os.environ[env_name])) from err
 
     # Ensure the value is valid positive integer
     if parallel_build_count < 1:
-        raise InvalidParameterError(env_name, str(parallel_build_count))
+        raise errors.InvalidParameterError(env_name, str(parallel_build_count))
 
     return parallel_build_count
 
@@ -0,0 +1,233 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Timing instrumentation for long-running operations."""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator, Mapping, Sequence
+
+try:
+    import resource
+except ImportError:  # pragma: no cover (Windows)
+    resource = None  # type: ignore[assignment]
+
+
+@dataclasses.dataclass(frozen=True)
+class TimingRecord:
+    """The resources used by a timed operation."""
+
+    name: str
+    """A human-readable description of the operation."""
+    category: str
+    """The kind of operation, such as ``plan`` or ``action``."""
+    start: float
+    """The time at which the operation started, in seconds since the epoch."""
+    wall_time: float
+    """The elapsed time of the operation, in seconds."""
+    process_cpu_time: float
+    """The CPU time used by the whole process while the operation ran, in seconds.
+
+    This is not specific to the operation: it includes the time used by every
+    thread of this process and by any child processes that finished during the
+    operation, so operations that run at the same time share their CPU time.
+    """
+    process_peak_rss: int | None
+    """The peak resident set size of the process so far, in bytes.
+
+    This is the lifetime high-water mark of this process or of its largest
+    finished child process, whichever is larger, when the operation ended. It
+    never decreases, so it doesn't show the memory used by a single operation.
+    It is None where this isn't available.
+    """
+    thread: int
+    """The identifier of the thread that ran the operation."""
+    part: str | None = None
+    """The name of the part the operation belongs to, if any."""
+    step: str | None = None
+    """The name of the lifecycle step the operation belongs to, if any."""
+
+    def marshal(self) -> dict[str, Any]:
+        """Convert the record to a JSON-compatible dictionary."""
+        return dataclasses.asdict(self)
+
+
+class TimingTotal(NamedTuple):
+    """The total resources used by a group of operations."""
+
+    count: int
+    wall_time: float
+    process_cpu_time: float
+    """The sum of the process-wide CPU time of each operation.
+
+    Operations that ran at the same time each count the CPU time they shared.
+    """
+
+
+def _get_cpu_time() -> float:
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _get_peak_rss() -> int | None:
+    if resource is None:  # pragma: no cover (Windows)
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # macOS reports bytes. Linux reports kibibytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Timer:
+    """Record the wall time of operations, with process-wide resource usage.
+
+    Operations may be measured from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[TimingRecord] = []
+        self._lock = threading.Lock()
+
+    @property
+    def records(self) -> Sequence[TimingRecord]:
+        """The records of all measured operations, in the order they finished."""
+        with self._lock:
+            return tuple(self._records)
+
+    def clear(self) -> None:
+        """Remove all records."""
+        with self._lock:
+            self._records.clear()
+
+    @contextlib.contextmanager
+    def measure(
+        self,
+        name: str,
+        category: str,
+        *,
+        part: str | None = None,
+        step: str | None = None,
+    ) -> Iterator[None]:
+        """Measure the operation run in the context.
+
+        The operation is recorded even if it raises an exception.
+
+        :param name: A human-readable description of the operation.
+        :param category: The kind of operation.
+        :param part: The name of the part the operation belongs to, if any.
+        :param step: The name of the lifecycle step, if any.
+        """
+        start = time.time()
+        start_counter = time.perf_counter()
+        start_cpu = _get_cpu_time()
+        try:
+            yield
+        finally:
+            record = TimingRecord(
+                name=name,
+                category=category,
+                start=start,
+                wall_time=time.perf_counter() - start_counter,
+                process_cpu_time=_get_cpu_time() - start_cpu,
+                process_peak_rss=_get_peak_rss(),
+                thread=threading.get_ident(),
+                part=part,
+                step=step,
+            )
+            with self._lock:
+                self._records.append(record)
+
+    def get_totals(
+        self, by: Literal["part", "step", "category"]
+    ) -> Mapping[str, TimingTotal]:
+        """Get the total time used by operations, grouped by an attribute.
+
+        Records without a value for the attribute are not included.
+
+        :param by: The name of the attribute by which to group records.
+        :returns: A mapping of each value of the attribute to the total time used.
+        """
+        groups: dict[str, list[TimingRecord]] = collections.defaultdict(list)
+        for record in self.records:
+            key = getattr(record, by)
+            if key is not None:
+                groups[key].append(record)
+        return {
+            key: TimingTotal(
+                count=len(records),
+                wall_time=sum(record.wall_time for record in records),
+                process_cpu_time=sum(record.process_cpu_time for record in records),
+            )
+            for key, records in groups.items()
+        }
+
+    def write_json(self, path: pathlib.Path) -> None:
+        """Write the records as a JSON report.
+
+        The report contains every record, along with the totals for each part and
+        each step.
+        """
+        report = {
+            "records": [record.marshal() for record in self.records],
+            "parts": {
+                key: total._asdict() for key, total in self.get_totals("part").items()
+            },
+            "steps": {
+                key: total._asdict() for key, total in self.get_totals("step").items()
+            },
+        }
+        path.write_text(json.dumps(report, indent=2))
+
+    def write_chrome_trace(self, path: pathlib.Path) -> None:
+        """Write the records in the Chrome trace event format.
+
+        The trace can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": round(record.start * 1_000_000),
+                "dur": round(record.wall_time * 1_000_000),
+                "pid": pid,
+                "tid": record.thread,
+                "args": {
+                    "part": record.part,
+                    "step": record.step,
+                    "process_cpu_time": record.process_cpu_time,
+                    "process_peak_rss": record.process_peak_rss,
+                },
+            }
+            for record in self.records
+        ]
+        path.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, indent=2)
+        )
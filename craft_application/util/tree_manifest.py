@@ -0,0 +1,176 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Persistent, incrementally updated manifests of directory trees."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from craft_cli import emit
+
+_MANIFEST_VERSION = 1
+_BLOCK_SIZE = 1024 * 1024
+# Files modified this close to the start of a scan may be modified again within
+# the same mtime tick, so their digests are not reused by the next scan.
+_RACY_WINDOW_NS = 2 * 10**9
+
+
+class TreeEntry(NamedTuple):
+    """An entry in a tree manifest."""
+
+    kind: str
+    """``f`` for regular files, ``d`` for directories and ``l`` for symlinks."""
+    mode: int
+    """The permission bits of the entry."""
+    size: int
+    """The size of a regular file, or 0."""
+    mtime_ns: int
+    inode: int
+    digest: str
+    """The digest of a regular file, the target of a symlink, or empty."""
+
+
+class TreeManifest:
+    """A manifest of the entries in a directory tree and their digests.
+
+    The manifest is stored in ``manifest_file`` between runs. When it's updated,
+    files whose size, modification time and inode haven't changed keep their
+    recorded digest, so only new or modified files are read.
+
+    :param root: The root of the tree.
+    :param manifest_file: The file in which to store the manifest.
+    """
+
+    def __init__(self, root: Path, manifest_file: Path) -> None:
+        self.root = root
+        self.manifest_file = manifest_file
+        self.entries: dict[str, TreeEntry] = {}
+        """The entries of the tree at the last update, by relative path."""
+        self.hashed = 0
+        """The number of files read by the last update."""
+
+    def update(self) -> str:
+        """Scan the tree, update the manifest file and get the tree's digest.
+
+        :returns: The digest of the tree.
+        """
+        previous = self._load()
+        scan_start = time.time_ns()
+        self.entries = {}
+        self.hashed = 0
+        for root, dirs, files in os.walk(self.root):
+            dirs.sort()
+            root_path = Path(root)
+            for name in [*dirs, *sorted(files)]:
+                path = root_path / name
+                relative = path.relative_to(self.root).as_posix()
+                entry = self._get_entry(path, previous.get(relative))
+                if entry is not None:
+                    self.entries[relative] = entry
+        emit.debug(
+            f"Scanned {len(self.entries)} entries in {self.root} "
+            f"({self.hashed} files hashed)"
+        )
+        self._save(scan_start)
+        return self.digest
+
+    @property
+    def digest(self) -> str:
+        """The digest of the tree at the last update.
+
+        The digest covers the path, type, permissions, size and contents of each
+        entry. Timestamps and ownership are not included.
+        """
+        tree_hash = hashlib.sha256()
+        for relative, entry in sorted(self.entries.items()):
+            tree_hash.update(
+                f"{relative}\0{entry.kind}\0{entry.mode:o}\0{entry.size}\0"
+                f"{entry.digest}\n".encode()
+            )
+        return tree_hash.hexdigest()
+
+    def _get_entry(self, path: Path, previous: TreeEntry | None) -> TreeEntry | None:
+        info = path.lstat()
+        mode = stat.S_IMODE(info.st_mode)
+        if stat.S_ISDIR(info.st_mode):
+            return TreeEntry("d", mode, 0, info.st_mtime_ns, info.st_ino, "")
+        if stat.S_ISLNK(info.st_mode):
+            target = str(path.readlink())
+            return TreeEntry("l", mode, 0, info.st_mtime_ns, info.st_ino, target)
+        if not stat.S_ISREG(info.st_mode):
+            return None
+        if (
+            previous is not None
+            and previous.kind == "f"
+            and (previous.size, previous.mtime_ns, previous.inode)
+            == (info.st_size, info.st_mtime_ns, info.st_ino)
+        ):
+            digest = previous.digest
+        else:
+            digest = _hash_file(path)
+            self.hashed += 1
+        return TreeEntry("f", mode, info.st_size, info.st_mtime_ns, info.st_ino, digest)
+
+    def _load(self) -> dict[str, TreeEntry]:
+        """Load the previous entries from the manifest file, if usable."""
+        try:
+            data = json.loads(self.manifest_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+            return {}
+        with contextlib.suppress(AttributeError, TypeError, ValueError, KeyError):
+            return {
+                path: TreeEntry(*values) for path, values in data["entries"].items()
+            }
+        return {}
+
+    def _save(self, scan_start: int) -> None:
+        """Atomically write the manifest file."""
+        entries = {
+            # Racily modified files are stored without a digest so they're
+            # hashed again next time.
+            path: entry._replace(mtime_ns=-1)
+            if entry.kind == "f" and entry.mtime_ns >= scan_start - _RACY_WINDOW_NS
+            else entry
+            for path, entry in self.entries.items()
+        }
+        data = {"version": _MANIFEST_VERSION, "entries": entries}
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.manifest_file.parent, delete=False
+            ) as temp_file:
+                json.dump(data, temp_file)
+            Path(temp_file.name).replace(self.manifest_file)
+        except OSError as exc:
+            emit.debug(f"Could not write tree manifest {self.manifest_file}: {exc}")
+
+
+def _hash_file(path: Path) -> str:
+    file_hash = hashlib.blake2b(digest_size=32)
+    with path.open("rb") as file:
+        while chunk := file.read(_BLOCK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
@@ -29,6 +29,17 @@ from craft_application import errors
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Hashable
 
+try:
+    from yaml import CSafeDumper as _BaseSafeDumper
+    from yaml import CSafeLoader as _BaseSafeLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:  # pragma: no cover - PyYAML was built without libyaml
+    from yaml import SafeDumper as _BaseSafeDumper
+    from yaml import SafeLoader as _BaseSafeLoader
+
+    LIBYAML_AVAILABLE = False
+
 
 # pyright: reportUnknownMemberType=false
 # Type of "represent_scalar" is
@@ -40,6 +51,16 @@ def _repr_str(dumper: yaml.Dumper, data: str) -> yaml.ScalarNode:
     return dumper.represent_scalar("tag:yaml.org,2002:str", data)
 
 
+def _repr_str_enum(
+    dumper: yaml.Dumper, data: craft_platforms.DebianArchitecture
+) -> yaml.ScalarNode:
+    """Represent a string enum for the YAML dumper.
+
+    The libyaml emitter only accepts plain ``str`` scalars, not subclasses.
+    """
+    return _repr_str(dumper, data.value)
+
+
 def _check_duplicate_key_node(
     mappings: set[yaml.Node], key: yaml.Node, node: yaml.Node
 ) -> None:
@@ -90,24 +111,72 @@ def _dict_constructor(
 
 
 class _SafeYamlLoader(yaml.SafeLoader):
-    def __init__(self, stream: TextIO) -> None:
-        super().__init__(stream)
+    """A pure-Python safe loader that rejects duplicate keys."""
 
-        self.add_constructor(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor
-        )
+
+class _CSafeYamlLoader(_BaseSafeLoader):  # type: ignore[misc,valid-type]
+    """A libyaml-based safe loader that rejects duplicate keys.
+
+    Falls back to the pure-Python loader if libyaml is unavailable.
+    """
+
+
+class _SafeYamlDumper(yaml.SafeDumper):
+    """A pure-Python safe dumper with craft-application's representers."""
+
+
+class _CSafeYamlDumper(_BaseSafeDumper):  # type: ignore[misc,valid-type]
+    """A libyaml-based safe dumper with craft-application's representers.
+
+    Its output is valid YAML, but differs cosmetically from the pure-Python
+    dumper: characters outside the Basic Multilingual Plane are escaped and
+    top-level scalars have no document end marker.
+    """
+
+
+for _loader in (_SafeYamlLoader, _CSafeYamlLoader):
+    _loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+        _dict_constructor,  # type: ignore[arg-type]
+    )
+
+for _dumper in (_SafeYamlDumper, _CSafeYamlDumper):
+    _dumper.add_representer(str, _repr_str)
+    _dumper.add_representer(craft_platforms.DebianArchitecture, _repr_str_enum)
+
+
+def _load(text: str, loader_class: type[Any], name: str | None) -> Any:  # noqa: ANN401
+    loader = loader_class(text)
+    if name:
+        # Give error marks the stream's name rather than "<unicode string>".
+        loader.name = name
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
 
 
 def safe_yaml_load(stream: TextIO | str) -> Any:  # noqa: ANN401 - The YAML could be anything
     """Equivalent to pyyaml's safe_load function, but constraining duplicate keys.
 
+    The document is parsed with libyaml if available. If libyaml fails to parse it,
+    the document is parsed again with the pure-Python loader, which both accepts
+    the same documents as previous releases and provides more detailed errors.
+
     :param stream: Any text-like IO object.
     :returns: A dict object mapping the yaml.
     """
+    if isinstance(stream, str):
+        text, name = stream, None
+    else:
+        text, name = stream.read(), getattr(stream, "name", None)
     try:
-        # Silencing S506 ("probable use of unsafe loader") because we override it by
-        # using our own safe loader.
-        return yaml.load(stream, Loader=_SafeYamlLoader)  # noqa: S506
+        if LIBYAML_AVAILABLE:
+            try:
+                return _load(text, _CSafeYamlLoader, name)
+            except yaml.YAMLError:
+                pass
+        return _load(text, _SafeYamlLoader, name)
     except yaml.YAMLError as error:
         if isinstance(stream, str):
             filename = "(unknown)"
@@ -120,6 +189,8 @@ def safe_yaml_load(stream: TextIO | str) -> Any:  # noqa: ANN401 - The YAML coul
 def dump_yaml(
     data: Any,  # noqa: ANN401 # Any gets passed to pyyaml
     stream: TextIO,
+    *,
+    libyaml: bool = False,
     **kwargs: Any,
 ) -> None: ...  # pragma: no cover
 
@@ -128,11 +199,19 @@ def dump_yaml(
 def dump_yaml(
     data: Any,  # noqa: ANN401 # Any gets passed to pyyaml
     stream: None = None,
+    *,
+    libyaml: bool = False,
     **kwargs: Any,
 ) -> str: ...  # pragma: no cover
 
 
-def dump_yaml(data: Any, stream: TextIO | None = None, **kwargs: Any) -> str | None:
+def dump_yaml(
+    data: Any,  # Any gets passed to pyyaml
+    stream: TextIO | None = None,
+    *,
+    libyaml: bool = False,
+    **kwargs: Any,
+) -> str | None:
     """Dump an object to YAML using PyYAML.
 
     This works as a drop-in replacement for ``yaml.safe_dump``, but adjusting
@@ -140,18 +219,14 @@ def dump_yaml(data: Any, stream: TextIO | None = None, **kwargs: Any) -> str | N
 
     :param data: the data structure to dump.
     :param stream: The optional text stream to which to write.
+    :param libyaml: Use the faster libyaml emitter if available. Its output is
+        equivalent but not byte-for-byte identical to the default emitter, so this
+        is intended for files that are only read back by machines.
     :param kwargs: Keyword arguments passed to pyyaml
     """
-    yaml.add_representer(
-        str, _repr_str, Dumper=cast(type[yaml.Dumper], yaml.SafeDumper)
-    )
-    yaml.add_representer(
-        craft_platforms.DebianArchitecture,
-        _repr_str,
-        Dumper=cast(type[yaml.Dumper], yaml.SafeDumper),
-    )
+    dumper = _CSafeYamlDumper if libyaml else _SafeYamlDumper
     kwargs.setdefault("sort_keys", False)
     kwargs.setdefault("allow_unicode", True)
     return cast(  # This cast is needed for pyright but not mypy
-        str | None, yaml.dump(data, stream, Dumper=yaml.SafeDumper, **kwargs)
+        str | None, yaml.dump(data, stream, Dumper=dumper, **kwargs)
     )
@@ -16,7 +16,6 @@
 """Partitioncraft package service."""
 
 import pathlib
-import tarfile
 
 import craft_application
 from craft_application.services import package
@@ -43,12 +42,14 @@ class PackageService(package.PackageService):
         tarball_name = (
             f"{self._project.name}-{self._project.version}-default.partitioncraft"
         )
-        with tarfile.open(dest / tarball_name, mode="w:xz") as tar:
-            tar.add(prime_dir, arcname=".")
-
         mushroom_name = (
             f"{self._project.name}-{self._project.version}-mushroom.partitioncraft"
         )
-        with tarfile.open(dest / mushroom_name, mode="w:xz") as tar:
-            tar.add(lifecycle.project_info.dirs.get_prime_dir("mushroom"), arcname=".")
-        return [dest / tarball_name, dest / mushroom_name]
+        return package.ArchiveWriter().write_many(
+            {
+                dest / tarball_name: prime_dir,
+                dest / mushroom_name: lifecycle.project_info.dirs.get_prime_dir(
+                    "mushroom"
+                ),
+            }
+        )
@@ -16,7 +16,6 @@
 """Testcraft package service."""
 
 import pathlib
-import tarfile
 
 import craft_application
 from craft_application.services import package
@@ -43,6 +42,4 @@ class PackageService(package.PackageService):
         project = self._project
         platform = self._build_info.platform
         tarball_name = f"{project.name}-{project.version}-{platform}.testcraft"
-        with tarfile.open(dest / tarball_name, mode="w:xz") as tar:
-            tar.add(prime_dir, arcname=".")
-        return [dest / tarball_name]
+        return [package.ArchiveWriter().write(prime_dir, dest / tarball_name)]
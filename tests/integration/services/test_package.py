@@ -0,0 +1,64 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks comparing ArchiveWriter with plain tarfile."""
+
+import os
+import random
+import tarfile
+import timeit
+
+import pytest
+from craft_application.services import package
+
+
+@pytest.fixture(scope="module")
+def large_prime_dir(tmp_path_factory):
+    """Generate a prime directory of about 32 MiB of partly compressible files."""
+    prime_dir = tmp_path_factory.mktemp("prime")
+    rng = random.Random(0)  # noqa: S311 (not for cryptography)
+    words = [rng.randbytes(rng.randint(2, 12)) for _ in range(4096)]
+    for i in range(16):
+        directory = prime_dir / f"dir-{i // 4}"
+        directory.mkdir(exist_ok=True)
+        data = b" ".join(rng.choices(words, k=300_000))
+        (directory / f"file-{i}").write_bytes(data[: 2 * 1024 * 1024])
+    return prime_dir
+
+
+def _tarfile_pack(prime_dir, dest):
+    with tarfile.open(dest, mode="w:xz") as tar:
+        tar.add(prime_dir, arcname=".")
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compression", ["xz", "zstd"])
+def test_pack_benchmark(tmp_path, large_prime_dir, compression, emitter):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    writer = package.ArchiveWriter(compression)
+    dest = tmp_path / f"writer.tar.{compression}"
+
+    writer_time = timeit.timeit(lambda: writer.write(large_prime_dir, dest), number=1)
+    tarfile_time = timeit.timeit(
+        lambda: _tarfile_pack(large_prime_dir, tmp_path / "tarfile.tar.xz"), number=1
+    )
+    print(
+        f"pack: ArchiveWriter ({compression}, {writer.threads} threads) "
+        f"{writer_time:.3f}s, tarfile (xz) {tarfile_time:.3f}s"
+    )
+
+    if (os.cpu_count() or 1) >= 4:
+        assert writer_time < tarfile_time
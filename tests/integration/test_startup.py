@@ -0,0 +1,104 @@
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Startup time regression tests."""
+
+import json
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+# The wall time allowed for a fresh interpreter to run ``testcraft --version``
+# or ``testcraft --help``, as a multiple of the time taken to import the libraries
+# that every craft application needs. Measuring against this baseline allows for
+# the speed of the machine while catching regressions such as an eager import of
+# craft-parts, which alone takes several times the baseline.
+BASELINE_IMPORTS = "import craft_cli, craft_platforms, pydantic"
+STARTUP_BUDGET = 3
+RUNS = 3
+
+# Modules that are only needed by specific commands and must not be imported
+# just to show the version or help.
+DEFERRED_MODULES = [
+    "craft_application.services.fetch",
+    "craft_application.services.remotebuild",
+    "craft_parts",
+    "craft_providers",
+    "httplib2",
+    "launchpadlib",
+    "pygit2",
+    "requests",
+]
+
+APP_SCRIPT = textwrap.dedent(
+    """\
+    import json
+    import sys
+
+    import craft_application
+
+
+    class PackageService(craft_application.PackageService):
+        def pack(self, prime_dir, dest):
+            return []
+
+        @property
+        def metadata(self):
+            return None
+
+
+    craft_application.ServiceFactory.register("package", PackageService)
+    app_metadata = craft_application.AppMetadata("testcraft", "A fake app")
+    app = craft_application.Application(
+        app_metadata, craft_application.ServiceFactory(app_metadata)
+    )
+    try:
+        return_code = app.run()
+    finally:
+        print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+    sys.exit(return_code)
+    """
+)
+
+
+def _run(*args, cwd):
+    """Run a fresh interpreter several times, returning its fastest run."""
+    durations = []
+    for _ in range(RUNS):
+        start = time.monotonic()
+        result = subprocess.run(
+            [sys.executable, *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+        durations.append(time.monotonic() - start)
+    return result, min(durations)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("argument", ["--version", "--help"])
+def test_startup(tmp_path, argument):
+    script = tmp_path / "testcraft.py"
+    script.write_text(APP_SCRIPT)
+
+    _, baseline = _run("-c", BASELINE_IMPORTS, cwd=tmp_path)
+    result, duration = _run(script, argument, cwd=tmp_path)
+
+    modules = json.loads(result.stderr.splitlines()[-1])
+    assert not set(DEFERRED_MODULES) & set(modules)
+    assert duration < baseline * STARTUP_BUDGET
@@ -0,0 +1,85 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Benchmarks comparing the libyaml and pure-Python YAML paths."""
+
+import timeit
+
+import pytest
+from craft_application.util import yaml
+
+
+def _large_project(num_parts: int) -> dict:
+    """Generate a large snapcraft/rockcraft-style project."""
+    return {
+        "name": "big-project",
+        "version": "1.0",
+        "summary": "A project with many parts",
+        "description": "A long description.\nOver multiple lines.\n" * 10,
+        "base": "ubuntu@24.04",
+        "platforms": dict.fromkeys(("amd64", "arm64", "riscv64")),
+        "parts": {
+            f"part-{i}": {
+                "plugin": "dump",
+                "source": f"https://example.com/source-{i}.tar.gz",
+                "source-checksum": f"sha256/{i:064x}",
+                "build-packages": [f"build-pkg-{i}-{j}" for j in range(10)],
+                "stage-packages": [
+                    {"on amd64": [f"amd64-pkg-{i}-{j}" for j in range(5)]},
+                    {"else": [f"pkg-{i}-{j}" for j in range(5)]},
+                ],
+                "build-environment": [{f"VAR_{j}": f"value-{j}"} for j in range(5)],
+                "override-build": "craftctl default\nrm -rf $CRAFT_PART_INSTALL/doc\n",
+                "after": [f"part-{i - 1}"] if i else [],
+            }
+            for i in range(num_parts)
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def large_project_yaml() -> str:
+    return yaml.dump_yaml(_large_project(500))
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not yaml.LIBYAML_AVAILABLE, reason="libyaml not available")
+def test_load_benchmark(monkeypatch, large_project_yaml):
+    libyaml_time = min(
+        timeit.repeat(lambda: yaml.safe_yaml_load(large_project_yaml), number=1)
+    )
+    monkeypatch.setattr(yaml, "LIBYAML_AVAILABLE", False)
+    python_time = min(
+        timeit.repeat(lambda: yaml.safe_yaml_load(large_project_yaml), number=1)
+    )
+    print(f"load: libyaml {libyaml_time:.3f}s, pure Python {python_time:.3f}s")
+
+    assert yaml.safe_yaml_load(large_project_yaml) == _large_project(500)
+    assert libyaml_time < python_time
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not yaml.LIBYAML_AVAILABLE, reason="libyaml not available")
+def test_dump_benchmark():
+    project = _large_project(500)
+
+    libyaml_time = min(
+        timeit.repeat(lambda: yaml.dump_yaml(project, libyaml=True), number=1)
+    )
+    python_time = min(timeit.repeat(lambda: yaml.dump_yaml(project), number=1))
+    print(f"dump: libyaml {libyaml_time:.3f}s, pure Python {python_time:.3f}s")
+
+    assert yaml.safe_yaml_load(yaml.dump_yaml(project, libyaml=True)) == project
+    assert libyaml_time < python_time
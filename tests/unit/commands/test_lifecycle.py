@@ -16,6 +16,7 @@
 """Tests for lifecycle commands."""
 
 import argparse
+import dataclasses
 import pathlib
 import re
 import subprocess
@@ -579,6 +580,27 @@ def test_pack_fetch_manifest(
     assert mock_services.fetch.create_project_manifest.called == expect_create_called
 
 
+def test_pack_run_always_repack(mocker, mock_services, app_metadata, tmp_path):
+    mock_services.package.pack.return_value = [pathlib.Path("package.zip")]
+    mock_services.get("project").configure(platform=None, build_for=None)
+    parsed_args = argparse.Namespace(
+        destructive_mode=True, output=tmp_path, fetch_service_policy=None
+    )
+    command = PackCommand(
+        {
+            "app": dataclasses.replace(app_metadata, always_repack=True),
+            "services": mock_services,
+        }
+    )
+    mocker.patch.object(command._services.lifecycle.project_info, "work_dir", tmp_path)
+    mock_get_inputs = mocker.patch.object(command, "_get_pack_inputs")
+
+    command.run(parsed_args)
+
+    mock_get_inputs.assert_not_called()
+    mock_services.package.pack.assert_called_once()
+
+
 @pytest.mark.usefixtures("destructive_mode")
 def test_pack_run_wrong_step(app_metadata, fake_services):
     parsed_args = argparse.Namespace(
@@ -1098,3 +1120,111 @@ def test_is_already_packed(
     )
 
     assert command._is_already_packed() == result
+
+
+@pytest.mark.parametrize(
+    ("packed_inputs", "pack_inputs", "is_missing", "result"),
+    [
+        ({"prime": "abc"}, {"prime": "abc"}, False, True),
+        ({"prime": "abc"}, {"prime": "abc"}, True, False),
+        ({"prime": "abc"}, {"prime": "def"}, False, False),
+        ({"prime": "abc"}, {"prime": "abc", "output": "/out"}, False, False),
+    ],
+)
+def test_is_already_packed_inputs(
+    mocker,
+    app_metadata,
+    fake_services,
+    packed_inputs,
+    pack_inputs,
+    is_missing,
+    result,
+):
+    command = PackCommand({"app": app_metadata, "services": fake_services})
+    mocker.patch.object(command, "_get_packed_file_list_timestamp", return_value=1000)
+    mocker.patch.object(command, "_load_packed_file_list", return_value=(None, None))
+    mocker.patch.object(command, "_load_packed_inputs", return_value=packed_inputs)
+    mocker.patch.object(command, "_is_missing_packed_files", return_value=is_missing)
+    # The prime state is newer than the artifacts, but the inputs take priority.
+    mocker.patch.object(LifecycleService, "prime_state_timestamp", 1500)
+
+    assert command._is_already_packed(pack_inputs) == result
+
+
+def test_save_load_packed_inputs(mocker, tmp_path, app_metadata, fake_services):
+    command = PackCommand({"app": app_metadata, "services": fake_services})
+    mocker.patch.object(command._services.lifecycle.project_info, "work_dir", tmp_path)
+    inputs = {"prime": "abc", "output": "/out"}
+
+    assert command._load_packed_inputs() is None
+
+    command._save_packed_file_list(pathlib.Path("foo"), None, inputs=inputs)
+
+    assert command._load_packed_inputs() == inputs
+
+
+@pytest.fixture
+def pack_command_prime_dirs(mocker, tmp_path, app_metadata, fake_services):
+    """A pack command whose lifecycle primes into the given prime directories."""
+    prime_dirs: dict[str | None, pathlib.Path] = {}
+    project_info = mock.Mock(work_dir=tmp_path)
+    project_info.dirs.prime_dirs = prime_dirs
+    lifecycle = mock.Mock(project_info=project_info)
+    build_plan = mock.Mock()
+    build_plan.plan.return_value = [mock.Mock(platform="my-platform")]
+    services = {"lifecycle": lifecycle, "build_plan": build_plan}
+    mocker.patch.object(fake_services, "get", side_effect=services.__getitem__)
+    command = PackCommand({"app": app_metadata, "services": fake_services})
+    return command, prime_dirs
+
+
+def test_get_pack_inputs(tmp_path, pack_command_prime_dirs):
+    command, prime_dirs = pack_command_prime_dirs
+    prime_dir = prime_dirs[None] = tmp_path / "prime"
+    prime_dir.mkdir()
+    (prime_dir / "file").write_text("contents")
+    parsed_args = argparse.Namespace(output=pathlib.Path("out"))
+
+    inputs = command._get_pack_inputs(parsed_args)
+
+    assert inputs.keys() == {"prime", "output", "platforms"}
+    assert inputs["output"] == str(pathlib.Path("out").resolve())
+    assert inputs["platforms"] == "my-platform"
+    assert (tmp_path / ".craft" / "prime-manifests" / "default.json").is_file()
+    # Repriming the same contents doesn't change the inputs.
+    (prime_dir / "file").unlink()
+    (prime_dir / "file").write_text("contents")
+    assert command._get_pack_inputs(parsed_args) == inputs
+    (prime_dir / "file").write_text("new contents")
+    assert command._get_pack_inputs(parsed_args)["prime"] != inputs["prime"]
+
+
+def test_get_pack_inputs_partitions(tmp_path, pack_command_prime_dirs):
+    command, prime_dirs = pack_command_prime_dirs
+    prime_dirs["default"] = tmp_path / "prime"
+    prime_dirs["mushroom"] = tmp_path / "partitions/mushroom/prime"
+    prime_dirs["component/foo"] = tmp_path / "partitions/component/foo/prime"
+    for prime_dir in prime_dirs.values():
+        prime_dir.mkdir(parents=True)
+        (prime_dir / "file").write_text("contents")
+    parsed_args = argparse.Namespace(output=pathlib.Path("out"))
+
+    inputs = command._get_pack_inputs(parsed_args)
+
+    assert inputs.keys() == {
+        "prime:default",
+        "prime:mushroom",
+        "prime:component/foo",
+        "output",
+        "platforms",
+    }
+    manifest_dir = tmp_path / ".craft" / "prime-manifests"
+    assert (manifest_dir / "mushroom.json").is_file()
+    assert (manifest_dir / "component" / "foo.json").is_file()
+
+    (prime_dirs["mushroom"] / "file").write_text("new contents")
+    new_inputs = command._get_pack_inputs(parsed_args)
+
+    assert new_inputs["prime:mushroom"] != inputs["prime:mushroom"]
+    assert new_inputs["prime:default"] == inputs["prime:default"]
+    assert new_inputs["prime:component/foo"] == inputs["prime:component/foo"]
@@ -35,11 +35,13 @@ from craft_application.git import (
     GitError,
     GitRepo,
     GitType,
+    PushProgress,
     get_git_repo_type,
     is_commit,
     is_repo,
     is_short_commit,
     parse_describe,
+    parse_push_progress,
     short_commit_sha,
 )
 from craft_application.remote import (
@@ -280,6 +282,25 @@ def test_commit(empty_working_directory):
     assert blob.name == "test-file"
 
 
+def test_commit_orphan(empty_working_directory):
+    """Create a commit with no parents on top of an existing branch."""
+    repo = GitRepo(empty_working_directory)
+    (repo.path / "test-file").touch()
+    repo.add_all()
+    repo.commit()
+    (repo.path / "test-file").write_text("changed")
+    repo.add_all()
+
+    commit_id = repo.commit(orphan=True)
+
+    pygit_repo = pygit2.Repository(empty_working_directory)
+    commit = pygit_repo.revparse_single("HEAD")
+    assert isinstance(commit, pygit2.Commit)
+    assert str(commit.id) == commit_id
+    assert commit.parents == []
+    assert not pygit_repo.head_is_detached
+
+
 def test_commit_write_tree_error(empty_working_directory, mocker):
     """Raise an error if the tree cannot be created."""
     mocker.patch("pygit2.Index.write_tree", side_effect=pygit2.GitError)
@@ -368,6 +389,96 @@ def test_push_url():
     assert blob.name == "test-file"
 
 
+@pytest.mark.usefixtures("empty_working_directory")
+def test_push_url_progress():
+    Path("local-repo").mkdir()
+    repo = GitRepo(Path("local-repo"))
+    (repo.path / "test-file").write_bytes(b"x" * 4096)
+    repo.add_all()
+    repo.commit()
+    pygit2.init_repository(Path("remote-repo"), bare=True)
+    progress: list[PushProgress] = []
+
+    repo.push_url(
+        remote_url=f"file://{str(Path('remote-repo').absolute())}",
+        remote_branch="test-branch",
+        progress=progress.append,
+    )
+
+    writing = [p for p in progress if p.phase == "Writing objects"]
+    assert writing
+    assert writing[-1].done
+    assert writing[-1].current == writing[-1].total == 3
+    assert [p.current for p in writing] == sorted(p.current for p in writing)
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        pytest.param(
+            "Counting objects:  50% (1/2)",
+            PushProgress("Counting objects", 1, 2),
+            id="counting",
+        ),
+        pytest.param(
+            "Compressing objects: 100% (2/2), done.",
+            PushProgress("Compressing objects", 2, 2, done=True),
+            id="compressing-done",
+        ),
+        pytest.param(
+            "Writing objects:  40% (2/5), 1.20 MiB | 2.00 MiB/s",
+            PushProgress("Writing objects", 2, 5, bytes_sent=1258291, rate=2097152),
+            id="writing",
+        ),
+        pytest.param(
+            "Writing objects: 100% (3/3), 212 bytes | 212.00 KiB/s, done.",
+            PushProgress(
+                "Writing objects", 3, 3, bytes_sent=212, rate=217088, done=True
+            ),
+            id="writing-done",
+        ),
+        pytest.param(
+            "remote: Resolving deltas: 100% (1/1)",
+            PushProgress("Resolving deltas", 1, 1),
+            id="remote",
+        ),
+        pytest.param("Total 3 (delta 0), reused 0 (delta 0)", None, id="summary"),
+        pytest.param(" * [new branch]      main -> main", None, id="ref"),
+    ],
+)
+def test_parse_push_progress(line, expected):
+    assert parse_push_progress(line) == expected
+
+
+@pytest.mark.usefixtures("empty_working_directory")
+def test_push_url_pack_options(fake_process):
+    Path("local-repo").mkdir()
+    repo = GitRepo(Path("local-repo"))
+    (repo.path / "test-file").touch()
+    repo.add_all()
+    repo.commit()
+    fake_process.register(
+        [
+            fake_process.any(max=1),
+            "-c",
+            "pack.compression=1",
+            "-c",
+            "pack.threads=4",
+            "push",
+            fake_process.any(),
+        ]
+    )
+
+    repo.push_url(
+        remote_url="https://example.com/repo",
+        remote_branch="test-branch",
+        compression_level=1,
+        threads=4,
+    )
+
+    assert len(fake_process.calls) == 1
+
+
 @pytest.mark.usefixtures("empty_working_directory")
 def test_push_url_raises_git_error_on_subprocess_error(mocker):
     """Push subprocess fails."""
@@ -1158,6 +1269,64 @@ def test_fetching_undefined_remote(empty_repository: Path) -> None:
     assert git_error.value.details == f"cannot fetch undefined remote: {remote!r}"
 
 
+def test_fetch_head(repository_with_commit: RepositoryDefinition, tmp_path: Path):
+    """Fetch another repository's HEAD and tags, removing stale tags."""
+    source = repository_with_commit.repository_path
+    source_refs = pygit2.Repository(source).references
+    source_refs.create("refs/tags/v1", repository_with_commit.commit)
+    repo_dir = tmp_path / "other-repo"
+    repo_dir.mkdir()
+    repo = GitRepo(repo_dir)
+    (repo_dir / "other-file").touch()
+    repo.add_all()
+    pygit2.Repository(repo_dir).references.create("refs/tags/stale", repo.commit())
+
+    commit = repo.fetch_head(source)
+
+    assert commit == repository_with_commit.commit
+    assert [ref for ref in pygit2.Repository(repo_dir).references if "tags" in ref] == [
+        "refs/tags/v1"
+    ]
+
+
+def test_fetch_head_error(empty_repository: Path, tmp_path: Path):
+    with pytest.raises(GitError) as git_error:
+        GitRepo(empty_repository).fetch_head(tmp_path / "not-a-repo")
+
+    assert cast(str, git_error.value.details).startswith(
+        f"Could not fetch from {str(tmp_path / 'not-a-repo')!r}"
+    )
+
+
+def test_reset_soft(repository_with_commit: RepositoryDefinition):
+    """Move the branch without changing the index or working tree."""
+    repo_dir = repository_with_commit.repository_path
+    repo = GitRepo(repo_dir)
+    (repo_dir / "Some file").write_text("changed")
+    repo.add_all()
+    new_commit = repo.commit("2")
+
+    repo.reset_soft(repository_with_commit.commit)
+
+    pygit_repo = pygit2.Repository(repo_dir)
+    assert str(pygit_repo.head.target) == repository_with_commit.commit
+    assert not pygit_repo.head_is_detached
+    assert (repo_dir / "Some file").read_text() == "changed"
+    assert pygit_repo.status() == {"Some file": pygit2.enums.FileStatus.INDEX_MODIFIED}
+    assert new_commit in pygit_repo
+
+
+def test_reset_soft_error(repository_with_commit: RepositoryDefinition):
+    repo_dir = repository_with_commit.repository_path
+
+    with pytest.raises(GitError) as git_error:
+        GitRepo(repo_dir).reset_soft("0" * 40)
+
+    assert git_error.value.details == (
+        f"Could not reset the git repository in {str(repo_dir)!r} to '0000000'."
+    )
+
+
 @pytest.mark.parametrize(
     ("commit_str", "is_valid"),
     [
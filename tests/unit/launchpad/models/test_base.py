@@ -159,3 +159,82 @@ def test_setattr_protected_attributes(fake_obj, item):
     setattr(fake_obj, item, expected)
 
     assert getattr(fake_obj, item) is expected
+
+
+def test_getattr_uses_snapshot(fake_obj, mock_lplib_entry):
+    mock_lplib_entry.lp_attributes = ["abcd"]
+    first = fake_obj.abcd
+    mock_lplib_entry.abcd = "changed"
+
+    assert fake_obj.abcd is first
+
+
+def test_lp_refresh_clears_snapshot(fake_obj, mock_lplib_entry):
+    mock_lplib_entry.lp_attributes = ["abcd"]
+    _ = fake_obj.abcd
+    mock_lplib_entry.abcd = "changed"
+
+    fake_obj.lp_refresh()
+
+    mock_lplib_entry.lp_refresh.assert_called_once_with()
+    assert fake_obj.abcd == "changed"
+
+
+def test_setattr_clears_snapshot(fake_obj, mock_lplib_entry):
+    mock_lplib_entry.lp_attributes = ["abcd"]
+    _ = fake_obj.abcd
+
+    fake_obj.abcd = "changed"
+
+    assert fake_obj.abcd == "changed"
+
+
+def test_annotations_evaluated_once(monkeypatch, fake_launchpad, mock_lplib_entry):
+    class AnnotationsObject(FakeLaunchpadObject):
+        some_attribute: str
+        other_attribute: str
+
+    test_obj = AnnotationsObject(fake_launchpad, mock_lplib_entry)
+    _ = test_obj.some_attribute
+    mock_get_annotations = mock.Mock()
+    monkeypatch.setattr(
+        "craft_application.launchpad.util.get_annotations", mock_get_annotations
+    )
+
+    _ = test_obj.other_attribute
+    test_obj.other_attribute = "value"
+
+    mock_get_annotations.assert_not_called()
+
+
+def test_prefetch(fake_launchpad, mock_lplib_entry):
+    class PrefetchObject(FakeLaunchpadObject):
+        _attr_map = {"mapped": "abcd", "nested": "efgh.ijkl"}
+
+        annotated: str
+
+    mock_lplib_entry.configure_mock(
+        lp_attributes=["abcd", "annotated", "efgh"],
+        lp_entries=[],
+        abcd="abcd value",
+        annotated="annotated value",
+    )
+    test_obj = PrefetchObject(fake_launchpad, mock_lplib_entry)
+
+    test_obj.prefetch()
+    mock_lplib_entry.configure_mock(abcd="changed", annotated="changed")
+
+    mock_lplib_entry.lp_refresh.assert_called_once_with()
+    assert test_obj.abcd == "abcd value"
+    assert test_obj.mapped == "abcd value"
+    assert test_obj.annotated == "annotated value"
+    # Nested paths are only fetched on request, as they may need another request.
+    assert "nested" not in test_obj._snapshot
+
+
+def test_prefetch_items(fake_obj, mock_lplib_entry):
+    mock_lplib_entry.configure_mock(lp_attributes=["abcd", "efgh"], abcd=1, efgh=2)
+
+    fake_obj.prefetch("abcd")
+
+    assert fake_obj._snapshot == {"abcd": 1}
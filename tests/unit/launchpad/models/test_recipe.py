@@ -15,12 +15,19 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for launchpad recipe models."""
 
+import time
 from unittest import mock
 
 import pytest
 from craft_application.launchpad import CharmRecipe, RecipeType, RockRecipe, SnapRecipe
-from craft_application.launchpad.models import get_recipe_class
+from craft_application.launchpad.errors import BuildError
+from craft_application.launchpad.models import (
+    BuildRequest,
+    BuildRequestState,
+    get_recipe_class,
+)
 from craft_application.launchpad.models.recipe import BaseRecipe
+from lazr.restfulclient.resource import Entry
 
 
 def test_get_recipe_class():
@@ -49,3 +56,84 @@ def test_standard_recipe_architectures():
             project="project",
             architectures=["amd64"],
         )
+
+
+def _entry(resource_type: str, **kwargs):
+    return mock.MagicMock(
+        __class__=Entry,
+        resource_type_link=f"http://blah#{resource_type}",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def build_request_entry():
+    return _entry(
+        "snap_build_request",
+        status="Pending",
+        builds=[_entry("snap_build"), _entry("snap_build")],
+    )
+
+
+@pytest.fixture
+def snap_recipe(fake_launchpad, build_request_entry):
+    recipe_entry = _entry("snap")
+    recipe_entry.requestBuilds.return_value = build_request_entry
+    return SnapRecipe(fake_launchpad, recipe_entry)
+
+
+def test_request_builds_does_not_wait(snap_recipe, build_request_entry):
+    request = snap_recipe.request_builds(channels={"snapcraft": "edge"})
+
+    assert isinstance(request, BuildRequest)
+    assert request.get_state() == BuildRequestState.PENDING
+    snap_recipe.get_entry().requestBuilds.assert_called_once_with(
+        archive="/ubuntu/+archive/primary",
+        pocket="Updates",
+        channels={"snapcraft": "edge"},
+    )
+    build_request_entry.lp_refresh.assert_not_called()
+
+
+def test_build_request_poll(snap_recipe, build_request_entry):
+    request = snap_recipe.request_builds()
+
+    assert not request.poll()
+    build_request_entry.status = "Completed"
+    assert request.poll()
+    assert len(request.get_builds()) == 2
+
+
+def test_build_request_get_builds_pending(snap_recipe):
+    request = snap_recipe.request_builds()
+
+    with pytest.raises(RuntimeError, match="has not finished"):
+        request.get_builds()
+
+
+def test_build_waits_for_request(monkeypatch, snap_recipe, build_request_entry):
+    def _complete():
+        build_request_entry.status = "Completed"
+
+    build_request_entry.lp_refresh.side_effect = _complete
+    mock_sleep = mock.Mock()
+    monkeypatch.setattr("time.sleep", mock_sleep)
+
+    builds = snap_recipe.build()
+
+    assert len(builds) == 2
+    mock_sleep.assert_called_once_with(0.5)
+
+
+def test_build_request_wait_failed(snap_recipe, build_request_entry):
+    build_request_entry.status = "Failed"
+
+    with pytest.raises(BuildError, match="Build request failed"):
+        snap_recipe.request_builds().wait()
+
+
+def test_build_request_wait_deadline(snap_recipe):
+    request = snap_recipe.request_builds()
+
+    with pytest.raises(TimeoutError):
+        request.wait(deadline=time.monotonic_ns())
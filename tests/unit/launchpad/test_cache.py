@@ -0,0 +1,96 @@
+#  This file is part of craft-application.
+#
+#  Copyright 2026 Canonical Ltd.
+#
+#  This program is free software: you can redistribute it and/or modify it
+#  under the terms of the GNU Lesser General Public License version 3, as
+#  published by the Free Software Foundation.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+#  SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the Launchpad response cache."""
+
+import os
+from unittest import mock
+
+import launchpadlib.launchpad
+import pytest
+from craft_application.launchpad import cache
+from craft_application.launchpad.launchpad import _Launchpadlib
+
+
+@pytest.fixture
+def response_cache(tmp_path):
+    return cache.BoundedCache(tmp_path / "cache", max_size=25)
+
+
+def test_get_set(response_cache):
+    response_cache.set("https://example.com/a", b"response")
+
+    assert response_cache.get("https://example.com/a") == b"response"
+    assert response_cache.get("https://example.com/b") is None
+
+
+def test_prune_least_recently_used(response_cache):
+    for key in ("a", "b"):
+        response_cache.set(key, b"0123456789")
+        os.utime(response_cache._get_key_path(key), (0, 0))
+    # Reading "a" makes "b" the least recently used response.
+    response_cache.get("a")
+
+    response_cache.set("c", b"0123456789")
+
+    assert response_cache.get("a") == b"0123456789"
+    assert response_cache.get("b") is None
+    assert response_cache.get("c") == b"0123456789"
+
+
+def test_set_prunes_periodically(tmp_path):
+    response_cache = cache.BoundedCache(tmp_path / "cache", max_size=800)
+
+    with mock.patch.object(response_cache, "prune") as mock_prune:
+        for key in range(9):
+            response_cache.set(str(key), b"0123456789")
+        mock_prune.assert_not_called()
+
+        response_cache.set("last", b"0123456789")
+
+    mock_prune.assert_called_once_with()
+
+
+def test_prune_resets_written_size(tmp_path):
+    response_cache = cache.BoundedCache(tmp_path / "cache", max_size=800)
+    for key in range(9):
+        response_cache.set(str(key), b"0123456789")
+
+    response_cache.prune()
+
+    with mock.patch.object(response_cache, "prune") as mock_prune:
+        response_cache.set("next", b"0123456789")
+    mock_prune.assert_not_called()
+
+
+def test_prune_ignores_temporary_files(response_cache, tmp_path):
+    temp_file = tmp_path / "cache" / cache.BoundedCache.TEMPFILE_PREFIX
+    temp_file.write_bytes(b"x" * 100)
+
+    response_cache.set("a", b"0123456789")
+
+    assert response_cache.get("a") == b"0123456789"
+
+
+def test_launchpadlib_uses_bounded_cache(monkeypatch, tmp_path):
+    mock_init = mock.Mock(return_value=None)
+    monkeypatch.setattr(launchpadlib.launchpad.Launchpad, "__init__", mock_init)
+
+    _Launchpadlib(mock.sentinel.credentials, None, None, "production", str(tmp_path))
+
+    used_cache = mock_init.call_args.args[4]
+    assert isinstance(used_cache, cache.BoundedCache)
+    assert used_cache._directory == str(tmp_path)
+    assert used_cache.max_size == cache.DEFAULT_CACHE_SIZE
@@ -13,7 +13,9 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
 import json
+import pathlib
 from datetime import datetime
 
 import craft_platforms
@@ -21,6 +23,8 @@ import pytest
 from craft_application import util
 from craft_application.models.manifest import (
     CraftManifest,
+    Hasher,
+    Hashes,
     ProjectManifest,
     SessionArtifactManifest,
 )
@@ -97,3 +101,72 @@ def test_session_report_rejections(session_report):
         "the artifact format is unknown",
         "the request was not recognized by any format inspector",
     ]
+
+
+@pytest.fixture
+def recorded_hashes(monkeypatch):
+    recorded = {}
+    monkeypatch.setattr(Hashes, "_recorded", recorded)
+    return recorded
+
+
+@pytest.mark.parametrize("data", [b"", b"some data", bytes(range(256)) * 50000])
+def test_hashes_from_path(tmp_path, data, recorded_hashes):
+    path = tmp_path / "artifact"
+    path.write_bytes(data)
+
+    hashes = Hashes.from_path(path)
+
+    assert hashes == Hashes(
+        sha1=hashlib.sha1(data).hexdigest(),  # noqa: S324 (insecure hash function)
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def test_hashes_from_paths(tmp_path, recorded_hashes):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"artifact-{i}"
+        path.write_text(f"artifact {i}")
+        paths.append(path)
+
+    hashes = Hashes.from_paths(paths, max_workers=3)
+
+    assert hashes == [Hashes.from_path(path) for path in paths]
+    assert len({h.sha256 for h in hashes}) == len(paths)
+
+
+def test_hasher():
+    hasher = Hasher()
+    hasher.update(b"some ")
+    hasher.update(memoryview(b"data"))
+
+    assert hasher.get_hashes() == Hashes(
+        sha1=hashlib.sha1(b"some data").hexdigest(),  # noqa: S324 (insecure hash function)
+        sha256=hashlib.sha256(b"some data").hexdigest(),
+    )
+
+
+def test_hashes_record(tmp_path, mocker, recorded_hashes):
+    path = tmp_path / "artifact"
+    path.write_text("packed")
+    hasher = Hasher()
+    hasher.update(b"packed")
+    hasher.get_hashes().record(path)
+    spy_open = mocker.spy(pathlib.Path, "open")
+
+    hashes = Hashes.from_path(path)
+
+    assert hashes == hasher.get_hashes()
+    spy_open.assert_not_called()
+
+
+def test_hashes_record_changed_file(tmp_path, recorded_hashes):
+    path = tmp_path / "artifact"
+    path.write_text("packed")
+    Hashes(sha1="stale", sha256="stale").record(path)
+    path.write_text("repacked with different contents")
+
+    hashes = Hashes.from_path(path)
+
+    assert hashes.sha256 == hashlib.sha256(path.read_bytes()).hexdigest()
@@ -0,0 +1,172 @@
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for remote-build project hashing."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+from craft_application.remote import hashing
+
+
+@pytest.fixture
+def project_tree(tmp_path):
+    project = tmp_path / "project"
+    (project / "src/sub").mkdir(parents=True)
+    (project / "file").write_text("file")
+    (project / "src/file").write_text("src")
+    (project / "src/sub/file").write_text("sub")
+    return project
+
+
+def _set_old_mtime(path: Path) -> None:
+    os.utime(path, ns=(0, 0))
+
+
+def test_iter_files_sorted(project_tree):
+    hasher = hashing.ProjectHasher(project_tree)
+
+    assert list(hasher.iter_files()) == ["file", "src/file", "src/sub/file"]
+
+
+@pytest.mark.parametrize("ignored", sorted(hashing.DEFAULT_IGNORED_PATHS))
+def test_iter_files_skips_ignored(project_tree, ignored):
+    (project_tree / ignored).mkdir()
+    (project_tree / ignored / "file").write_text("ignored")
+    (project_tree / "src" / ignored).mkdir()
+    (project_tree / "src" / ignored / "file").write_text("not ignored")
+
+    files = list(hashing.ProjectHasher(project_tree).iter_files())
+
+    assert f"{ignored}/file" not in files
+    assert f"src/{ignored}/file" in files
+
+
+@pytest.mark.parametrize("lifecycle_dir", sorted(hashing.LIFECYCLE_PATHS))
+def test_iter_files_skips_lifecycle_dirs(project_tree, lifecycle_dir):
+    (project_tree / "parts/my-part/state").mkdir(parents=True)
+    (project_tree / lifecycle_dir).mkdir(exist_ok=True)
+    (project_tree / lifecycle_dir / "file").write_text("ignored")
+
+    files = list(hashing.ProjectHasher(project_tree).iter_files())
+
+    assert f"{lifecycle_dir}/file" not in files
+
+
+@pytest.mark.parametrize("source_dir", sorted(hashing.LIFECYCLE_PATHS))
+def test_iter_files_hashes_source_dirs(project_tree, source_dir):
+    """Directories named like lifecycle directories may be sources."""
+    (project_tree / "parts/my-part").mkdir(parents=True)
+    (project_tree / source_dir).mkdir(exist_ok=True)
+    (project_tree / source_dir / "file").write_text("source")
+
+    files = list(hashing.ProjectHasher(project_tree).iter_files())
+
+    assert f"{source_dir}/file" in files
+
+
+def test_get_ignored_paths(project_tree):
+    assert hashing.get_ignored_paths(project_tree) == hashing.DEFAULT_IGNORED_PATHS
+
+    (project_tree / "parts/my-part/state").mkdir(parents=True)
+
+    assert hashing.get_ignored_paths(project_tree) == (
+        hashing.DEFAULT_IGNORED_PATHS | hashing.LIFECYCLE_PATHS
+    )
+
+
+def test_iter_files_does_not_follow_directory_symlinks(project_tree):
+    (project_tree / "link").symlink_to(project_tree / "src")
+
+    files = list(hashing.ProjectHasher(project_tree).iter_files())
+
+    assert not any(file.startswith("link") for file in files)
+
+
+def test_compute_matches_concatenated_digests(project_tree):
+    digests = "".join(
+        hashlib.md5(content.encode()).hexdigest()  # noqa: S324
+        for content in ("file", "src", "sub")
+    )
+    expected = hashlib.md5(digests.encode()).hexdigest()  # noqa: S324
+
+    assert hashing.ProjectHasher(project_tree, max_workers=2).compute() == expected
+
+
+def test_compute_uses_cache(project_tree, tmp_path):
+    cache_file = tmp_path / "cache" / "hashes.json"
+    for file in project_tree.rglob("file"):
+        _set_old_mtime(file)
+
+    first = hashing.ProjectHasher(project_tree, cache_file=cache_file)
+    first_hash = first.compute()
+    second = hashing.ProjectHasher(project_tree, cache_file=cache_file)
+    second_hash = second.compute()
+
+    assert first_hash == second_hash
+    assert (first.hits, first.misses) == (0, 3)
+    assert (second.hits, second.misses) == (3, 0)
+
+
+def test_compute_rehashes_changed_files(project_tree, tmp_path):
+    cache_file = tmp_path / "hashes.json"
+    for file in project_tree.rglob("file"):
+        _set_old_mtime(file)
+    first_hash = hashing.ProjectHasher(project_tree, cache_file=cache_file).compute()
+
+    (project_tree / "src/file").write_text("changed")
+    hasher = hashing.ProjectHasher(project_tree, cache_file=cache_file)
+
+    assert hasher.compute() != first_hash
+    assert (hasher.hits, hasher.misses) == (2, 1)
+
+
+def test_compute_does_not_cache_recent_files(project_tree, tmp_path):
+    cache_file = tmp_path / "hashes.json"
+    hashing.ProjectHasher(project_tree, cache_file=cache_file).compute()
+
+    hasher = hashing.ProjectHasher(project_tree, cache_file=cache_file)
+    hasher.compute()
+
+    assert hasher.hits == 0
+
+
+@pytest.mark.parametrize("contents", ["", "not json", '{"version": 0}', "[]"])
+def test_compute_ignores_invalid_cache(project_tree, tmp_path, contents):
+    cache_file = tmp_path / "hashes.json"
+    cache_file.write_text(contents)
+
+    hasher = hashing.ProjectHasher(project_tree, cache_file=cache_file)
+
+    assert hasher.compute() == hashing.ProjectHasher(project_tree).compute()
+    assert hasher.hits == 0
+
+
+@pytest.mark.parametrize("size", [0, 1, 1024 * 1024 + 1])
+def test_hash_file(tmp_path, size):
+    path = tmp_path / "file"
+    contents = os.urandom(size)
+    path.write_bytes(contents)
+
+    assert hashing.hash_file(path) == hashlib.md5(contents).hexdigest()  # noqa: S324
+
+
+def test_hash_file_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(hashing, "_MMAP_THRESHOLD", 10)
+    path = tmp_path / "file"
+    path.write_bytes(b"x" * 100)
+
+    assert hashing.hash_file(path) == hashlib.md5(b"x" * 100).hexdigest()  # noqa: S324
@@ -21,6 +21,7 @@ import pytest
 from craft_application.remote import (
     UnsupportedArchitectureError,
     get_build_id,
+    get_project_snapshot,
     rmtree,
     validate_architectures,
 )
@@ -122,6 +123,65 @@ def test_get_build_id_computed_is_unique_file_contents_modified():
     assert build_id_1 != build_id_2
 
 
+@pytest.mark.usefixtures("new_dir")
+def test_get_build_id_ignores_work_dirs():
+    """Git metadata and lifecycle work directories don't affect the build id."""
+    Path("test").write_text("Hello, World!", encoding="utf-8")
+    build_id_1 = get_build_id("test-app", "test-project", Path())
+
+    Path("parts/my-part/state").mkdir(parents=True)
+    for directory in (".git", ".craft", "parts", "stage", "prime"):
+        Path(directory).mkdir(exist_ok=True)
+        Path(directory, "file").write_text(directory, encoding="utf-8")
+    build_id_2 = get_build_id("test-app", "test-project", Path())
+
+    assert build_id_1 == build_id_2
+
+
+@pytest.mark.usefixtures("new_dir")
+def test_get_build_id_source_dirs():
+    """Source directories named like lifecycle directories affect the build id."""
+    Path("test").write_text("Hello, World!", encoding="utf-8")
+    build_id_1 = get_build_id("test-app", "test-project", Path())
+
+    for directory in ("parts", "stage", "prime"):
+        Path(directory).mkdir()
+        Path(directory, "file").write_text(directory, encoding="utf-8")
+    build_id_2 = get_build_id("test-app", "test-project", Path())
+
+    assert build_id_1 != build_id_2
+
+
+def test_get_build_id_with_cache(new_dir, tmp_path):
+    """Using a cache directory doesn't change the build id."""
+    project_dir = new_dir / "project"
+    project_dir.mkdir()
+    (project_dir / "test").write_text("Hello, World!", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    build_id_1 = get_build_id("test-app", "test-project", project_dir)
+    build_id_2 = get_build_id(
+        "test-app", "test-project", project_dir, cache_dir=cache_dir
+    )
+
+    assert build_id_1 == build_id_2
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_get_project_snapshot(new_dir):
+    """A snapshot contains the project directory and its build id."""
+    Path("test").write_text("Hello, World!", encoding="utf-8")
+    Path("subdir").mkdir()
+    Path("subdir/test").write_text("Hello, subdir!", encoding="utf-8")
+    Path("parts").mkdir()
+    Path("parts/ignored").touch()
+
+    snapshot = get_project_snapshot("test-app", "test-project", Path())
+
+    assert snapshot.project_dir == new_dir
+    assert snapshot.build_id == get_build_id("test-app", "test-project", Path())
+
+
 @pytest.mark.usefixtures("new_dir")
 def test_get_build_id_directory_does_not_exist_error():
     """Raise an error if the directory does not exist."""
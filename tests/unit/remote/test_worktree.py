@@ -14,11 +14,13 @@
 
 """Unit tests for the worktree module."""
 
+import shutil
 from pathlib import Path
 from unittest.mock import call
 
+import pygit2
 import pytest
-from craft_application.git import GitError
+from craft_application.git import GitError, GitRepo
 from craft_application.remote import RemoteBuildGitError, WorkTree
 
 
@@ -89,7 +91,7 @@ def test_worktree_init_dirty(mock_base_directory, mock_git_repo):
         call(Path().resolve() / "repo"),
         call().is_clean(),
         call().add_all(),
-        call().commit(),
+        call().commit(orphan=False),
     ]
 
 
@@ -99,3 +101,145 @@ def test_worktree_repo_dir():
     worktree = WorkTree(app_name="test-app", build_id="test-id", project_dir=Path())
 
     assert worktree.repo_dir == Path().resolve() / "repo"
+
+
+@pytest.fixture
+def real_worktree(tmp_path, mock_base_directory, mock_git_repo, mock_copytree):
+    """Use the real filesystem and git for WorkTrees of a project in tmp_path."""
+
+    def _save_cache_path(*parts: str) -> Path:
+        path = tmp_path.joinpath("cache", *parts)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    mock_base_directory.save_cache_path.side_effect = _save_cache_path
+    mock_git_repo.side_effect = GitRepo
+    mock_copytree.side_effect = shutil.copytree
+
+    project_dir = tmp_path / "project"
+    (project_dir / "subdir").mkdir(parents=True)
+    (project_dir / "unchanged").write_text("unchanged")
+    (project_dir / "modified").write_text("old")
+    (project_dir / "removed").write_text("removed")
+    (project_dir / "subdir" / "executable").write_text("#!/bin/sh")
+    return project_dir
+
+
+def _get_files(directory: Path) -> dict[str, tuple[bytes, int]]:
+    return {
+        str(path.relative_to(directory)): (path.read_bytes(), path.stat().st_mode)
+        for path in directory.rglob("*")
+        if path.is_file() and ".git" not in path.parts
+    }
+
+
+def _change_project(project_dir: Path) -> None:
+    (project_dir / "modified").write_text("new contents")
+    (project_dir / "removed").unlink()
+    (project_dir / "added").write_text("added")
+    (project_dir / "subdir" / "executable").chmod(0o755)
+
+
+def test_init_repo_sync(real_worktree):
+    worktree = WorkTree("test-app", "test-id", real_worktree)
+    worktree.init_repo()
+    first_commit = pygit2.Repository(worktree.repo_dir).head.target
+    unchanged_inode = (worktree.repo_dir / "unchanged").stat().st_ino
+
+    _change_project(real_worktree)
+    worktree.init_repo()
+
+    assert _get_files(worktree.repo_dir) == _get_files(real_worktree)
+    assert (worktree.repo_dir / "unchanged").stat().st_ino == unchanged_inode
+    repo = pygit2.Repository(worktree.repo_dir)
+    assert repo.status() == {}
+    head = repo.revparse_single("HEAD")
+    assert isinstance(head, pygit2.Commit)
+    assert head.parents == []
+    # The previous commit's objects are still in the object store.
+    assert first_commit in repo
+
+
+def test_init_repo_reuses_previous_build(real_worktree, tmp_path):
+    WorkTree("test-app", "test-id-1", real_worktree).init_repo()
+    _change_project(real_worktree)
+
+    worktree = WorkTree("test-app", "test-id-2", real_worktree)
+    worktree.init_repo()
+
+    assert not (tmp_path / "cache/test-app/remote-build/test-id-1").exists()
+    assert _get_files(worktree.repo_dir) == _get_files(real_worktree)
+    assert pygit2.Repository(worktree.repo_dir).status() == {}
+
+
+def test_init_repo_other_project_not_reused(real_worktree, tmp_path):
+    other_project = tmp_path / "other"
+    other_project.mkdir()
+    (other_project / "other-file").write_text("other")
+    WorkTree("test-app", "other-id", other_project).init_repo()
+
+    worktree = WorkTree("test-app", "test-id", real_worktree)
+    worktree.init_repo()
+
+    assert (tmp_path / "cache/test-app/remote-build/other-id/repo").is_dir()
+    assert _get_files(worktree.repo_dir) == _get_files(real_worktree)
+
+
+def test_init_repo_sync_project_repository(real_worktree):
+    """Commits are made on top of the project's own git history."""
+    project_repo = GitRepo(real_worktree)
+    project_repo.add_all()
+    project_commit = project_repo.commit("project commit")
+    worktree = WorkTree("test-app", "test-id", real_worktree)
+    worktree.init_repo()
+
+    _change_project(real_worktree)
+    worktree.init_repo()
+
+    assert _get_files(worktree.repo_dir) == _get_files(real_worktree)
+    head = pygit2.Repository(worktree.repo_dir).revparse_single("HEAD")
+    assert isinstance(head, pygit2.Commit)
+    assert [str(parent.id) for parent in head.parents] == [project_commit]
+
+
+def test_init_repo_sync_project_commits(real_worktree):
+    """New commits and tags in the project are fetched into the existing repo."""
+    project_repo = GitRepo(real_worktree)
+    project_repo.add_all()
+    first_commit = project_repo.commit("first commit")
+    project_refs = pygit2.Repository(real_worktree).references
+    project_refs.create("refs/tags/removed", first_commit)
+    worktree = WorkTree("test-app", "test-id", real_worktree)
+    worktree.init_repo()
+    build_commit = pygit2.Repository(worktree.repo_dir).head.target
+
+    _change_project(real_worktree)
+    project_repo.add_all()
+    second_commit = project_repo.commit("second commit")
+    project_refs.create("refs/tags/v1", second_commit)
+    project_refs.delete("refs/tags/removed")
+    worktree.init_repo()
+
+    repo = pygit2.Repository(worktree.repo_dir)
+    assert _get_files(worktree.repo_dir) == _get_files(real_worktree)
+    assert str(repo.head.target) == second_commit
+    assert repo.status() == {}
+    assert [ref for ref in repo.references if ref.startswith("refs/tags/")] == [
+        "refs/tags/v1"
+    ]
+    # The repo kept its own git directory rather than the project's.
+    assert build_commit in repo
+
+
+def test_init_repo_sync_unborn_project_repository(real_worktree):
+    """Commits are orphans when the project has no commits."""
+    GitRepo(real_worktree)
+    worktree = WorkTree("test-app", "test-id", real_worktree)
+    worktree.init_repo()
+
+    _change_project(real_worktree)
+    worktree.init_repo()
+
+    head = pygit2.Repository(worktree.repo_dir).revparse_single("HEAD")
+    assert isinstance(head, pygit2.Commit)
+    assert head.parents == []
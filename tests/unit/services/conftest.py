@@ -92,8 +92,8 @@ def fake_launchpad(app_metadata, mock_git_repository, mock_project_entry):
                 return_value=get_mock_lazr_entry(
                     "snap",
                     requestBuilds=get_mock_callable(
-                        return_value=get_mock_lazr_collection(
-                            [], status="Completed", builds=[]
+                        return_value=get_mock_lazr_entry(
+                            "snap_build_request", status="Completed", builds=[]
                         )
                     ),
                 )
@@ -102,8 +102,8 @@ def fake_launchpad(app_metadata, mock_git_repository, mock_project_entry):
                 return_value=get_mock_lazr_entry(
                     "snap",
                     requestBuilds=get_mock_callable(
-                        return_value=get_mock_lazr_collection(
-                            [], status="Completed", builds=[]
+                        return_value=get_mock_lazr_entry(
+                            "snap_build_request", status="Completed", builds=[]
                         )
                     ),
                 ),
@@ -25,6 +25,7 @@ from unittest import mock
 
 import craft_application
 import craft_cli
+import pydantic
 import pytest
 import pytest_subprocess
 import snaphelpers
@@ -291,3 +292,133 @@ def test_get_all(
     for var, value in environment_variables.items():
         config_name = var.partition("_")[2].lower()
         assert str(config[config_name]) == value
+
+
+class CountingHandler(config.ConfigHandler):
+    """A handler that counts how often each item is requested."""
+
+    calls: dict[str, int] = {}
+
+    def get_raw(self, item: str) -> str:
+        self.calls[item] = self.calls.get(item, 0) + 1
+        if item == "my_str":
+            return "from handler"
+        raise KeyError(item)
+
+
+@pytest.fixture
+def counting_config(monkeypatch, app_metadata):
+    monkeypatch.setattr(snaphelpers, "is_snap", lambda: False)
+    monkeypatch.setattr(CountingHandler, "calls", {})
+    service = config.ConfigService(
+        app_metadata, mock.Mock(), extra_handlers=[CountingHandler]
+    )
+    service.setup()
+    return service
+
+
+def test_get_resolves_once(counting_config):
+    assert counting_config.get("my_str") == "from handler"
+    assert counting_config.get("my_str") == "from handler"
+    assert counting_config.get("my_default_int") == -1
+    assert counting_config.get("my_default_int") == -1
+    with pytest.raises(KeyError):
+        counting_config.get("my_int")
+    with pytest.raises(KeyError):
+        counting_config.get("my_int")
+
+    assert CountingHandler.calls == {"my_str": 1, "my_default_int": 1, "my_int": 1}
+
+
+def test_refresh(monkeypatch, counting_config):
+    assert counting_config.get("my_default_int") == -1
+    snapshot = counting_config.get_snapshot()
+
+    monkeypatch.setenv("TESTCRAFT_MY_DEFAULT_INT", "5")
+
+    assert counting_config.get("my_default_int") == -1
+    assert counting_config.get_snapshot() is snapshot
+
+    counting_config.refresh()
+
+    assert counting_config.get("my_default_int") == 5
+    assert counting_config.get_snapshot()["my_default_int"] == 5
+
+
+def test_get_type_adapter_cached(monkeypatch, counting_config):
+    monkeypatch.setenv("TESTCRAFT_MY_INT", "1")
+    counting_config.get("my_int")
+    monkeypatch.setenv("TESTCRAFT_MY_INT", "2")
+    counting_config.refresh()
+    mock_adapter = mock.Mock(wraps=pydantic.TypeAdapter)
+    monkeypatch.setattr(pydantic, "TypeAdapter", mock_adapter)
+
+    assert counting_config.get("my_int") == 2
+    mock_adapter.assert_not_called()
+
+
+def test_get_snapshot(counting_config):
+    snapshot = counting_config.get_snapshot()
+
+    assert snapshot["my_str"] == "from handler"
+    assert snapshot["my_default_int"] == -1
+    assert "my_int" not in snapshot
+    with pytest.raises(TypeError):
+        snapshot["my_str"] = "something else"  # type: ignore[index]
+    assert counting_config.get_snapshot() == snapshot
+    assert all(count == 1 for count in CountingHandler.calls.values())
+
+
+def test_dump_snapshot(monkeypatch, counting_config):
+    monkeypatch.setenv("TESTCRAFT_MY_ARCH", "riscv64")
+    monkeypatch.setenv("CRAFT_VERBOSITY_LEVEL", "debug")
+    monkeypatch.delenv("CRAFT_PLATFORM", raising=False)
+    monkeypatch.delenv("TESTCRAFT_PLATFORM", raising=False)
+
+    dumped = json.loads(counting_config.dump_snapshot(exclude=["debug"]))
+
+    assert dumped["my_str"] == "from handler"
+    assert dumped["my_arch"] == launchpad.Architecture.RISCV64.value
+    assert dumped["verbosity_level"] == craft_cli.EmitterMode.DEBUG.value
+    assert dumped["my_default_bool"] is True
+    assert dumped["my_default_factory"] == {"dict": "yes"}
+    assert "debug" not in dumped
+    assert "platform" not in dumped  # None values aren't included.
+
+
+@pytest.mark.usefixtures("managed_mode")
+def test_resolved_config_in_managed_mode(monkeypatch, counting_config, app_metadata):
+    monkeypatch.setenv("TESTCRAFT_MY_INT", "3")
+    host_snapshot = counting_config.get_snapshot()
+    monkeypatch.setenv("CRAFT_RESOLVED_CONFIG", counting_config.dump_snapshot())
+    monkeypatch.delenv("TESTCRAFT_MY_INT")
+    monkeypatch.setenv("TESTCRAFT_MY_DEFAULT_INT", "5")
+    CountingHandler.calls.clear()
+
+    service = config.ConfigService(
+        app_metadata, mock.Mock(), extra_handlers=[CountingHandler]
+    )
+    service.setup()
+
+    assert service.get("my_str") == "from handler"
+    assert service.get("my_int") == 3
+    assert service.get("my_default_factory") == {"dict": "yes"}
+    assert service.get_snapshot() == {**host_snapshot, "my_default_int": 5}
+    # Environment variables in the instance still take priority.
+    assert service.get("my_default_int") == 5
+    assert CountingHandler.calls == {}
+
+
+@pytest.mark.parametrize("resolved", ["", "not json", "[]"])
+@pytest.mark.usefixtures("managed_mode")
+def test_resolved_config_invalid(monkeypatch, app_metadata, resolved):
+    monkeypatch.setattr(snaphelpers, "is_snap", lambda: False)
+    monkeypatch.setenv("CRAFT_RESOLVED_CONFIG", resolved)
+    monkeypatch.setattr(CountingHandler, "calls", {})
+
+    service = config.ConfigService(
+        app_metadata, mock.Mock(), extra_handlers=[CountingHandler]
+    )
+    service.setup()
+
+    assert service.get("my_str") == "from handler"
@@ -29,6 +29,7 @@ import os
 import pathlib
 import re
 import textwrap
+import threading
 from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock, call
@@ -92,6 +93,33 @@ def test_create_session(fetch_service, mocker):
     assert env == {"GOPROXY": "direct"}
 
 
+def test_create_session_per_thread(fetch_service, mocker):
+    """Each thread has its own session."""
+    mocker.patch.object(
+        fetch,
+        "create_session",
+        side_effect=[
+            fetch.SessionData(id="main", token="token"),  # noqa: S106
+            fetch.SessionData(id="thread", token="token"),  # noqa: S106
+        ],
+    )
+    mocker.patch.object(fetch, "_get_gateway", return_value="test-gateway")
+    mocker.patch.object(services.ProxyService, "configure")
+    fetch_service._proxy_cert = pathlib.Path("test-cert.pem")
+    main_instance = MagicMock()
+    thread_instance = MagicMock()
+
+    fetch_service.create_session(instance=main_instance)
+    thread = threading.Thread(
+        target=fetch_service.create_session, kwargs={"instance": thread_instance}
+    )
+    thread.start()
+    thread.join()
+
+    assert fetch_service._session_data == fetch.SessionData(id="main", token="token")  # noqa: S106
+    assert fetch_service._instance is main_instance
+
+
 def test_create_session_not_setup(fetch_service):
     """Error if the create_session is called before the fetch service is setup."""
     expected_error = re.escape(
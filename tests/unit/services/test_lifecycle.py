@@ -17,8 +17,14 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses
+import json
+import os
 import re
+import shutil
+import threading
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest import mock
@@ -32,7 +38,7 @@ import pytest_check
 from craft_application import errors, models, util
 from craft_application.errors import EmptyBuildPlanError, PartsLifecycleError
 from craft_application.services import lifecycle
-from craft_application.util import repositories
+from craft_application.util import repositories, step_cache
 from craft_cli import CraftError
 from craft_parts import (
     Action,
@@ -239,6 +245,61 @@ def test_get_step_failure(step_name):
         lifecycle._get_step(step_name)
 
 
+@pytest.mark.parametrize(
+    ("actions", "parts", "expected"),
+    [
+        pytest.param([], {}, [], id="empty"),
+        pytest.param(
+            [Action("a", Step.PULL), Action("b", Step.PULL), Action("a", Step.BUILD)],
+            {},
+            [set(), set(), {0}],
+            id="independent",
+        ),
+        pytest.param(
+            [
+                Action("a", Step.PULL),
+                Action("b", Step.PULL),
+                Action("a", Step.BUILD),
+                Action("a", Step.STAGE),
+                Action("b", Step.BUILD),
+            ],
+            {"b": {"after": ["a"]}},
+            [set(), {0}, {0}, {0, 1, 2}, {1, 3}],
+            id="after",
+        ),
+        pytest.param(
+            [Action("a", Step.BUILD), Action("a", Step.STAGE), Action("b", Step.BUILD)],
+            {},
+            [set(), {0}, {1}],
+            id="barrier",
+        ),
+        pytest.param(
+            [
+                Action("a", Step.BUILD),
+                Action("b", Step.BUILD),
+                Action("a", Step.STAGE),
+                Action("b", Step.STAGE),
+                Action("a", Step.PRIME),
+                Action("b", Step.PRIME),
+            ],
+            {},
+            [set(), set(), {0, 1}, {1, 2}, {2, 3}, {3, 4}],
+            id="serial-steps",
+        ),
+    ],
+)
+def test_get_action_dependencies(actions, parts, expected):
+    assert lifecycle._get_action_dependencies(actions, parts) == expected
+
+
+def test_prefixed_stream(emitter):
+    with lifecycle._prefixed_stream("my-part") as stream:
+        os.write(stream, b"line 1\nline 2\n")
+
+    emitter.assert_progress("[my-part] line 1", permanent=True)
+    emitter.assert_progress("[my-part] line 2", permanent=True)
+
+
 # endregion
 # region PartsLifecycle tests
 def test_init_success(app_metadata, fake_project, fake_services, tmp_path):
@@ -494,6 +555,446 @@ def test_run_success(
         assert executor.method_calls == executor_calls
 
 
+def test_run_timings(
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+    tmp_path,
+):
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    parts_dir = tmp_path / "parts"
+    lcm = fake_parts_lifecycle._lcm
+    lcm.project_info.dirs.parts_dir = parts_dir
+    lcm.plan.return_value = [
+        Action("my-part", Step.PULL),
+        Action("my-part", Step.BUILD),
+    ]
+
+    fake_parts_lifecycle.run("build")
+
+    timings = fake_parts_lifecycle.timings
+    assert [
+        (record.category, record.part, record.step) for record in timings.records
+    ] == [
+        ("plan", None, None),
+        ("action", "my-part", "pull"),
+        ("action", "my-part", "build"),
+    ]
+    assert timings.get_totals("part")["my-part"].count == 2
+    report = json.loads((parts_dir / "timings.json").read_text())
+    assert len(report["records"]) == 3
+    trace = json.loads((parts_dir / "timings.trace.json").read_text())
+    assert len(trace["traceEvents"]) == 3
+
+
+def test_run_timings_reset(
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+    tmp_path,
+):
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    fake_parts_lifecycle._lcm.project_info.dirs.parts_dir = tmp_path
+    fake_parts_lifecycle._lcm.plan.return_value = []
+
+    fake_parts_lifecycle.run("build")
+    fake_parts_lifecycle.run("build")
+
+    assert len(fake_parts_lifecycle.timings.records) == 1
+
+
+def test_run_parallel(
+    monkeypatch,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+):
+    monkeypatch.setenv("CRAFT_PARALLEL_PARTS", "true")
+    monkeypatch.setenv("CRAFT_PARALLEL_BUILD_COUNT", "4")
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    actions = [
+        Action(part, step)
+        for step in (Step.PULL, Step.BUILD, Step.STAGE, Step.PRIME)
+        for part in ("part-a", "part-b", "part-c")
+    ]
+    lcm = fake_parts_lifecycle._lcm
+    lcm.plan.return_value = actions
+    executor = lcm.action_executor.return_value.__enter__.return_value
+    lock = threading.Lock()
+    executed: list[Action] = []
+
+    def _execute(action, stdout, stderr):
+        os.write(stdout, f"output of {action.step.name}\n".encode())
+        with lock:
+            executed.append(action)
+
+    executor.execute.side_effect = _execute
+
+    fake_parts_lifecycle.run("prime")
+
+    assert sorted(executed, key=actions.index) == actions
+    for part in ("part-a", "part-b", "part-c"):
+        assert [a for a in executed if a.part_name == part] == [
+            a for a in actions if a.part_name == part
+        ]
+    # Steps shared between parts are run in plan order.
+    assert [a for a in executed if a.step in (Step.STAGE, Step.PRIME)] == actions[6:]
+
+
+def test_run_parallel_serial_steps_dont_overlap(
+    monkeypatch,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+):
+    monkeypatch.setenv("CRAFT_PARALLEL_PARTS", "true")
+    monkeypatch.setenv("CRAFT_PARALLEL_BUILD_COUNT", "4")
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    actions = [
+        Action("part-a", Step.PULL),
+        Action("part-b", Step.PULL),
+        Action("part-a", Step.BUILD),
+        Action("part-a", Step.STAGE),
+        Action("part-b", Step.BUILD),
+        Action("part-c", Step.PULL),
+    ]
+    lcm = fake_parts_lifecycle._lcm
+    lcm.plan.return_value = actions
+    executor = lcm.action_executor.return_value.__enter__.return_value
+    lock = threading.Lock()
+    running: list[Action] = []
+    overlaps: list[list[Action]] = []
+
+    def _execute(action, stdout, stderr):
+        with lock:
+            running.append(action)
+            if any(a.step not in lifecycle.PARALLEL_STEPS for a in running[:-1]) or (
+                action.step not in lifecycle.PARALLEL_STEPS and len(running) > 1
+            ):
+                overlaps.append(list(running))
+        # part-b is slow to build, so staging part-a could overlap its build.
+        time.sleep(0.2 if action == Action("part-b", Step.BUILD) else 0.05)
+        with lock:
+            running.remove(action)
+
+    executor.execute.side_effect = _execute
+
+    fake_parts_lifecycle.run("stage")
+
+    assert executor.execute.call_count == len(actions)
+    assert overlaps == []
+
+
+@pytest.mark.parametrize(
+    ("action", "part", "build_environment", "expected"),
+    [
+        (Action("my-part", Step.PULL), {}, None, False),
+        (Action("my-part", Step.PULL), {"stage-packages": ["hello"]}, None, True),
+        (Action("my-part", Step.PULL), {"stage-snaps": ["hello"]}, None, True),
+        (Action("my-part", Step.BUILD), {"stage-packages": ["hello"]}, None, False),
+        (Action("my-part", Step.BUILD), {}, ["FOO=bar"], True),
+        (Action("my-part", Step.STAGE), {}, ["FOO=bar"], False),
+    ],
+)
+def test_is_exclusive_action(
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+    action,
+    part,
+    build_environment,
+    expected,
+):
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    fake_parts_lifecycle._project.parts["my-part"] = part
+    fake_parts_lifecycle._manager_kwargs["build_environment"] = build_environment
+
+    assert fake_parts_lifecycle._is_exclusive_action(action) == expected
+
+
+def test_run_parallel_exclusive_actions(
+    monkeypatch,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+):
+    monkeypatch.setenv("CRAFT_PARALLEL_PARTS", "true")
+    monkeypatch.setenv("CRAFT_PARALLEL_BUILD_COUNT", "4")
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    actions = [Action(f"part-{i}", Step.PULL) for i in range(4)]
+    lcm = fake_parts_lifecycle._lcm
+    lcm.plan.return_value = actions
+    monkeypatch.setattr(
+        fake_parts_lifecycle,
+        "_is_exclusive_action",
+        lambda action: action.part_name in ("part-0", "part-1", "part-2"),
+    )
+    executor = lcm.action_executor.return_value.__enter__.return_value
+    lock = threading.Lock()
+    running: set[str] = set()
+    max_exclusive = 0
+
+    def _execute(action, stdout, stderr):
+        nonlocal max_exclusive
+        with lock:
+            running.add(action.part_name)
+            exclusive = len(running - {"part-3"})
+            max_exclusive = max(max_exclusive, exclusive)
+        time.sleep(0.05)
+        with lock:
+            running.remove(action.part_name)
+
+    executor.execute.side_effect = _execute
+
+    fake_parts_lifecycle.run("pull")
+
+    assert executor.execute.call_count == len(actions)
+    assert max_exclusive == 1
+
+
+def test_run_parallel_failure(
+    monkeypatch,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+):
+    monkeypatch.setenv("CRAFT_PARALLEL_PARTS", "true")
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    actions = [
+        Action("part-a", Step.PULL),
+        Action("part-a", Step.BUILD),
+        Action("part-a", Step.STAGE),
+    ]
+    lcm = fake_parts_lifecycle._lcm
+    lcm.plan.return_value = actions
+    executor = lcm.action_executor.return_value.__enter__.return_value
+    executor.execute.side_effect = [None, craft_parts.PartsError("build failed")]
+
+    with pytest.raises(PartsLifecycleError, match="^build failed$"):
+        fake_parts_lifecycle.run("stage")
+
+    assert executor.execute.call_count == 2
+
+
+@pytest.fixture
+def step_cache_lifecycle(
+    monkeypatch,
+    tmp_path,
+    fake_parts_lifecycle,
+    fake_services,
+    fake_platform,
+    fake_host_architecture,
+):
+    monkeypatch.setenv("CRAFT_STEP_CACHE", "true")
+    fake_services.get("build_plan").set_platforms(fake_platform)
+    skip_if_build_plan_empty(fake_services.get("build_plan"))
+    parts_dir = tmp_path / "parts"
+    part_dir = parts_dir / "some-part"
+    (part_dir / "src").mkdir(parents=True)
+    (part_dir / "src" / "source").write_text("source")
+    (part_dir / "state").mkdir()
+    (part_dir / "state" / "pull").write_text("pull state")
+    lcm = fake_parts_lifecycle._lcm
+    lcm.project_info.dirs.parts_dir = parts_dir
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    def _execute(action, stdout, stderr):
+        (part_dir / "install").mkdir(exist_ok=True)
+        (part_dir / "install" / "built").write_text("built")
+        (part_dir / "state" / "build").write_text("build state")
+
+    executor.execute.side_effect = _execute
+    return fake_parts_lifecycle
+
+
+def _reset_part(part_dir: Path) -> None:
+    shutil.rmtree(part_dir / "install")
+    (part_dir / "state" / "build").unlink()
+
+
+def test_run_step_cache(step_cache_lifecycle, tmp_path, emitter):
+    part_dir = tmp_path / "parts" / "some-part"
+    lcm = step_cache_lifecycle._lcm
+    lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    step_cache_lifecycle.run("build")
+    _reset_part(part_dir)
+    step_cache_lifecycle.run("build")
+
+    assert executor.execute.call_count == 1
+    assert (part_dir / "install" / "built").read_text() == "built"
+    assert (part_dir / "state" / "build").read_text() == "build state"
+    emitter.assert_progress("Building some-part (restored from cache)")
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda part_dir: (part_dir / "src" / "source").write_text("changed"),
+            id="source",
+        ),
+        pytest.param(
+            lambda part_dir: (part_dir / "state" / "pull").write_text("changed"),
+            id="pull-state",
+        ),
+    ],
+)
+def test_run_step_cache_miss(step_cache_lifecycle, tmp_path, change):
+    part_dir = tmp_path / "parts" / "some-part"
+    lcm = step_cache_lifecycle._lcm
+    lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    step_cache_lifecycle.run("build")
+    _reset_part(part_dir)
+    change(part_dir)
+    step_cache_lifecycle.run("build")
+
+    assert executor.execute.call_count == 2
+
+
+def test_run_step_cache_miss_app_version(step_cache_lifecycle, tmp_path):
+    lcm = step_cache_lifecycle._lcm
+    lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    step_cache_lifecycle.run("build")
+    _reset_part(tmp_path / "parts" / "some-part")
+    new_app = dataclasses.replace(step_cache_lifecycle._app)
+    object.__setattr__(new_app, "version", "99.0")
+    step_cache_lifecycle._app = new_app
+    step_cache_lifecycle.run("build")
+
+    assert executor.execute.call_count == 2
+
+
+def test_run_step_cache_miss_plugin(step_cache_lifecycle, tmp_path, monkeypatch):
+    lcm = step_cache_lifecycle._lcm
+    lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    step_cache_lifecycle.run("build")
+    _reset_part(tmp_path / "parts" / "some-part")
+
+    class AppNilPlugin(craft_parts.plugins.nil_plugin.NilPlugin):
+        __version__ = "1.0"
+
+    monkeypatch.setitem(craft_parts.plugins.plugins._plugins, "nil", AppNilPlugin)
+    step_cache_lifecycle.run("build")
+
+    assert executor.execute.call_count == 2
+
+
+def test_get_plugin_info():
+    class VersionedPlugin(craft_parts.plugins.nil_plugin.NilPlugin):
+        __version__ = 2
+
+    craft_parts.plugins.register({"versioned": VersionedPlugin})
+    try:
+        assert lifecycle._get_plugin_info("versioned") == {
+            "module": __name__,
+            "class": "test_get_plugin_info.<locals>.VersionedPlugin",
+            "version": "2",
+        }
+    finally:
+        craft_parts.plugins.unregister("versioned")
+    assert lifecycle._get_plugin_info("nil") == {
+        "module": "craft_parts.plugins.nil_plugin",
+        "class": "NilPlugin",
+        "version": craft_parts.__version__,
+    }
+    assert lifecycle._get_plugin_info("not-a-plugin") is None
+    assert lifecycle._get_plugin_info(None) is None
+
+
+def test_run_step_cache_rerun(step_cache_lifecycle, tmp_path):
+    part_dir = tmp_path / "parts" / "some-part"
+    lcm = step_cache_lifecycle._lcm
+    lcm.plan.return_value = [
+        Action("some-part", Step.BUILD, action_type=ActionType.RERUN)
+    ]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    step_cache_lifecycle.run("build")
+    step_cache_lifecycle.run("build")
+
+    assert executor.execute.call_count == 2
+    # The rerun still stored its outputs for fresh builds.
+    lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+    _reset_part(part_dir)
+    step_cache_lifecycle.run("build")
+    assert executor.execute.call_count == 2
+
+
+def test_run_step_cache_disabled(step_cache_lifecycle, monkeypatch, tmp_path):
+    monkeypatch.setenv("CRAFT_STEP_CACHE", "false")
+    lcm = step_cache_lifecycle._lcm
+    lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+    executor = lcm.action_executor.return_value.__enter__.return_value
+
+    step_cache_lifecycle.run("build")
+    _reset_part(tmp_path / "parts" / "some-part")
+    step_cache_lifecycle.run("build")
+
+    assert executor.execute.call_count == 2
+    assert not (tmp_path / "cache" / "steps").exists()
+
+
+def test_run_step_cache_prune(step_cache_lifecycle, monkeypatch, mocker, tmp_path):
+    monkeypatch.setenv("CRAFT_STEP_CACHE_MAX_MIB", "3")
+    mock_prune = mocker.patch.object(step_cache.StepCache, "prune")
+    step_cache_lifecycle._lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+
+    step_cache_lifecycle.run("build")
+
+    mock_prune.assert_called_once_with(3 * 1024 * 1024)
+
+
+@pytest.mark.usefixtures("managed_mode")
+def test_run_step_cache_managed(step_cache_lifecycle, monkeypatch, tmp_path):
+    managed_cache_dir = tmp_path / "managed-cache"
+    monkeypatch.setattr(step_cache, "MANAGED_CACHE_DIR", managed_cache_dir)
+    step_cache_lifecycle._lcm.plan.return_value = [Action("some-part", Step.BUILD)]
+
+    step_cache_lifecycle.run("build")
+
+    assert len(list(managed_cache_dir.glob("*/*"))) == 1
+    assert not (tmp_path / "cache" / "steps").exists()
+
+
+def test_get_build_cache_key_threads(step_cache_lifecycle, mocker):
+    def _compute(part_name):
+        time.sleep(0.05)
+        return f"key-{part_name}"
+
+    mock_compute = mocker.patch.object(
+        step_cache_lifecycle, "_compute_build_cache_key", side_effect=_compute
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        keys = list(
+            pool.map(step_cache_lifecycle._get_build_cache_key, ["some-part"] * 4)
+        )
+
+    assert keys == ["key-some-part"] * 4
+    mock_compute.assert_called_once_with("some-part")
+
+
 def test_run_no_step(
     fake_parts_lifecycle, fake_services, fake_platform, fake_host_architecture
 ):
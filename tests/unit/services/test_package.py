@@ -17,15 +17,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import os
+import tarfile
+from pathlib import Path
 
 import pytest
 from craft_application import errors, models, util
+from craft_application.models.manifest import Hashes
 from craft_application.services import package
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 @pytest.fixture
 def fake_project_dict(request, fake_project_yaml: str):
@@ -142,3 +143,118 @@ def test_update_project_variable_optional(
     service.update_project()
 
     assert fake_services.get("project").get().version == "foo"
+
+
+@pytest.fixture
+def prime_dir(tmp_path) -> Path:
+    prime_dir = tmp_path / "prime"
+    (prime_dir / "bin").mkdir(parents=True)
+    (prime_dir / "bin" / "app").write_bytes(b"#!/bin/sh\necho hello\n")
+    (prime_dir / "bin" / "app").chmod(0o755)
+    (prime_dir / "data").mkdir()
+    (prime_dir / "data" / "b.txt").write_text("b")
+    (prime_dir / "data" / "a.txt").write_text("a")
+    (prime_dir / "link").symlink_to("bin/app")
+    return prime_dir
+
+
+def _read_archive(path: Path, compression: str) -> list[tarfile.TarInfo]:
+    if compression == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+        with (
+            path.open("rb") as file,
+            zstandard.ZstdDecompressor().stream_reader(file) as reader,
+            tarfile.open(fileobj=reader, mode="r|") as tar,
+        ):
+            return list(tar)
+    with tarfile.open(path) as tar:
+        return tar.getmembers()
+
+
+@pytest.mark.parametrize("compression", ["none", "xz", "zstd"])
+def test_archive_writer(tmp_path, prime_dir, compression, emitter):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    dest = tmp_path / "artifact.tar"
+
+    result = package.ArchiveWriter(compression, mtime=1234).write(prime_dir, dest)
+
+    assert result == dest
+    members = _read_archive(dest, compression)
+    assert [member.name for member in members] == [
+        ".",
+        "./bin",
+        "./bin/app",
+        "./data",
+        "./data/a.txt",
+        "./data/b.txt",
+        "./link",
+    ]
+    assert {member.mtime for member in members} == {1234}
+    assert {(member.uid, member.gid, member.uname) for member in members} == {
+        (0, 0, "")
+    }
+    app = next(member for member in members if member.name == "./bin/app")
+    assert app.mode == 0o755
+    link = next(member for member in members if member.name == "./link")
+    assert link.issym()
+    assert link.linkname == "bin/app"
+
+
+@pytest.mark.parametrize("compression", ["none", "xz", "zstd"])
+def test_archive_writer_reproducible(tmp_path, prime_dir, compression, emitter):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    first = package.ArchiveWriter(compression, threads=1).write(
+        prime_dir, tmp_path / "first"
+    )
+    os.utime(prime_dir / "data" / "a.txt", (0, 0))
+
+    second = package.ArchiveWriter(compression, threads=4).write(
+        prime_dir, tmp_path / "second"
+    )
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_archive_writer_source_date_epoch(monkeypatch, tmp_path, prime_dir, emitter):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    dest = package.ArchiveWriter("none").write(prime_dir, tmp_path / "artifact")
+
+    assert {member.mtime for member in _read_archive(dest, "none")} == {1700000000}
+
+
+def test_archive_writer_lzma_fallback(mocker, tmp_path, prime_dir, emitter):
+    mocker.patch("shutil.which", return_value=None)
+
+    dest = package.ArchiveWriter("xz").write(prime_dir, tmp_path / "artifact")
+
+    assert len(_read_archive(dest, "xz")) == 7
+    emitter.assert_debug("xz executable not found, compressing on a single thread.")
+
+
+def test_archive_writer_records_hashes(mocker, tmp_path, prime_dir, emitter):
+    dest = package.ArchiveWriter("xz").write(prime_dir, tmp_path / "artifact")
+    spy_open = mocker.spy(Path, "open")
+
+    hashes = Hashes.from_path(dest)
+
+    spy_open.assert_not_called()
+    assert hashes.sha256 == hashlib.sha256(dest.read_bytes()).hexdigest()
+
+
+def test_archive_writer_write_many(tmp_path, prime_dir, emitter):
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    (other_dir / "file").write_text("other")
+    archives = {
+        tmp_path / "default.tar.xz": prime_dir,
+        tmp_path / "other.tar.xz": other_dir,
+    }
+
+    result = package.ArchiveWriter(threads=4).write_many(archives)
+
+    assert result == list(archives)
+    assert [m.name for m in _read_archive(result[1], "xz")] == [".", "./file"]
+    assert len(_read_archive(result[0], "xz")) == 7
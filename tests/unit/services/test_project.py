@@ -21,12 +21,14 @@ import textwrap
 from typing import Any, cast
 from unittest import mock
 
+import craft_parts
 import craft_platforms
 import freezegun
 import pytest
 import pytest_mock
 from craft_application import errors, models
 from craft_application.application import AppMetadata
+from craft_application.models.grammar import GrammarAwareProject
 from craft_application.services.project import ProjectService
 from craft_application.services.service_factory import ServiceFactory
 from craft_parts import ProjectVar, ProjectVarInfo
@@ -148,6 +150,81 @@ def test_load_raw_project_invalid(
     assert exc_info.value.details == details
 
 
+@pytest.fixture
+def raw_project_cache_dir(tmp_path, mocker):
+    cache_dir = tmp_path / "project-cache"
+    mocker.patch.object(
+        ProjectService,
+        "raw_project_cache_dir",
+        new_callable=mock.PropertyMock,
+        return_value=cache_dir,
+    )
+    return cache_dir
+
+
+def test_load_raw_project_uses_cache(
+    app_metadata, fake_services, project_path, raw_project_cache_dir, mocker
+):
+    (project_path / "testcraft.yaml").write_text("name: thing!")
+    first_service = ProjectService(
+        app_metadata, fake_services, project_dir=project_path
+    )
+    assert first_service._load_raw_project() == {"name": "thing!"}
+    assert len(list(raw_project_cache_dir.iterdir())) == 1
+
+    mock_load = mocker.patch("craft_application.util.safe_yaml_load")
+    second_service = ProjectService(
+        app_metadata, fake_services, project_dir=project_path
+    )
+
+    assert second_service._load_raw_project() == {"name": "thing!"}
+    mock_load.assert_not_called()
+
+
+def test_load_raw_project_cache_invalidated(
+    app_metadata, fake_services, project_path, raw_project_cache_dir
+):
+    project_file = project_path / "testcraft.yaml"
+    project_file.write_text("name: thing!")
+    ProjectService(
+        app_metadata, fake_services, project_dir=project_path
+    )._load_raw_project()
+
+    project_file.write_text("name: other")
+    service = ProjectService(app_metadata, fake_services, project_dir=project_path)
+
+    assert service._load_raw_project() == {"name": "other"}
+
+
+def test_load_raw_project_corrupt_cache(
+    app_metadata, fake_services, project_path, raw_project_cache_dir
+):
+    (project_path / "testcraft.yaml").write_text("name: thing!")
+    service = ProjectService(app_metadata, fake_services, project_dir=project_path)
+    service._load_raw_project()
+    for cache_file in raw_project_cache_dir.iterdir():
+        cache_file.write_bytes(b"not a pickle")
+
+    service = ProjectService(app_metadata, fake_services, project_dir=project_path)
+
+    assert service._load_raw_project() == {"name": "thing!"}
+
+
+def test_load_raw_project_cache_disabled(
+    app_metadata, fake_services, project_path, mocker
+):
+    mocker.patch.object(
+        ProjectService,
+        "raw_project_cache_dir",
+        new_callable=mock.PropertyMock,
+        return_value=None,
+    )
+    (project_path / "testcraft.yaml").write_text("name: thing!")
+    service = ProjectService(app_metadata, fake_services, project_dir=project_path)
+
+    assert service._load_raw_project() == {"name": "thing!"}
+
+
 @pytest.mark.parametrize(
     ("platforms", "expected"),
     [
@@ -664,6 +741,115 @@ def test_render_for_platform_independent(
     assert actual_build_on in expected_build_ons
 
 
+@pytest.mark.usefixtures("fake_project_file")
+def test_render_for_memoized(
+    real_project_service: ProjectService, fake_platform, mocker
+):
+    spy_from_yaml = mocker.spy(real_project_service._app.ProjectClass, "from_yaml_data")
+    kwargs = {"build_for": "riscv64", "build_on": "amd64", "platform": fake_platform}
+
+    first = real_project_service.render_for(**kwargs)
+    first.name = "modified"
+    second = real_project_service.render_for(**kwargs)
+
+    assert spy_from_yaml.call_count == 1
+    assert second is not first
+    assert second.name != "modified"
+    assert second == real_project_service.render_for(**kwargs)
+
+
+@pytest.mark.usefixtures("fake_project_file")
+def test_render_for_memoized_restores_project_vars(
+    real_project_service: ProjectService, fake_platform
+):
+    kwargs = {"build_for": "riscv64", "build_on": "amd64", "platform": fake_platform}
+    real_project_service.render_for(**kwargs)
+    first_vars = real_project_service.project_vars
+    real_project_service.render_for(
+        build_for="s390x", build_on="amd64", platform=fake_platform
+    )
+
+    real_project_service.render_for(**kwargs)
+
+    assert real_project_service.project_vars == first_vars
+    assert real_project_service.project_vars is not first_vars
+
+
+@pytest.mark.usefixtures("fake_project_file")
+def test_render_for_shares_grammar_validation(
+    real_project_service: ProjectService, fake_platform, mocker
+):
+    spy_validate = mocker.spy(GrammarAwareProject, "validate_grammar")
+    spy_info = mocker.spy(craft_parts, "ProjectInfo")
+
+    for build_on in ("amd64", "arm64", "riscv64"):
+        real_project_service.render_for(
+            build_for="riscv64", build_on=build_on, platform=fake_platform
+        )
+
+    assert spy_validate.call_count == 1
+    assert spy_info.call_count == 1
+
+
+@pytest.mark.usefixtures("fake_project_file")
+def test_render_for_invalidated_by_raw_project(
+    real_project_service: ProjectService, fake_platform, mocker
+):
+    kwargs = {"build_for": "riscv64", "build_on": "amd64", "platform": fake_platform}
+    real_project_service.render_for(**kwargs)
+    raw = real_project_service.get_raw()
+    raw["version"] = "99"
+    mocker.patch.object(real_project_service, "_load_raw_project", return_value=raw)
+
+    assert real_project_service.render_for(**kwargs).version == "99"
+
+
+@pytest.mark.usefixtures("fake_project_file")
+def test_render_for_invalidated_by_app_cache_key(
+    real_project_service: ProjectService, fake_platform, mocker
+):
+    kwargs = {"build_for": "riscv64", "build_on": "amd64", "platform": fake_platform}
+    mocker.patch.object(real_project_service, "_app_render_cache_key", return_value=1)
+    version = {"version": "1.0"}
+
+    def preprocess(project, **_):
+        project.update(version)
+
+    mocker.patch.object(
+        real_project_service, "_app_preprocess_project", side_effect=preprocess
+    )
+    spy_info = mocker.spy(craft_parts, "ProjectInfo")
+    assert real_project_service.render_for(**kwargs).version == "1.0"
+    version["version"] = "2.0"
+    assert real_project_service.render_for(**kwargs).version == "1.0"
+
+    real_project_service._app_render_cache_key.return_value = 2  # type: ignore[attr-defined]
+
+    assert real_project_service.render_for(**kwargs).version == "2.0"
+    assert spy_info.call_count == 2
+
+
+@pytest.mark.usefixtures("fake_project_file")
+def test_render_for_project_info_invalidated_by_parallel_build_count(
+    real_project_service: ProjectService, fake_platform, monkeypatch, mocker
+):
+    spy_info = mocker.spy(craft_parts, "ProjectInfo")
+    monkeypatch.setenv("TESTCRAFT_PARALLEL_BUILD_COUNT", "2")
+    real_project_service.render_for(
+        build_for="riscv64", build_on="amd64", platform=fake_platform
+    )
+    monkeypatch.setenv("TESTCRAFT_PARALLEL_BUILD_COUNT", "3")
+
+    real_project_service.render_for(
+        build_for="riscv64", build_on="arm64", platform=fake_platform
+    )
+
+    assert [call.kwargs["parallel_build_count"] for call in spy_info.mock_calls] == [
+        2,
+        3,
+    ]
+
+
 @pytest.mark.parametrize(
     "build_for", [arch.value for arch in craft_platforms.DebianArchitecture]
 )
@@ -19,6 +19,7 @@ import enum
 import pathlib
 import pkgutil
 import subprocess
+import time
 import uuid
 from typing import NamedTuple
 from unittest import mock
@@ -31,7 +32,7 @@ import pytest_subprocess
 from craft_application import errors
 from craft_application.services import provider
 from craft_application.services.service_factory import ServiceFactory
-from craft_application.util import snap_config
+from craft_application.util import snap_config, step_cache
 from craft_cli import emit
 from craft_providers import bases, lxd, multipass
 from craft_providers.actions.snap_installer import Snap
@@ -375,6 +376,9 @@ def test_forward_environment_variables(monkeypatch, provider_service, fake_servi
             for config, value in fake_services.get("config").get_all().items()
             if config not in provider.IGNORE_CONFIG_ITEMS and value is not None
         },
+        "CRAFT_RESOLVED_CONFIG": fake_services.get("config").dump_snapshot(
+            exclude=provider.IGNORE_CONFIG_ITEMS
+        ),
     }
 
 
@@ -382,7 +386,7 @@ def test_forward_environment_variables(monkeypatch, provider_service, fake_servi
 def test_get_lxd_provider(monkeypatch, provider_service, lxd_remote, check):
     monkeypatch.setenv("CRAFT_LXD_REMOTE", lxd_remote)
     mock_provider = mock.Mock()
-    monkeypatch.setattr(provider, "LXDProvider", mock_provider)
+    monkeypatch.setattr(lxd, "LXDProvider", mock_provider)
 
     actual = provider_service.get_provider("lxd")
 
@@ -650,6 +654,24 @@ def test_instance(
         emitter.assert_progress("Launching managed .+ instance...", regex=True)
 
 
+def test_instance_step_cache(
+    monkeypatch, mocker, tmp_path, provider_service, fake_build_info, mock_provider
+):
+    monkeypatch.setenv("CRAFT_STEP_CACHE", "true")
+    step_cache_dir = tmp_path / "cache" / "steps"
+    mocker.patch.object(
+        type(provider_service), "step_cache_dir", new_callable=mock.PropertyMock
+    ).return_value = step_cache_dir
+
+    with provider_service.instance(fake_build_info, work_dir=tmp_path) as instance:
+        pass
+
+    assert step_cache_dir.is_dir()
+    instance.mount.assert_any_call(
+        host_source=step_cache_dir, target=step_cache.MANAGED_CACHE_DIR
+    )
+
+
 @pytest.mark.parametrize("clean_existing", [True, False])
 def test_instance_clean_existing(
     tmp_path,
@@ -677,6 +699,169 @@ def test_instance_clean_existing(
         )
 
 
+@pytest.fixture
+def instance_pool(monkeypatch, tmp_path, provider_service):
+    monkeypatch.setenv("CRAFT_INSTANCE_POOL_SIZE", "2")
+    monkeypatch.setattr(
+        provider.ProviderService, "instance_pool_dir", tmp_path / "pool"
+    )
+    pool = provider_service.get_instance_pool()
+    assert pool is not None
+    return pool
+
+
+def test_instance_pool_disabled(provider_service):
+    assert provider_service.get_instance_pool() is None
+
+
+def test_instance_pool_claim(tmp_path):
+    pool = provider.InstancePool(tmp_path, size=2, max_age=3600)
+
+    assert pool.claim("key") is None
+    name = pool.reserve("key", prefix="testcraft-pool")
+    assert name is not None
+    assert name.startswith("testcraft-pool-")
+    assert pool.claim("key") is None  # Reserved instances aren't ready.
+    pool.mark_ready(name)
+    assert pool.claim("other-key") is None
+
+    assert pool.claim("key") == name
+    assert pool.claim("key") is None
+    assert pool.stats == provider.InstancePoolStats(hits=1, misses=4, refills=1)
+
+
+def test_instance_pool_shared(tmp_path):
+    """Pools using the same directory share instances."""
+    pool = provider.InstancePool(tmp_path, size=2, max_age=3600)
+    other_pool = provider.InstancePool(tmp_path, size=2, max_age=3600)
+
+    names = [pool.reserve("key", prefix="pool"), other_pool.reserve("key", "pool")]
+    assert pool.reserve("key", prefix="pool") is None  # The pool is full.
+    for name in names:
+        assert name is not None
+        pool.mark_ready(name)
+
+    assert {pool.claim("key"), other_pool.claim("key")} == set(names)
+
+
+def test_instance_pool_evict(tmp_path, mocker):
+    pool = provider.InstancePool(tmp_path, size=1, max_age=3600)
+    old = pool.reserve("key", prefix="pool")
+    pool.size = 2
+    new = pool.reserve("key", prefix="pool")
+    pool.release(old)  # Releasing a reserved instance frees its space.
+    newest = pool.reserve("key", prefix="pool")
+    pool.size = 1
+
+    assert pool.evict() == [new]
+    mocker.patch("time.time", return_value=time.time() + 7200)
+    assert pool.evict() == [newest]
+    assert pool.stats.evictions == 2
+
+
+def test_instance_pool_evict_abandoned(tmp_path, mocker):
+    """Instances reserved by processes that have exited are evicted."""
+    pool = provider.InstancePool(tmp_path, size=3, max_age=3600)
+    mock_getpid = mocker.patch("os.getpid", return_value=1000)
+    abandoned = pool.reserve("key", prefix="pool")
+    ready = pool.reserve("key", prefix="pool")
+    assert ready is not None
+    pool.mark_ready(ready)
+    mock_getpid.return_value = 2000
+    pool.reserve("key", prefix="pool")
+    mocker.patch.object(provider, "_process_exists", side_effect=[False])
+
+    assert pool.evict() == [abandoned]  # Instances from this process are kept.
+    assert pool.claim("key") == ready
+
+
+def test_instance_from_pool(
+    tmp_path, provider_service, mock_provider, instance_pool, emitter
+):
+    arch = craft_platforms.DebianArchitecture.from_host()
+    base_name = craft_platforms.DistroBase("ubuntu", "24.04")
+    build_info = craft_platforms.BuildInfo("foo", arch, arch, base_name)
+    prepare_instance = mock.Mock()
+    base = provider_service.get_base(
+        bases.BaseName("ubuntu", "24.04"), instance_name="test"
+    )
+    pool_key = f"{mock_provider.name}:{base.alias.value}:{base.compatibility_tag}"
+    pooled_name = instance_pool.reserve(pool_key, prefix="testcraft-pool")
+    assert pooled_name is not None
+    instance_pool.mark_ready(pooled_name)
+
+    with provider_service.instance(
+        build_info, work_dir=tmp_path, prepare_instance=prepare_instance
+    ) as instance:
+        pass
+
+    # Refills run in the background without holding up the instance.
+    assert all(thread.daemon for thread in provider_service._pool_threads)
+    for thread in provider_service._pool_threads:
+        thread.join()
+    # The pooled instance is used while the pool is refilled to its size.
+    launches = [
+        launch.kwargs
+        for launch in mock_provider.launched_environment.mock_calls
+        if "instance_name" in launch.kwargs
+    ]
+    assert [launch for launch in launches if "prepare_instance" in launch] == [
+        {
+            "project_name": "full-project",
+            "project_path": tmp_path,
+            "instance_name": pooled_name,
+            "base_configuration": mock.ANY,
+            "allow_unstable": True,
+            "prepare_instance": None,
+            "use_base_instance": True,
+            "shutdown_delay_mins": None,
+        }
+    ]
+    refilled = {launch["instance_name"] for launch in launches} - {pooled_name}
+    assert len(refilled) == 2
+    prepare_instance.assert_called_once_with(instance)
+    mock_provider.create_environment.assert_called_once_with(instance_name=pooled_name)
+    mock_provider.create_environment.return_value.delete.assert_called_once_with()
+    assert instance_pool.stats == provider.InstancePoolStats(hits=1, refills=3)
+    assert instance_pool.claim(pool_key) in refilled
+    emitter.assert_debug(
+        r"Instance pool statistics: InstancePoolStats\(hits=1, misses=0, .*\)",
+        regex=True,
+    )
+
+
+def test_delete_instance_error(mock_provider, emitter):
+    mock_provider.create_environment.return_value.delete.side_effect = (
+        craft_providers.ProviderError("oops")
+    )
+
+    provider.ProviderService._delete_instance(mock_provider, "pooled")
+
+    emitter.assert_debug("Could not delete instance 'pooled': oops")
+    emitter.assert_progress(
+        "Could not delete instance 'pooled'. It may need to be deleted manually.",
+        permanent=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"clean_existing": True}, {"use_base_instance": False}],
+)
+def test_instance_pool_unused(
+    tmp_path, provider_service, mock_provider, instance_pool, kwargs
+):
+    arch = craft_platforms.DebianArchitecture.from_host()
+    base_name = craft_platforms.DistroBase("ubuntu", "24.04")
+    build_info = craft_platforms.BuildInfo("foo", arch, arch, base_name)
+
+    with provider_service.instance(build_info, work_dir=tmp_path, **kwargs):
+        pass
+
+    mock_provider.launched_environment.assert_called_once()
+    assert instance_pool.stats == provider.InstancePoolStats()
+
+
 def test_load_bashrc(emitter):
     """Test that we are able to load the bashrc file from the craft-application package."""
     bashrc = pkgutil.get_data("craft_application", "misc/instance_bashrc")
@@ -895,9 +1080,7 @@ def test_run_managed(
 ):
     mock_fetch = mock.MagicMock()
     fake_services.register("fetch", mock.Mock(return_value=mock_fetch))
-    fake_services.get_class(
-        "fetch"
-    ).is_active.return_value = fetch  # # pyright: ignore[reportFunctionMemberAccess]
+    fake_services.get_class("fetch").is_active.return_value = fetch  # # pyright: ignore[reportFunctionMemberAccess]
     monkeypatch.setattr("sys.argv", ["[unused]", "pack", "--verbose"])
     instance_context = (
         mock_provider.launched_environment.return_value.__enter__.return_value
@@ -919,3 +1102,36 @@ def test_run_managed(
     )
 
     instance_context.prepare_instance.assert_called_once_with(mock.ANY)
+
+
+def test_run_managed_output_prefix(
+    monkeypatch: pytest.MonkeyPatch,
+    provider_service: provider.ProviderService,
+    default_app_metadata: craft_application.AppMetadata,
+    fake_build_info: craft_platforms.BuildInfo,
+    mock_provider,
+    emitter,
+):
+    monkeypatch.setattr("sys.argv", ["[unused]", "pack"])
+    instance_context = (
+        mock_provider.launched_environment.return_value.__enter__.return_value
+    )
+    process = instance_context.execute_popen.return_value
+    process.__enter__.return_value = process
+    process.stdout = ["Packed it\n"]
+    process.returncode = 0
+
+    provider_service.run_managed(
+        fake_build_info, enable_fetch_service=False, output_prefix="my-platform"
+    )
+
+    instance_context.execute_run.assert_not_called()
+    instance_context.execute_popen.assert_called_once_with(
+        ["testcraft", "pack"],
+        cwd=default_app_metadata.managed_instance_project_path,
+        env=mock.ANY,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    emitter.assert_progress("[my-platform] Packed it", permanent=True)
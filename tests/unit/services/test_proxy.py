@@ -15,13 +15,14 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for the ProxyService."""
 
+import base64
 import pathlib
 import subprocess
+import threading
 from unittest import mock
-from unittest.mock import call
 
 import pytest
-from craft_application import services
+from craft_application import errors, services
 from craft_providers.lxd import LXDInstance
 
 
@@ -33,13 +34,23 @@ def proxy_service(app, fake_services, fake_project):
     )
 
 
+def _provisioned(*results: str) -> subprocess.CompletedProcess[str]:
+    """Fake the output of a provisioning script with the given step results."""
+    stdout = "".join(
+        f"@@craft-provision@@ {index} {result} 0 1000000\n"
+        for index, result in enumerate(results)
+    )
+    return subprocess.CompletedProcess([], returncode=0, stdout=stdout, stderr="")
+
+
 def test_configure_build_instance(mocker, proxy_service, new_dir):
     proxy_cert = pathlib.Path("test.pem")
-    proxy_cert.touch()
+    proxy_cert.write_text("certificate")
     proxy_service.configure(
         proxy_cert=pathlib.Path("test.pem"), http_proxy="test-proxy"
     )
     mock_instance = mock.MagicMock(spec_set=LXDInstance)
+    mock_instance.execute_run.return_value = _provisioned("0", "0", "0")
 
     env = proxy_service.configure_instance(mock_instance)
     assert env == {
@@ -50,151 +61,84 @@ def test_configure_build_instance(mocker, proxy_service, new_dir):
         "GOPROXY": "direct",
     }
 
-    proxy_service.finalize_instance_configuration(mock_instance)
-
-    # Execution calls on the instance
-    default_args = {
-        "check": True,
-        "stdout": subprocess.PIPE,
-        "stderr": subprocess.PIPE,
-        "text": True,
-    }
-    assert mock_instance.execute_run.mock_calls == [
-        call(
-            ["mkdir", "-p", "/usr/local/share/ca-certificates"],
-            **default_args,
-        ),
-        call(
-            ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"],
-            **default_args,
-        ),
-        call(
-            ["test", "-d", "/etc/apt"],
-            **default_args,
-        ),
-        call(
-            ["/bin/rm", "-Rf", "/var/lib/apt/lists"],
-            **default_args,
-        ),
-        call(
-            ["apt", "update"],
-            **default_args,
-        ),
-        call(
-            ["mkdir", "-p", "/root/.pip"],
-            **default_args,
-        ),
-        call(
-            ["systemctl", "restart", "snapd"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.http=test-proxy"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.https=test-proxy"],
-            **default_args,
-        ),
+    # Everything is configured with a single command.
+    mock_instance.execute_run.assert_called_once_with(
+        ["/bin/sh", "-s"],
+        input=mocker.ANY,
+        check=False,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    script = mock_instance.execute_run.call_args.kwargs["input"]
+    expected = [
+        "mkdir -p /usr/local/share/ca-certificates",
+        "base64 -d > /usr/local/share/ca-certificates/local-ca.crt",
+        base64.b64encode(b"certificate").decode(),
+        "/usr/sbin/update-ca-certificates",
+        "if test -d /etc/apt > /dev/null 2>&1; then",
+        "base64 -d > /etc/apt/apt.conf.d/99proxy",
+        "/bin/rm -Rf /var/lib/apt/lists",
+        "apt update",
+        "mkdir -p /root/.pip",
+        "base64 -d > /root/.pip/pip.conf",
     ]
+    positions = [script.index(line) for line in expected]
+    assert positions == sorted(positions)
+    mock_instance.push_file.assert_not_called()
+    mock_instance.push_file_io.assert_not_called()
 
-    # Files pushed to the instance
-    assert mock_instance.push_file.mock_calls == [
-        call(
-            source=proxy_cert,
-            destination=pathlib.Path("/usr/local/share/ca-certificates/local-ca.crt"),
-        )
-    ]
+    mock_instance.execute_run.reset_mock()
+    mock_instance.execute_run.return_value = _provisioned("0")
+    proxy_service.finalize_instance_configuration(mock_instance)
 
-    assert mock_instance.push_file_io.mock_calls == [
-        call(
-            destination=pathlib.Path("/etc/apt/apt.conf.d/99proxy"),
-            content=mocker.ANY,
-            file_mode="0644",
-        ),
-        call(
-            destination=pathlib.Path("/root/.pip/pip.conf"),
-            content=mocker.ANY,
-            file_mode="0644",
-        ),
+    mock_instance.execute_run.assert_called_once()
+    script = mock_instance.execute_run.call_args.kwargs["input"]
+    expected = [
+        "systemctl restart snapd",
+        "snap set system proxy.http=test-proxy",
+        "snap set system proxy.https=test-proxy",
     ]
+    positions = [script.index(line) for line in expected]
+    assert positions == sorted(positions)
 
 
-def test_configure_skip_apt(mocker, proxy_service, new_dir, emitter):
+def test_configure_skip_apt(proxy_service, new_dir, emitter):
     """Skip apt configuration if apt isn't available."""
     proxy_cert = pathlib.Path("test.pem")
     proxy_cert.touch()
     proxy_service.configure(
         proxy_cert=pathlib.Path("test.pem"), http_proxy="test-proxy"
     )
-
-    def _has_apt(*args, **kwargs):
-        if args == (["test", "-d", "/etc/apt"],):
-            raise subprocess.CalledProcessError(1, [])
-        return mock.DEFAULT
-
     mock_instance = mock.MagicMock(spec_set=LXDInstance)
-    mock_instance.execute_run.side_effect = _has_apt
+    mock_instance.execute_run.return_value = _provisioned("0", "skip", "0")
 
     proxy_service.configure_instance(mock_instance)
-    proxy_service.finalize_instance_configuration(mock_instance)
 
     emitter.assert_debug(
         "Not configuring the proxy for apt because apt isn't available in the instance."
     )
-    # Execution calls on the instance
-    default_args = {
-        "check": True,
-        "stdout": subprocess.PIPE,
-        "stderr": subprocess.PIPE,
-        "text": True,
-    }
-    assert mock_instance.execute_run.mock_calls == [
-        call(
-            ["mkdir", "-p", "/usr/local/share/ca-certificates"],
-            **default_args,
-        ),
-        call(
-            ["/bin/sh", "-c", "/usr/sbin/update-ca-certificates > /dev/null"],
-            **default_args,
-        ),
-        call(
-            ["test", "-d", "/etc/apt"],
-            **default_args,
-        ),
-        call(
-            ["mkdir", "-p", "/root/.pip"],
-            **default_args,
-        ),
-        call(
-            ["systemctl", "restart", "snapd"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.http=test-proxy"],
-            **default_args,
-        ),
-        call(
-            ["snap", "set", "system", "proxy.https=test-proxy"],
-            **default_args,
-        ),
-    ]
 
-    # Files pushed to the instance
-    assert mock_instance.push_file.mock_calls == [
-        call(
-            source=proxy_cert,
-            destination=pathlib.Path("/usr/local/share/ca-certificates/local-ca.crt"),
-        )
-    ]
 
-    assert mock_instance.push_file_io.mock_calls == [
-        call(
-            destination=pathlib.Path("/root/.pip/pip.conf"),
-            content=mocker.ANY,
-            file_mode="0644",
-        ),
-    ]
+def test_configure_failure(proxy_service, new_dir):
+    proxy_cert = pathlib.Path("test.pem")
+    proxy_cert.touch()
+    proxy_service.configure(
+        proxy_cert=pathlib.Path("test.pem"), http_proxy="test-proxy"
+    )
+    mock_instance = mock.MagicMock(spec_set=LXDInstance)
+    process = _provisioned("0", "100")
+    process.stdout += "@@craft-provision-output@@ 1 E: Failed to fetch\n"
+    process.returncode = 100
+    mock_instance.execute_run.return_value = process
+
+    with pytest.raises(errors.ProvisioningError) as exc_info:
+        proxy_service.configure_instance(mock_instance)
+
+    assert str(exc_info.value) == (
+        "Failed to provision instance: Configuring Apt (exit code 100)"
+    )
+    assert exc_info.value.details == "E: Failed to fetch"
 
 
 def test_not_configured(proxy_service, emitter):
@@ -208,3 +152,31 @@ def test_not_configured(proxy_service, emitter):
         "Skipping proxy configuration because the proxy service isn't configured."
     )
     mock_instance.assert_not_called()
+
+
+def test_configure_per_thread(proxy_service, new_dir):
+    """Configuring the proxy in another thread doesn't affect other threads."""
+    pathlib.Path("test.pem").write_text("certificate")
+    proxy_service.configure(
+        proxy_cert=pathlib.Path("test.pem"), http_proxy="main-proxy"
+    )
+    thread_envs = []
+
+    def configure_in_thread(http_proxy: str) -> None:
+        if http_proxy:
+            proxy_service.configure(
+                proxy_cert=pathlib.Path("test.pem"), http_proxy=http_proxy
+            )
+        mock_instance = mock.MagicMock(spec_set=LXDInstance)
+        mock_instance.execute_run.return_value = _provisioned("0", "0", "0")
+        thread_envs.append(proxy_service.configure_instance(mock_instance))
+
+    for http_proxy in ["thread-proxy", ""]:
+        thread = threading.Thread(target=configure_in_thread, args=(http_proxy,))
+        thread.start()
+        thread.join()
+
+    assert [env["http_proxy"] for env in thread_envs] == [
+        "thread-proxy",
+        "main-proxy",
+    ]
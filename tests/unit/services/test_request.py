@@ -15,12 +15,20 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Unit tests for the Request service."""
 
+import base64
+import contextlib
+import hashlib
+import threading
+from unittest import mock
 from unittest.mock import call
 
+import craft_cli
 import craft_cli.pytest_plugin
 import pytest
 import pytest_check
+import requests
 import responses
+from craft_application import errors
 from hypothesis import HealthCheck, given, settings, strategies
 
 
@@ -73,7 +81,7 @@ def test_download_with_progress(
     pytest_check.equal(output_file.read_bytes(), data, "Download data is incorrect")
     emitter.assert_interactions(
         [
-            call("progress_bar", "Downloading http://example/file", len(data)),
+            call("progress_bar", "Downloading http://example/file", 0),
             call("advance", len(data)),
         ]
     )
@@ -100,13 +108,7 @@ def test_download_files_with_progress(tmp_path, emitter, request_service, downlo
     results = request_service.download_files_with_progress(files)
 
     emitter.assert_interactions(
-        [
-            call(
-                "progress_bar",
-                f"Downloading {len(downloads)} files",
-                sum(len(dl) for dl in downloads.values()),
-            )
-        ]
+        [call("progress_bar", f"Downloading {len(downloads)} files", 0)]
     )
     for file in downloads.values():
         if len(file) > 0:  # Advance doesn't get called on empty files
@@ -114,3 +116,241 @@ def test_download_files_with_progress(tmp_path, emitter, request_service, downlo
 
     for url, path in results.items():
         assert path.read_bytes() == downloads[url]
+
+
+@responses.activate
+def test_download_chunks_resume(tmp_path, request_service):
+    data = b"0123456789"
+    (tmp_path / "file.partial").write_bytes(data[:4])
+    responses.add(
+        responses.GET,
+        "http://example/file",
+        status=206,
+        body=data[4:],
+        headers={"Content-Length": "6", "Content-Range": "bytes 4-9/10"},
+        match=[responses.matchers.header_matcher({"Range": "bytes=4-"})],
+    )
+
+    downloader = request_service.download_chunks("http://example/file", tmp_path)
+
+    assert list(downloader) == [10, 4, 6]
+    assert (tmp_path / "file").read_bytes() == data
+    assert not (tmp_path / "file.partial").exists()
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "first_response",
+    [
+        pytest.param({"status": 200, "body": b"0123456789"}, id="range-ignored"),
+        pytest.param({"status": 416}, id="range-not-satisfiable"),
+    ],
+)
+def test_download_chunks_resume_unsupported(tmp_path, request_service, first_response):
+    data = b"0123456789"
+    (tmp_path / "file.partial").write_bytes(b"junk")
+    responses.add(
+        responses.GET,
+        "http://example/file",
+        match=[responses.matchers.header_matcher({"Range": "bytes=4-"})],
+        **first_response,
+    )
+    responses.add(responses.GET, "http://example/file", body=data)
+
+    downloader = request_service.download_chunks("http://example/file", tmp_path)
+
+    assert sum(list(downloader)[1:]) == len(data)
+    assert (tmp_path / "file").read_bytes() == data
+    assert not (tmp_path / "file.partial").exists()
+
+
+@responses.activate
+def test_download_chunks_error(tmp_path, request_service):
+    responses.add(responses.GET, "http://example/file", status=404)
+
+    with pytest.raises(requests.HTTPError):
+        list(request_service.download_chunks("http://example/file", tmp_path))
+
+    assert not (tmp_path / "file").exists()
+
+
+@responses.activate
+def test_download_files_with_progress_concurrent(tmp_path, request_service):
+    urls = [f"http://example/file{i}" for i in range(3)]
+    # Every request must be in flight at the same time to pass the barrier.
+    barrier = threading.Barrier(len(urls), timeout=5)
+
+    def _callback(request):
+        barrier.wait()
+        return 200, {}, request.url.encode()
+
+    for url in urls:
+        responses.add_callback(responses.GET, url, callback=_callback)
+
+    results = request_service.download_files_with_progress(
+        dict.fromkeys(urls, tmp_path)
+    )
+
+    for url, path in results.items():
+        assert path.read_bytes() == url.encode()
+
+
+@responses.activate
+def test_download_files_with_progress_bounded(tmp_path, request_service, monkeypatch):
+    """No more than max_download_workers responses are open at once."""
+    monkeypatch.setattr(request_service, "max_download_workers", 2)
+    urls = [f"http://example/file{i}" for i in range(7)]
+    for url in urls:
+        responses.add(
+            responses.GET,
+            url,
+            body=url.encode(),
+            headers={"Content-Length": str(len(url))},
+        )
+    lock = threading.Lock()
+    open_responses = 0
+    max_open_responses = 0
+    get = request_service.get
+
+    @contextlib.contextmanager
+    def _counting_get(*args, **kwargs):
+        nonlocal open_responses, max_open_responses
+        with get(*args, **kwargs) as response:
+            with lock:
+                open_responses += 1
+                max_open_responses = max(max_open_responses, open_responses)
+            try:
+                yield response
+            finally:
+                with lock:
+                    open_responses -= 1
+
+    monkeypatch.setattr(request_service, "get", _counting_get)
+    progress = mock.MagicMock()
+    mock_progress_bar = mock.Mock()
+    mock_progress_bar.return_value.__enter__ = mock.Mock(return_value=progress)
+    mock_progress_bar.return_value.__exit__ = mock.Mock(return_value=False)
+    monkeypatch.setattr(craft_cli.emit, "progress_bar", mock_progress_bar)
+
+    results = request_service.download_files_with_progress(
+        dict.fromkeys(urls, tmp_path)
+    )
+
+    assert max_open_responses == 2
+    assert progress.total == sum(len(url) for url in urls)
+    for url, path in results.items():
+        assert path.read_bytes() == url.encode()
+
+
+@responses.activate
+def test_download_files_with_progress_failure(tmp_path, request_service):
+    responses.add(responses.GET, "http://example/good", body=b"good")
+    responses.add(responses.GET, "http://example/bad", status=500)
+
+    with pytest.raises(requests.HTTPError):
+        request_service.download_files_with_progress(
+            {"http://example/good": tmp_path, "http://example/bad": tmp_path}
+        )
+
+    assert not (tmp_path / "bad").exists()
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "header",
+    [
+        pytest.param("Repr-Digest", id="repr-digest"),
+        pytest.param("Digest", id="digest"),
+    ],
+)
+def test_download_chunks_server_digest(tmp_path, request_service, header):
+    data = b"0123456789"
+    digest = base64.b64encode(hashlib.sha256(data).digest()).decode()
+    value = f"sha-256=:{digest}:" if header == "Repr-Digest" else f"SHA-256={digest}"
+    responses.add(
+        responses.GET, "http://example/file", body=data, headers={header: value}
+    )
+
+    request_service.download_file("http://example/file", tmp_path)
+
+    assert (tmp_path / "file").read_bytes() == data
+
+
+@responses.activate
+def test_download_chunks_digest_mismatch(tmp_path, request_service):
+    responses.add(responses.GET, "http://example/file", body=b"corrupt")
+
+    with pytest.raises(errors.DownloadError, match="is corrupt"):
+        request_service.download_file(
+            "http://example/file",
+            tmp_path,
+            sha256=hashlib.sha256(b"0123456789").hexdigest(),
+        )
+
+    assert not (tmp_path / "file").exists()
+    assert not (tmp_path / "file.partial").exists()
+
+
+@responses.activate
+def test_download_chunks_resume_digest(tmp_path, request_service):
+    data = b"0123456789"
+    (tmp_path / "file.partial").write_bytes(data[:4])
+    responses.add(
+        responses.GET,
+        "http://example/file",
+        status=206,
+        body=data[4:],
+        headers={"Content-Range": "bytes 4-9/10"},
+    )
+
+    request_service.download_file(
+        "http://example/file", tmp_path, sha256=hashlib.sha256(data).hexdigest()
+    )
+
+    assert (tmp_path / "file").read_bytes() == data
+
+
+@responses.activate
+def test_download_chunks_skip_existing(tmp_path, request_service):
+    data = b"0123456789"
+    (tmp_path / "file").write_bytes(data)
+
+    downloader = request_service.download_chunks(
+        "http://example/file", tmp_path, sha256=hashlib.sha256(data).hexdigest()
+    )
+
+    assert list(downloader) == [0]
+    assert len(responses.calls) == 0
+
+
+@responses.activate
+def test_download_chunks_skip_existing_server_digest(tmp_path, request_service):
+    data = b"0123456789"
+    (tmp_path / "file").write_bytes(data)
+    digest = base64.b64encode(hashlib.sha256(data).digest()).decode()
+    responses.add(
+        responses.GET,
+        "http://example/file",
+        body=data,
+        headers={"Repr-Digest": f"sha-256=:{digest}:"},
+    )
+
+    downloader = request_service.download_chunks("http://example/file", tmp_path)
+
+    assert list(downloader) == [0]
+    assert not (tmp_path / "file.partial").exists()
+
+
+@responses.activate
+def test_download_chunks_incomplete(tmp_path, request_service, monkeypatch):
+    responses.add(responses.GET, "http://example/file", body=b"01234")
+    monkeypatch.setattr(
+        "craft_application.services.request._get_content_length", lambda _: 10
+    )
+
+    with pytest.raises(errors.DownloadError, match="is incomplete"):
+        request_service.download_file("http://example/file", tmp_path)
+
+    # The partial file is kept so the download can be resumed.
+    assert (tmp_path / "file.partial").read_bytes() == b"01234"
+    assert not (tmp_path / "file").exists()
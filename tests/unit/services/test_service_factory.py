@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from typing import TYPE_CHECKING
 from unittest import mock
 
@@ -90,6 +92,15 @@ def test_register_service_by_reference():
     )
 
 
+def test_register_service_by_path_is_lazy():
+    services.ServiceFactory.register(
+        "testy", "FakeService", module="craft_application_nonexistent"
+    )
+
+    with pytest.raises(ModuleNotFoundError):
+        _ = services.ServiceFactory.TestyClass  # pyright: ignore[reportAttributeAccessIssue]
+
+
 def test_register_service_by_path_no_module():
     with pytest.raises(KeyError, match="Must set module"):
         services.ServiceFactory.register("testy", "FakeService")
@@ -238,6 +249,29 @@ def test_get_registered_service(factory):
     pytest_check.is_(first_result, factory.get("testy"))
 
 
+def test_get_service_from_threads(factory):
+    """Getting a service from several threads at once only creates it once."""
+
+    class SlowService(FakeService):
+        def setup(self) -> None:
+            time.sleep(0.1)
+            super().setup()
+
+    factory.register("slow", SlowService)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(factory.get("slow")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
+
+
 def test_get_unregistered_service(factory):
     with pytest.raises(
         AttributeError, match="Not a registered service: not_registered"
@@ -19,13 +19,14 @@ import os
 import pathlib
 import re
 import sys
+import threading
 from collections.abc import Callable
 from unittest import mock
 
 import craft_providers
 import craft_providers.lxd
 import pytest
-from craft_application import _const, errors
+from craft_application import _const, errors, util
 from craft_application.services import StateService, state
 
 
@@ -191,6 +192,182 @@ def test_set_overwrite_error(state_service_factory, state_dir):
         state_service.set("foo", "bar", value="new-value", overwrite=False)
 
 
+def test_get_returns_copy(state_service, state_dir):
+    """Modifying a returned value doesn't modify the state."""
+    state_service.set("foo", "bar", value=["baz"])
+
+    state_service.get("foo", "bar").append("qux")  # type: ignore[union-attr]
+
+    assert state_service.get("foo", "bar") == ["baz"]
+
+
+def test_get_uses_cache(state_service, state_dir, mocker):
+    """Don't re-parse a state file that hasn't changed."""
+    state_service.set("foo", "bar", value="baz")
+    spy_load = mocker.spy(util, "safe_yaml_load")
+
+    assert state_service.get("foo", "bar") == "baz"
+    assert state_service.get("foo") == {"bar": "baz"}
+
+    spy_load.assert_not_called()
+
+
+def test_get_same_stat_change(state_service, state_dir):
+    """Notice a change that keeps the state file's inode, size and mtime."""
+    state_service.set("foo", "bar", value="baz")
+    state_file = state_dir / "foo.yaml"
+    old_stat = state_file.stat()
+
+    state_file.write_text(state_file.read_text().replace("baz", "qux"))
+    os.utime(state_file, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+
+    assert state_service.get("foo", "bar") == "qux"
+
+
+def test_set_copies_path_only(state_service, state_dir):
+    """Only the dictionaries along the path are copied when setting a value."""
+    state_service.set("foo", "other", "nested", value="value")
+    state_service.set("foo", "bar", "baz", value=1)
+    other = state_service._load_state_file("foo")["foo"]["other"]  # type: ignore[index]
+
+    state_service.set("foo", "bar", "qux", value=2)
+
+    assert state_service._load_state_file("foo")["foo"]["other"] is other  # type: ignore[index]
+    assert state_service.get("foo") == {
+        "other": {"nested": "value"},
+        "bar": {"baz": 1, "qux": 2},
+    }
+
+
+def test_set_concurrent(state_service_factory, state_dir):
+    """Values set by several writers at the same time are all kept."""
+    services = [state_service_factory() for _ in range(4)]
+
+    def _set_values(index: int) -> None:
+        for value in range(10):
+            services[index].set("foo", f"writer{index}", f"key{value}", value=value)
+
+    threads = [
+        threading.Thread(target=_set_values, args=(index,))
+        for index in range(len(services))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state_service_factory().get("foo") == {
+        f"writer{index}": {f"key{value}": value for value in range(10)}
+        for index in range(len(services))
+    }
+
+
+def test_get_external_change(state_service_factory, state_dir):
+    """Re-read a state file that another process changed."""
+    state_service = state_service_factory()
+    other_service = state_service_factory()
+    state_service.set("foo", "bar", value="baz")
+    assert state_service.get("foo", "bar") == "baz"
+
+    other_service.set("foo", "bar", value="new-value", overwrite=True)
+
+    assert state_service.get("foo", "bar") == "new-value"
+
+
+def test_batch(state_service, state_dir, mocker):
+    """Write each state file once at the end of a batch."""
+    spy_save = mocker.spy(state_service, "_save_state_file")
+
+    with state_service.batch():
+        for index in range(10):
+            state_service.set("foo", f"key{index}", value=index)
+            state_service.set("bar", f"key{index}", value=index)
+        with state_service.batch():
+            state_service.set("foo", "nested", value=True)
+        assert state_service.get("foo", "key9") == 9
+        assert not (state_dir / "foo.yaml").exists()
+
+    assert spy_save.call_count == 2
+    assert state_service.get("foo", "nested") is True
+    assert state_service._load_state_file("bar") == {
+        "bar": {f"key{index}": index for index in range(10)}
+    }
+    assert sorted(path.name for path in state_dir.iterdir()) == ["bar.yaml", "foo.yaml"]
+
+
+def test_batch_external_change(state_service_factory, state_dir):
+    """Keep values set by another process while a batch was open."""
+    state_service = state_service_factory()
+    other_service = state_service_factory()
+
+    with state_service.batch():
+        state_service.set("foo", "bar", value="baz")
+        other_service.set("foo", "qux", value="quux")
+
+    assert other_service.get("foo") == {"bar": "baz", "qux": "quux"}
+
+
+def test_batch_external_conflict(state_service_factory, state_dir):
+    """Error if a value set in a batch was set by another process meanwhile."""
+    state_service = state_service_factory()
+    other_service = state_service_factory()
+
+    with pytest.raises(ValueError, match="already exists"):  # noqa: PT012
+        with state_service.batch():
+            state_service.set("foo", "bar", value="baz")
+            other_service.set("foo", "bar", value="qux")
+
+    assert state_service.get("foo") == {"bar": "qux"}
+
+
+def test_batch_write_error(state_service, state_dir, mocker):
+    """Write every state file even if writing one fails."""
+    save = state_service._save_state_file
+
+    def _save_state_file(file_name, data):
+        if file_name == "bar":
+            raise errors.StateServiceError("Can't save bar")
+        save(file_name, data)
+
+    mocker.patch.object(state_service, "_save_state_file", _save_state_file)
+
+    with pytest.raises(errors.StateServiceError, match="Can't save bar"):  # noqa: PT012
+        with state_service.batch():
+            state_service.set("bar", "key", value="value")
+            state_service.set("foo", "key", value="value")
+
+    assert state_service.get("foo") == {"key": "value"}
+    with pytest.raises(KeyError):
+        state_service.get("bar", "key")
+
+
+def test_batch_error(state_service, state_dir):
+    """Discard the values set in a batch if it raises an exception."""
+    state_service.set("foo", "bar", value="baz")
+
+    def _set_values():
+        with state_service.batch():
+            state_service.set("foo", "bar", value="new-value", overwrite=True)
+            state_service.set("foo", "qux", value="quux")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        _set_values()
+
+    assert state_service.get("foo") == {"bar": "baz"}
+
+
+def test_json_format(state_service, state_dir, monkeypatch):
+    """Use JSON for state files."""
+    monkeypatch.setattr(state_service, "file_format", "json")
+
+    state_service.set("foo", "bar", value=["baz", 1, None])
+
+    assert (state_dir / "foo.json").read_text() == '{"foo":{"bar":["baz",1,null]}}'
+    assert not (state_dir / "foo.yaml").exists()
+    assert state_service.get("foo", "bar") == ["baz", 1, None]
+
+
 ##############################
 # State dir management tests #
 ##############################
@@ -413,6 +590,8 @@ def test_save_state_file(state_service, state_dir, emitter):
     saved_file = state_dir / "foo.yaml"
     assert saved_file.exists()
     assert saved_file.read_text() == "foo: test-value\n"
+    assert saved_file.stat().st_mode & 0o777 == 0o644
+    assert list(state_dir.iterdir()) == [saved_file]
     emitter.assert_debug(f"Writing state to {str(saved_file)!r}.")
 
 
@@ -453,6 +632,7 @@ def test_save_state_file_permission_error(state_service, state_dir, mocker):
 
     with pytest.raises(errors.StateServiceError, match=expected_error):
         state_service._save_state_file("foo", {"foo": "test-value"})
+    assert list(state_dir.iterdir()) == []
 
 
 def test_save_state_file_os_error(state_service, state_dir, mocker):
@@ -467,3 +647,4 @@ def test_save_state_file_os_error(state_service, state_dir, mocker):
 
     with pytest.raises(errors.StateServiceError, match=expected_error):
         state_service._save_state_file("foo", {"foo": "test-value"})
+    assert list(state_dir.iterdir()) == []
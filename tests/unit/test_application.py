@@ -383,6 +383,68 @@ def test_run_managed_specified_platform(app, fake_platform, fake_host_architectu
     )
 
 
+@pytest.fixture
+def parallel_managed(monkeypatch, app):
+    """Run managed instances in parallel, with a mock provider."""
+    monkeypatch.setenv("CRAFT_MAX_PARALLEL_INSTANCES", "4")
+    mock_provider = mock.MagicMock(spec_set=services.ProviderService)
+    app.services._services["provider"] = mock_provider
+    app.services._services["fetch"] = mock.MagicMock(spec_set=services.FetchService)
+    instance = mock_provider.instance.return_value.__enter__.return_value
+    process = instance.execute_popen.return_value
+    process.__enter__.return_value = process
+    process.stdout = ["line 1\n", "line 2\n"]
+    process.returncode = 0
+    return mock_provider
+
+
+def test_run_managed_parallel(mocker, app, parallel_managed):
+    mock_pause = mocker.spy(craft_cli.emit, "pause")
+    mock_progress = mocker.spy(craft_cli.emit, "progress")
+    plan = app.services.get("build_plan").plan()
+    instance = parallel_managed.instance.return_value.__enter__.return_value
+
+    app.run_managed(None, None)
+
+    assert parallel_managed.instance.call_count == len(plan) > 1
+    assert instance.execute_popen.call_count == len(plan)
+    instance.execute_run.assert_not_called()
+    mock_pause.assert_not_called()
+    for build_info in plan:
+        mock_progress.assert_any_call(f"[{build_info.platform}] line 1", permanent=True)
+
+
+def test_run_managed_parallel_failures(app, parallel_managed):
+    plan = app.services.get("build_plan").plan()
+    instance = parallel_managed.instance.return_value.__enter__.return_value
+    instance.execute_popen.return_value.returncode = 1
+
+    with pytest.raises(craft_providers.ProviderError) as exc_info:
+        app.run_managed(None, None)
+
+    assert parallel_managed.instance.call_count == len(plan)
+    assert exc_info.value.brief == (
+        f"Failed to execute testcraft in {len(plan)} instances."
+    )
+    assert exc_info.value.details == "Failed platforms: " + ", ".join(
+        info.platform for info in plan
+    )
+
+
+def test_run_managed_parallel_fetch_service(app, parallel_managed):
+    app._enable_fetch_service = True
+    plan = app.services.get("build_plan").plan()
+    instance = parallel_managed.instance.return_value.__enter__.return_value
+    fetch = app.services.get("fetch")
+
+    app.run_managed(None, None)
+
+    assert instance.execute_popen.call_count == len(plan) > 1
+    instance.execute_run.assert_not_called()
+    assert fetch.create_session.call_count == len(plan)
+    assert fetch.teardown_session.call_count == len(plan)
+
+
 def test_run_managed_empty_plan(mocker, app):
     build_plan_service = app.services.get("build_plan")
     mocker.patch.object(build_plan_service, "plan", return_value=[])
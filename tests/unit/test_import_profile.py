@@ -0,0 +1,104 @@
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for import profiling."""
+
+import io
+import sys
+import textwrap
+from unittest import mock
+
+import pytest
+from craft_application import _import_profile
+
+
+@pytest.fixture
+def fake_modules(tmp_path, monkeypatch):
+    (tmp_path / "profiled_outer.py").write_text(
+        textwrap.dedent(
+            """\
+            import time
+
+            import profiled_inner
+
+            time.sleep(0.01)
+            """
+        )
+    )
+    (tmp_path / "profiled_inner.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(tmp_path)
+    yield
+    for name in ("profiled_outer", "profiled_inner"):
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def profiler():
+    profiler = _import_profile.ImportProfiler()
+    profiler.install()
+    yield profiler
+    profiler.uninstall()
+
+
+@pytest.mark.usefixtures("fake_modules")
+def test_profile_imports(profiler):
+    import profiled_outer  # noqa: PLC0415
+
+    profiler.uninstall()
+    records = {record.name: record for record in profiler.records}
+
+    inner = records["profiled_inner"]
+    outer = records["profiled_outer"]
+    assert inner.self_time == inner.cumulative >= 20_000_000
+    assert outer.cumulative >= inner.cumulative + 10_000_000
+    assert outer.self_time == outer.cumulative - inner.cumulative
+    # The real loader is restored on the imported module.
+    assert not isinstance(profiled_outer.__loader__, _import_profile._Loader)
+    assert profiler not in sys.meta_path
+
+
+@pytest.mark.usefixtures("fake_modules")
+def test_report(profiler):
+    import profiled_outer  # noqa: F401, PLC0415
+
+    profiler.uninstall()
+    output = io.StringIO()
+    profiler.report(output, limit=1)
+
+    lines = output.getvalue().splitlines()
+    assert lines[0].startswith("Imported 2 modules in ")
+    assert lines[1] == "cumulative (ms) | self (ms) | module"
+    assert len(lines) == 3
+    assert lines[2].endswith("| profiled_outer")
+
+
+@pytest.mark.parametrize("value", ["", "0", "no", "false"])
+def test_install_from_environment_disabled(monkeypatch, value):
+    monkeypatch.setenv("CRAFT_IMPORT_PROFILE", value)
+
+    assert _import_profile.install_from_environment() is None
+
+
+@pytest.mark.parametrize("value", ["1", "yes", "True"])
+def test_install_from_environment_enabled(monkeypatch, value):
+    monkeypatch.setenv("CRAFT_IMPORT_PROFILE", value)
+    mock_register = mock.Mock()
+    monkeypatch.setattr("atexit.register", mock_register)
+
+    profiler = _import_profile.install_from_environment()
+    try:
+        assert profiler in sys.meta_path
+        mock_register.assert_called_once_with(_import_profile._report_at_exit, profiler)
+    finally:
+        assert profiler is not None
+        profiler.uninstall()
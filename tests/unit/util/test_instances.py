@@ -0,0 +1,133 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for running builds in several managed instances."""
+
+import pathlib
+import subprocess
+import threading
+from unittest import mock
+
+import craft_platforms
+import craft_providers
+import pytest
+from craft_application import util
+from craft_providers.lxd import LXDInstance
+
+
+def _build_info(platform: str) -> craft_platforms.BuildInfo:
+    return craft_platforms.BuildInfo(
+        platform=platform,
+        build_on=craft_platforms.DebianArchitecture.AMD64,
+        build_for=craft_platforms.DebianArchitecture.AMD64,
+        build_base=craft_platforms.DistroBase("ubuntu", "24.04"),
+    )
+
+
+PLAN = [_build_info("one"), _build_info("two"), _build_info("three")]
+
+
+@pytest.mark.parametrize("max_parallel", [None, 0, 1])
+def test_run_build_plan_serial(max_parallel):
+    run = mock.Mock()
+
+    util.run_build_plan(PLAN, run, max_parallel=max_parallel, app_name="testcraft")
+
+    assert run.mock_calls == [mock.call(info) for info in PLAN]
+
+
+def test_run_build_plan_serial_failure():
+    run = mock.Mock(side_effect=[None, ValueError("oops"), None])
+
+    with pytest.raises(ValueError, match="oops"):
+        util.run_build_plan(PLAN, run, max_parallel=1, app_name="testcraft")
+
+    assert run.call_count == 2
+
+
+def test_run_build_plan_single_build():
+    run = mock.Mock()
+
+    util.run_build_plan(PLAN[:1], run, max_parallel=4, app_name="testcraft")
+
+    run.assert_called_once_with(PLAN[0])
+
+
+def test_run_build_plan_parallel():
+    barrier = threading.Barrier(len(PLAN), timeout=5)
+    prefixes = []
+
+    def run(build_info, *, output_prefix):
+        barrier.wait()  # Fails unless every build runs at once.
+        prefixes.append((build_info.platform, output_prefix))
+
+    util.run_build_plan(PLAN, run, max_parallel=4, app_name="testcraft")
+
+    assert sorted(prefixes) == sorted((info.platform, info.platform) for info in PLAN)
+
+
+def test_run_build_plan_parallel_single_failure():
+    def run(build_info, **_):
+        if build_info.platform == "two":
+            raise ValueError("oops")
+
+    with pytest.raises(ValueError, match="oops"):
+        util.run_build_plan(PLAN, run, max_parallel=2, app_name="testcraft")
+
+
+def test_run_build_plan_parallel_failures():
+    run = mock.Mock(side_effect=ValueError("oops"))
+
+    with pytest.raises(craft_providers.ProviderError) as exc_info:
+        util.run_build_plan(PLAN, run, max_parallel=2, app_name="testcraft")
+
+    assert run.call_count == len(PLAN)
+    assert exc_info.value.brief == "Failed to execute testcraft in 3 instances."
+    assert exc_info.value.details == "Failed platforms: one, two, three"
+
+
+@pytest.fixture
+def instance():
+    """An instance that runs commands on the host."""
+    mock_instance = mock.MagicMock(spec_set=LXDInstance)
+    mock_instance.execute_popen.side_effect = subprocess.Popen
+    return mock_instance
+
+
+def test_execute_prefixed(tmp_path, instance, emitter):
+    util.execute_prefixed(
+        instance,
+        ["sh", "-c", 'echo "$GREETING"; pwd; echo error >&2'],
+        prefix="riscv64",
+        cwd=tmp_path,
+        env={"GREETING": "hello"},
+    )
+
+    emitter.assert_progress("[riscv64] hello", permanent=True)
+    emitter.assert_progress(f"[riscv64] {tmp_path}", permanent=True)
+    emitter.assert_progress("[riscv64] error", permanent=True)
+
+
+def test_execute_prefixed_failure(instance):
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        util.execute_prefixed(
+            instance,
+            ["sh", "-c", "exit 3"],
+            prefix="riscv64",
+            cwd=pathlib.Path.cwd(),
+            env={},
+        )
+
+    assert exc_info.value.returncode == 3
@@ -0,0 +1,118 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for batched instance provisioning."""
+
+import subprocess
+from unittest import mock
+
+import pytest
+from craft_application import errors
+from craft_application.util import provisioning
+from craft_providers.lxd import LXDInstance
+
+
+@pytest.fixture
+def instance():
+    """An instance that runs commands on the host."""
+    mock_instance = mock.MagicMock(spec_set=LXDInstance)
+    mock_instance.execute_run.side_effect = subprocess.run
+    return mock_instance
+
+
+@pytest.fixture
+def script():
+    return provisioning.ProvisioningScript()
+
+
+def test_run_single_command(tmp_path, instance, script, emitter):
+    step = script.add_step("Write files")
+    step.push_file(tmp_path / "dir" / "file", b"\x00binary\ncontents\xff", "0600")
+    step.push_file(tmp_path / "quoted 'file'", b"")
+    step.run(["touch", str(tmp_path / "touched")])
+
+    results = script.run(instance)
+
+    assert instance.execute_run.call_count == 1
+    assert (tmp_path / "dir" / "file").read_bytes() == b"\x00binary\ncontents\xff"
+    assert (tmp_path / "dir" / "file").stat().st_mode & 0o777 == 0o600
+    assert (tmp_path / "quoted 'file'").read_bytes() == b""
+    assert (tmp_path / "touched").exists()
+    assert len(results) == 1
+    assert results[0].name == "Write files"
+    assert results[0].status == "ok"
+    assert results[0].returncode == 0
+    assert results[0].duration is not None
+    emitter.assert_debug(mock.ANY)
+
+
+def test_run_condition(tmp_path, instance, script):
+    script.add_step("Skipped", condition=["test", "-d", str(tmp_path / "nope")]).run(
+        ["touch", str(tmp_path / "skipped")]
+    )
+    script.add_step("Run", condition=["test", "-d", str(tmp_path)]).run(
+        ["touch", str(tmp_path / "run")]
+    )
+
+    results = script.run(instance)
+
+    assert [result.status for result in results] == ["skipped", "ok"]
+    assert results[0].returncode is None
+    assert not (tmp_path / "skipped").exists()
+    assert (tmp_path / "run").exists()
+
+
+def test_run_failure(tmp_path, instance, script):
+    step = script.add_step("Fail")
+    step.run(["sh", "-c", "echo some output; echo some error >&2; exit 3"])
+    step.run(["touch", str(tmp_path / "after-failure")])
+    script.add_step("Never run").run(["touch", str(tmp_path / "never")])
+
+    with pytest.raises(errors.ProvisioningError) as exc_info:
+        script.run(instance)
+
+    assert str(exc_info.value) == "Failed to provision instance: Fail (exit code 3)"
+    assert exc_info.value.details == "some output\nsome error"
+    assert not (tmp_path / "after-failure").exists()
+    assert not (tmp_path / "never").exists()
+
+
+def test_run_unchecked_failure(tmp_path, instance, script):
+    script.add_step("Fail", check=False).run(["false"])
+    script.add_step("Run").run(["touch", str(tmp_path / "run")])
+
+    results = script.run(instance)
+
+    assert [result.status for result in results] == ["failed", "ok"]
+    assert results[0].returncode == 1
+    assert (tmp_path / "run").exists()
+
+
+def test_run_script_failure(instance, script):
+    script.add_step("Step").run(["true"])
+    instance.execute_run.side_effect = None
+    instance.execute_run.return_value = subprocess.CompletedProcess(
+        [], returncode=126, stdout="", stderr="cannot execute"
+    )
+
+    with pytest.raises(errors.ProvisioningError) as exc_info:
+        script.run(instance)
+
+    assert exc_info.value.details == "cannot execute"
+
+
+def test_run_empty(instance, script):
+    assert script.run(instance) == []
+    instance.execute_run.assert_not_called()
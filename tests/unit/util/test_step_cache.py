@@ -0,0 +1,202 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for the lifecycle step cache."""
+
+import os
+
+import pytest
+from craft_application.util import step_cache
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "tree"
+    (root / "dir").mkdir(parents=True)
+    (root / "dir" / "file").write_text("contents")
+    (root / "link").symlink_to("dir/file")
+    return root
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return step_cache.StepCache(tmp_path / "cache")
+
+
+def test_get_key_canonical():
+    assert step_cache.get_key({"a": 1, "b": [1, 2]}) == step_cache.get_key(
+        {"b": [1, 2], "a": 1}
+    )
+
+
+@pytest.mark.parametrize(
+    "components",
+    [{"a": 2, "b": [1, 2]}, {"a": 1, "b": [2, 1]}, {"a": 1}],
+)
+def test_get_key_differs(components):
+    assert step_cache.get_key(components) != step_cache.get_key({"a": 1, "b": [1, 2]})
+
+
+def test_get_tree_digest_ignores_timestamps(tree, tmp_path):
+    before = step_cache.get_tree_digest(tree)
+    (tree / "dir" / "file").touch()
+
+    assert step_cache.get_tree_digest(tree) == before
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(
+            lambda root: (root / "dir" / "file").write_text("new"), id="content"
+        ),
+        pytest.param(lambda root: (root / "dir" / "file").chmod(0o755), id="mode"),
+        pytest.param(lambda root: (root / "dir" / "new").touch(), id="new-file"),
+        pytest.param(lambda root: (root / "new-dir").mkdir(), id="new-dir"),
+        pytest.param(
+            lambda root: (root / "dir" / "file").rename(root / "dir" / "moved"),
+            id="rename",
+        ),
+        pytest.param(
+            lambda root: [(root / "link").unlink(), (root / "link").symlink_to("dir")],
+            id="symlink-target",
+        ),
+    ],
+)
+def test_get_tree_digest_changes(tree, change):
+    before = step_cache.get_tree_digest(tree)
+
+    change(tree)
+
+    assert step_cache.get_tree_digest(tree) != before
+
+
+def test_restore_missing(cache, tmp_path):
+    install_dir = tmp_path / "install"
+
+    assert not cache.restore("abc", install_dir=install_dir, state_file=tmp_path / "s")
+    assert not install_dir.exists()
+
+
+def test_store_and_restore(cache, tree, tmp_path):
+    state_file = tmp_path / "state" / "build"
+    state_file.parent.mkdir()
+    state_file.write_text("state")
+
+    cache.store("abcdef", install_dir=tree, state_file=state_file)
+
+    assert "abcdef" in cache
+    assert list(cache.path.glob("*/.tmp-*")) == []
+
+    install_dir = tmp_path / "restored" / "install"
+    install_dir.mkdir(parents=True)
+    (install_dir / "stale").touch()
+    restored_state = tmp_path / "restored" / "state" / "build"
+
+    assert cache.restore("abcdef", install_dir=install_dir, state_file=restored_state)
+
+    assert not (install_dir / "stale").exists()
+    assert (install_dir / "dir" / "file").read_text() == "contents"
+    assert (install_dir / "link").readlink().as_posix() == "dir/file"
+    assert restored_state.read_text() == "state"
+    assert step_cache.get_tree_digest(install_dir) == step_cache.get_tree_digest(tree)
+
+
+def test_store_existing(cache, tree, tmp_path):
+    state_file = tmp_path / "state"
+    state_file.write_text("state")
+    cache.store("abcdef", install_dir=tree, state_file=state_file)
+    (tree / "dir" / "file").write_text("changed")
+
+    cache.store("abcdef", install_dir=tree, state_file=state_file)
+
+    install_dir = tmp_path / "install"
+    cache.restore("abcdef", install_dir=install_dir, state_file=tmp_path / "new")
+    assert (install_dir / "dir" / "file").read_text() == "contents"
+
+
+def test_store_error_cleans_up(cache, tree, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        cache.store("abcdef", install_dir=tree, state_file=tmp_path / "missing")
+
+    assert "abcdef" not in cache
+    assert list(cache.path.glob("*/.tmp-*")) == []
+
+
+def test_restore_error_cleans_up(cache, tree, tmp_path):
+    state_file = tmp_path / "state"
+    state_file.write_text("state")
+    cache.store("abcdef", install_dir=tree, state_file=state_file)
+    # Simulate the entry being pruned while it's restored.
+    (cache.path / "ab" / "abcdef" / "state").unlink()
+    install_dir = tmp_path / "install"
+    restored_state = tmp_path / "restored" / "state"
+
+    assert not cache.restore(
+        "abcdef", install_dir=install_dir, state_file=restored_state
+    )
+
+    assert not install_dir.exists()
+    assert not restored_state.exists()
+
+
+def _store(cache, key, tmp_path, size, mtime):
+    install_dir = tmp_path / f"install-{key}"
+    install_dir.mkdir()
+    (install_dir / "file").write_bytes(b"x" * size)
+    state_file = tmp_path / f"state-{key}"
+    state_file.write_text("")
+    cache.store(key, install_dir=install_dir, state_file=state_file)
+    os.utime(cache.path / key[:2] / key, (mtime, mtime))
+
+
+def test_prune(cache, tmp_path):
+    _store(cache, "aa1", tmp_path, 100, 3000)
+    _store(cache, "aa2", tmp_path, 100, 1000)
+    _store(cache, "bb1", tmp_path, 100, 2000)
+
+    cache.prune(250)
+
+    assert "aa2" not in cache
+    assert "aa1" in cache
+    assert "bb1" in cache
+    assert list(cache.path.glob("*/.tmp-*")) == []
+
+    cache.prune(0)
+
+    assert list(cache.path.glob("*/*")) == []
+
+
+def test_prune_keeps_used_entries(cache, tmp_path):
+    _store(cache, "aa1", tmp_path, 100, 1000)
+    _store(cache, "aa2", tmp_path, 100, 2000)
+
+    cache.restore("aa1", install_dir=tmp_path / "install", state_file=tmp_path / "s")
+    cache.prune(150)
+
+    assert "aa1" in cache
+    assert "aa2" not in cache
+
+
+def test_prune_ignores_incomplete_entries(cache, tmp_path):
+    _store(cache, "aa1", tmp_path, 100, 1000)
+    (cache.path / "aa" / ".tmp-partial").mkdir()
+    (cache.path / "aa" / "unknown").mkdir()
+
+    cache.prune(0)
+
+    assert "aa1" not in cache
+    assert (cache.path / "aa" / ".tmp-partial").is_dir()
+    assert (cache.path / "aa" / "unknown").is_dir()
@@ -0,0 +1,154 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for timing instrumentation."""
+
+import json
+import sys
+import threading
+
+import pytest
+from craft_application.util import Timer, TimingTotal
+
+
+@pytest.fixture
+def timer() -> Timer:
+    timer = Timer()
+    with timer.measure("Pull my-part", "action", part="my-part", step="pull"):
+        pass
+    with timer.measure("Build my-part", "action", part="my-part", step="build"):
+        pass
+    with timer.measure("Build other", "action", part="other", step="build"):
+        pass
+    with timer.measure("Plan build", "plan"):
+        pass
+    return timer
+
+
+def test_measure(check):
+    timer = Timer()
+
+    with timer.measure("Build my-part", "action", part="my-part", step="build"):
+        sum(range(100_000))
+
+    (record,) = timer.records
+    with check:
+        assert record.name == "Build my-part"
+    with check:
+        assert record.category == "action"
+    with check:
+        assert record.part == "my-part"
+    with check:
+        assert record.step == "build"
+    with check:
+        assert record.wall_time > 0
+    with check:
+        assert record.process_cpu_time >= 0
+    with check:
+        assert record.thread == threading.get_ident()
+    if sys.platform != "win32":
+        with check:
+            assert record.process_peak_rss is not None
+        with check:
+            assert record.process_peak_rss > 0
+
+
+def test_measure_error():
+    timer = Timer()
+
+    with pytest.raises(ValueError, match="^oops$"), timer.measure("Plan", "plan"):
+        raise ValueError("oops")
+
+    assert [record.name for record in timer.records] == ["Plan"]
+
+
+def test_measure_threads():
+    timer = Timer()
+
+    def _work(name: str) -> None:
+        with timer.measure(name, "action"):
+            pass
+
+    threads = [threading.Thread(target=_work, args=(str(i),)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(record.name for record in timer.records) == [str(i) for i in range(8)]
+    assert {record.thread for record in timer.records} == {
+        thread.ident for thread in threads
+    }
+
+
+@pytest.mark.parametrize(
+    ("by", "expected"),
+    [
+        ("part", {"my-part": 2, "other": 1}),
+        ("step", {"pull": 1, "build": 2}),
+        ("category", {"action": 3, "plan": 1}),
+    ],
+)
+def test_get_totals(timer: Timer, by, expected):
+    totals = timer.get_totals(by)
+
+    assert {key: total.count for key, total in totals.items()} == expected
+    for key, total in totals.items():
+        records = [record for record in timer.records if getattr(record, by) == key]
+        assert total == TimingTotal(
+            count=len(records),
+            wall_time=sum(record.wall_time for record in records),
+            process_cpu_time=sum(record.process_cpu_time for record in records),
+        )
+
+
+def test_clear(timer: Timer):
+    timer.clear()
+
+    assert timer.records == ()
+
+
+def test_write_json(timer: Timer, tmp_path):
+    path = tmp_path / "timings.json"
+
+    timer.write_json(path)
+
+    report = json.loads(path.read_text())
+    assert [record["name"] for record in report["records"]] == [
+        "Pull my-part",
+        "Build my-part",
+        "Build other",
+        "Plan build",
+    ]
+    assert report["parts"]["my-part"]["count"] == 2
+    assert report["steps"]["build"]["count"] == 2
+
+
+def test_write_chrome_trace(timer: Timer, tmp_path):
+    path = tmp_path / "timings.trace.json"
+
+    timer.write_chrome_trace(path)
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert len(events) == len(timer.records)
+    for event, record in zip(events, timer.records, strict=True):
+        assert event["name"] == record.name
+        assert event["cat"] == record.category
+        assert event["ph"] == "X"
+        assert event["ts"] == round(record.start * 1_000_000)
+        assert event["dur"] == round(record.wall_time * 1_000_000)
+        assert event["tid"] == record.thread
+        assert event["args"]["part"] == record.part
+        assert event["args"]["step"] == record.step
@@ -0,0 +1,142 @@
+# This file is part of craft-application.
+#
+# Copyright 2026 Canonical Ltd.
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License version 3, as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranties of MERCHANTABILITY,
+# SATISFACTORY QUALITY, or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Tests for persistent tree manifests."""
+
+import os
+
+import pytest
+from craft_application.util import tree_manifest
+
+# A modification time well outside the racy window.
+OLD_MTIME_NS = 1_000_000_000 * 10**9
+
+
+def _age(*paths):
+    for path in paths:
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS), follow_symlinks=False)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "prime"
+    (root / "dir").mkdir(parents=True)
+    (root / "dir" / "file").write_text("contents")
+    (root / "other").write_text("other contents")
+    (root / "link").symlink_to("dir/file")
+    _age(root / "dir" / "file", root / "other")
+    return root
+
+
+@pytest.fixture
+def manifest(tree, tmp_path):
+    return tree_manifest.TreeManifest(tree, tmp_path / "state" / "manifest.json")
+
+
+def test_update_entries(manifest):
+    manifest.update()
+
+    assert list(manifest.entries) == ["dir", "link", "other", "dir/file"]
+    assert manifest.entries["dir"].kind == "d"
+    assert manifest.entries["link"].kind == "l"
+    assert manifest.entries["link"].digest == "dir/file"
+    assert manifest.entries["dir/file"].kind == "f"
+    assert manifest.entries["dir/file"].size == len("contents")
+    assert manifest.hashed == 2
+    assert manifest.manifest_file.is_file()
+
+
+def test_update_reuses_digests(tree, manifest):
+    digest = manifest.update()
+
+    new_manifest = tree_manifest.TreeManifest(tree, manifest.manifest_file)
+
+    assert new_manifest.update() == digest
+    assert new_manifest.hashed == 0
+
+
+def test_update_rehashes_modified_files(tree, manifest):
+    digest = manifest.update()
+    (tree / "other").write_text("new contents!")
+    _age(tree / "other")
+
+    assert manifest.update() != digest
+    assert manifest.hashed == 1
+
+
+def test_update_rehashes_racy_files(tree, manifest):
+    (tree / "other").write_text("other contents")
+    digest = manifest.update()
+
+    assert manifest.update() == digest
+    assert manifest.hashed == 1
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pytest.param(lambda tree: (tree / "other").chmod(0o755), id="mode"),
+        pytest.param(lambda tree: (tree / "new").touch(), id="new-file"),
+        pytest.param(lambda tree: (tree / "other").unlink(), id="removed-file"),
+        pytest.param(lambda tree: (tree / "dir" / "new").mkdir(), id="new-dir"),
+        pytest.param(
+            lambda tree: (
+                (tree / "link").unlink(),
+                (tree / "link").symlink_to("other"),
+            ),
+            id="link-target",
+        ),
+    ],
+)
+def test_digest_changes(tree, manifest, change):
+    digest = manifest.update()
+
+    change(tree)
+
+    assert manifest.update() != digest
+
+
+def test_digest_ignores_timestamps(tree, manifest):
+    digest = manifest.update()
+
+    os.utime(tree / "other", ns=(OLD_MTIME_NS * 2, OLD_MTIME_NS * 2))
+
+    assert manifest.update() == digest
+    assert manifest.hashed == 1
+
+
+def test_digest_matches_copies(tree, tmp_path, manifest):
+    copy = tmp_path / "copy"
+    copy.mkdir()
+    for path in ["dir/file", "other"]:
+        (copy / path).parent.mkdir(exist_ok=True)
+        (copy / path).write_bytes((tree / path).read_bytes())
+    (copy / "link").symlink_to("dir/file")
+
+    copy_manifest = tree_manifest.TreeManifest(copy, tmp_path / "copy.json")
+
+    assert copy_manifest.update() == manifest.update()
+
+
+@pytest.mark.parametrize(
+    "contents",
+    ["", "not json", "[]", '{"version": 0, "entries": {}}', '{"version": 1}'],
+)
+def test_update_invalid_manifest_file(tree, manifest, contents):
+    digest = manifest.update()
+    manifest.manifest_file.write_text(contents)
+
+    assert manifest.update() == digest
+    assert manifest.hashed == 2
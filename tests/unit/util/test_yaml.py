@@ -130,3 +130,64 @@ def test_dump_yaml_to_stream(data, kwargs, expected):
         yaml.dump_yaml(data, file, **kwargs)
 
         assert file.getvalue() == expected
+
+
+@pytest.mark.parametrize("libyaml", [True, False])
+def test_safe_yaml_loader_merge_keys(monkeypatch, libyaml):
+    monkeypatch.setattr(yaml, "LIBYAML_AVAILABLE", libyaml and yaml.LIBYAML_AVAILABLE)
+    yaml_text = (
+        "base: &base\n  plugin: nil\n  source: .\npart:\n  <<: *base\n  source: src\n"
+    )
+
+    assert yaml.safe_yaml_load(yaml_text) == {
+        "base": {"plugin": "nil", "source": "."},
+        "part": {"plugin": "nil", "source": "src"},
+    }
+
+
+@pytest.mark.parametrize("libyaml", [True, False])
+def test_safe_yaml_loader_duplicate_key_details(monkeypatch, libyaml):
+    monkeypatch.setattr(yaml, "LIBYAML_AVAILABLE", libyaml and yaml.LIBYAML_AVAILABLE)
+    f = io.StringIO("thing: \nthing:\n")
+    f.name = "/path/to/testcraft.yaml"
+
+    with pytest.raises(errors.YamlError) as exc_info:
+        yaml.safe_yaml_load(f)
+
+    assert exc_info.value.details == (
+        "while constructing a mapping\n"
+        "found duplicate key 'thing'\n"
+        '  in "/path/to/testcraft.yaml", line 1, column 1:\n'
+        "    thing: \n"
+        "    ^"
+    )
+
+
+@pytest.mark.skipif(not yaml.LIBYAML_AVAILABLE, reason="libyaml not available")
+def test_safe_yaml_loader_falls_back_on_libyaml_error(mocker):
+    spy = mocker.spy(yaml, "_load")
+
+    assert yaml.safe_yaml_load("thing: 1") == {"thing": 1}
+    assert spy.call_count == 1
+
+    with pytest.raises(errors.YamlError):
+        yaml.safe_yaml_load("thing: \nthing:\n")
+    assert [call.args[1] for call in spy.call_args_list[1:]] == [
+        yaml._CSafeYamlLoader,
+        yaml._SafeYamlLoader,
+    ]
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"thing": "stuff!"}, "thing: stuff!\n"),
+        (
+            {"ordered": "no", "comes_first": False, "long_key": "123\n456\n789"},
+            "ordered: 'no'\ncomes_first: false\nlong_key: |-\n  123\n  456\n  789\n",
+        ),
+        ({"arch": craft_platforms.DebianArchitecture.RISCV64}, "arch: riscv64\n"),
+    ],
+)
+def test_dump_yaml_libyaml(data, expected):
+    assert yaml.dump_yaml(data, libyaml=True) == expected
@@ -16,7 +16,6 @@
 """Witchcraft package service."""
 
 import pathlib
-import tarfile
 from typing import cast
 
 import craft_application
@@ -49,9 +48,7 @@ class PackageService(package.PackageService):
         project = self._project
         platform = self._build_info.platform
         tarball_name = f"{project.name}-{project.version}-{platform}.witchcraft"
-        with tarfile.open(dest / tarball_name, mode="w:xz") as tar:
-            tar.add(prime_dir, arcname=".")
-        return [dest / tarball_name]
+        return [package.ArchiveWriter().write(prime_dir, dest / tarball_name)]
 
     def _process_components(
         self,